@@ -1,102 +1,25 @@
 import time
-import sys
-sys.setrecursionlimit(2_000_000)  # necesario para permitir profundidad alta si tu Python lo requiere
 
-
-class Node:
-    def __init__(self, value):
-        self.value = value
-        self.left = None
-        self.right = None
-        self.height = 1
+from avl_core import avl_from_sorted, avl_insert, avl_search
 
 
 class AVLTree:
-    def get_height(self, node):
-        return node.height if node else 0
-
-    def get_balance(self, node):
-        return self.get_height(node.left) - self.get_height(node.right) if node else 0
-
-    def right_rotate(self, y):
-        x = y.left
-        T2 = x.right
-
-        # rotación
-        x.right = y
-        y.left = T2
-
-        # actualizar alturas
-        y.height = 1 + max(self.get_height(y.left), self.get_height(y.right))
-        x.height = 1 + max(self.get_height(x.left), self.get_height(x.right))
-
-        return x
-
-    def left_rotate(self, x):
-        y = x.right
-        T2 = y.left
-
-        # rotación
-        y.left = x
-        x.right = T2
-
-        # actualizar alturas
-        x.height = 1 + max(self.get_height(x.left), self.get_height(x.right))
-        y.height = 1 + max(self.get_height(y.left), self.get_height(y.right))
-
-        return y
+    """API histórica (raíz explícita) sobre el núcleo iterativo de avl_core."""
 
     def insert(self, root, value):
-        # Inserción BST normal
-        if not root:
-            return Node(value)
-        elif value < root.value:
-            root.left = self.insert(root.left, value)
-        else:
-            root.right = self.insert(root.right, value)
-
-        # actualizar altura
-        root.height = 1 + max(self.get_height(root.left), self.get_height(root.right))
-
-        # verificar balance
-        balance = self.get_balance(root)
-
-        # casos de rotación
-        # Left Left
-        if balance > 1 and value < root.left.value:
-            return self.right_rotate(root)
+        return avl_insert(root, value)
 
-        # Right Right
-        if balance < -1 and value > root.right.value:
-            return self.left_rotate(root)
-
-        # Left Right
-        if balance > 1 and value > root.left.value:
-            root.left = self.left_rotate(root.left)
-            return self.right_rotate(root)
+    def search(self, root, value):
+        return avl_search(root, value)
 
-        # Right Left
-        if balance < -1 and value < root.right.value:
-            root.right = self.right_rotate(root.right)
-            return self.left_rotate(root)
+    @classmethod
+    def from_sorted(cls, iterable):
+        """Carga masiva O(N); devuelve la raíz de un árbol perfectamente balanceado."""
+        return avl_from_sorted(iterable)
 
-        return root
 
-    def search(self, root, value):
-        current = root
-        while current:
-            if value == current.value:
-                return True
-            elif value < current.value:
-                current = current.left
-            else:
-                current = current.right
-        return False
-
-
-def benchmark_avl():
-    N = 1_000_000
-    print("\n=== BENCHMARK AVL (1,000,000 inserciones) ===")
+def benchmark_avl(bulk=True, N=1_000_000, interactive=True):
+    print(f"\n=== BENCHMARK AVL ({N:,} inserciones) ===")
     print("Construyendo AVL y realizando inserciones. Esto tardará varios segundos...")
 
     avl = AVLTree()
@@ -107,10 +30,19 @@ def benchmark_avl():
         root = avl.insert(root, i)
     t1 = time.perf_counter()
 
-    print(f"Tiempo total de inserción de {N:,} elementos: {t1 - t0:.4f} s")
+    insert_time = t1 - t0
+    print(f"Tiempo total de inserción de {N:,} elementos: {insert_time:.4f} s")
+
+    if bulk:
+        t0 = time.perf_counter()
+        AVLTree.from_sorted(range(1, N + 1))
+        t1 = time.perf_counter()
+        bulk_time = t1 - t0
+        print(f"Tiempo de carga masiva (from_sorted) de {N:,} elementos: {bulk_time:.4f} s "
+              f"({insert_time / bulk_time:.1f}x más rápido)")
 
     # Búsquedas del usuario
-    while True:
+    while interactive:
         s = input(f"\nIntroduce el entero a buscar (1..{N}) o 'exit' para salir: ").strip()
         if s.lower() in ("exit", "quit"):
             print("Saliendo del benchmark.")
@@ -0,0 +1,152 @@
+"""
+AVL con buffer de escritura por niveles (estilo LSM) para ingestas en ráfaga.
+
+- insert solo agrega la clave a un memtable pequeño (lista + conjunto).
+- Al llenarse, el memtable se ordena y se congela como un run inmutable.
+- Si hay más de max_runs runs, se fusionan entre sí en uno solo (tiering).
+- Cuando los runs suman merge_fraction del tamaño del árbol, se fusionan con
+  el recorrido en orden del árbol y el árbol se reconstruye balanceado en
+  O(N), sin rotaciones. La fusión usa sorted() sobre los tramos concatenados:
+  timsort detecta que ya vienen ordenados y los mezcla en C, mucho más rápido
+  que heapq.merge. Con merge_fraction = 1 el árbol se reconstruye cada vez que
+  duplica su tamaño, así que cada clave se copia O(1) veces en promedio.
+- search consulta memtable, runs (del más nuevo al más viejo, con bisect) y
+  por último el árbol.
+
+Ejecutar este archivo compara la ingesta contra avl_insert directo.
+"""
+
+import random
+import time
+from bisect import bisect_left
+
+from avl_core import AVLTree, _build_balanced, avl_insert, avl_keys, avl_search, size
+from cargas import Workload, insert_order, replay
+
+
+class BufferedAVLTree:
+    def __init__(self, buffer_size=4096, max_runs=8, merge_fraction=1.0):
+        self.root = None
+        self.buffer_size = buffer_size
+        self.max_runs = max_runs
+        self.merge_fraction = merge_fraction
+        self.memtable = []
+        self.memtable_set = set()
+        self.runs = []          # listas ordenadas, de la más vieja a la más nueva
+        self.run_keys = 0
+        self.merges = 0
+
+    def __len__(self):
+        return size(self.root) + self.run_keys + len(self.memtable)
+
+    def insert(self, key):
+        self.memtable.append(key)
+        self.memtable_set.add(key)
+        if len(self.memtable) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """Congela el memtable como run ordenado y aplica las políticas de fusión."""
+        if not self.memtable:
+            return
+        self.memtable.sort()
+        self.runs.append(self.memtable)
+        self.run_keys += len(self.memtable)
+        self.memtable = []
+        self.memtable_set = set()
+
+        if len(self.runs) > self.max_runs:
+            self.runs = [sorted([k for run in self.runs for k in run])]
+        if self.run_keys >= self.merge_fraction * size(self.root):
+            self.compact()
+
+    def compact(self):
+        """Fusiona todos los runs con el árbol y lo reconstruye balanceado."""
+        if self.memtable:
+            self.memtable.sort()
+            self.runs.append(self.memtable)
+            self.run_keys += len(self.memtable)
+            self.memtable = []
+            self.memtable_set = set()
+        if not self.runs:
+            return
+        keys = list(avl_keys(self.root))
+        for run in self.runs:
+            keys += run
+        self.root = _build_balanced(sorted(keys))
+        self.runs = []
+        self.run_keys = 0
+        self.merges += 1
+
+    def search(self, key):
+        if key in self.memtable_set:
+            return True
+        for run in reversed(self.runs):
+            i = bisect_left(run, key)
+            if i < len(run) and run[i] == key:
+                return True
+        return avl_search(self.root, key)
+
+    def tree(self):
+        """AVLTree con todo el contenido (compacta antes)."""
+        self.compact()
+        tree = AVLTree()
+        tree.root = self.root
+        return tree
+
+
+def benchmark_buffer(sizes=(1_000, 10_000, 100_000, 400_000), buffer_size=4096, Q=20_000, seed=0):
+    print("\n=== INGESTA: avl_insert DIRECTO vs BUFFER DE ESCRITURA ===")
+    rng = random.Random(seed)
+    print(f"{'N':>9} {'directo':>10} {'buffer':>10} {'ingesta x':>10} "
+          f"{'busq directo':>13} {'busq buffer':>12} {'fusiones':>9}")
+
+    for N in sizes:
+        keys = insert_order(N, "random", seed)
+        queries = [rng.randint(1, N) for _ in range(Q)]
+
+        t0 = time.perf_counter()
+        root = None
+        for k in keys:
+            root = avl_insert(root, k)
+        direct = time.perf_counter() - t0
+
+        buffered = BufferedAVLTree(buffer_size=buffer_size)
+        t0 = time.perf_counter()
+        for k in keys:
+            buffered.insert(k)
+        buffered.flush()
+        ingest = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        for q in queries:
+            avl_search(root, q)
+        search_direct = (time.perf_counter() - t0) / Q
+        t0 = time.perf_counter()
+        for q in queries:
+            buffered.search(q)
+        search_buffered = (time.perf_counter() - t0) / Q
+
+        print(f"{N:>9,} {direct:>9.3f}s {ingest:>9.3f}s {direct / ingest:>9.2f}x "
+              f"{search_direct * 1e6:>11.2f}µs {search_buffered * 1e6:>10.2f}µs {buffered.merges:>9}")
+
+    # punto de cruce: a más lecturas, menos compensa pagar la consulta a los runs
+    n, count = 100_000, 200_000
+    print(f"\n--- Mezclas lectura/escritura sobre {n:,} claves precargadas ({count:,} ops) ---")
+    print(f"{'lecturas':>9} {'directo':>10} {'buffer':>10} {'ganancia':>9}")
+    for read in (0.0, 0.5, 0.9, 0.99):
+        ops = Workload(n, read=read, insert=1.0 - read).generate(count, seed)
+        direct_tree = AVLTree.from_sorted(range(1, n + 1))
+        buffered = BufferedAVLTree(buffer_size=buffer_size)
+        buffered.root = AVLTree.from_sorted(range(1, n + 1)).root
+        t0 = time.perf_counter()
+        replay(direct_tree, ops)
+        direct = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        replay(buffered, ops)
+        mixed = time.perf_counter() - t0
+        print(f"{read:>9.0%} {direct:>9.3f}s {mixed:>9.3f}s {direct / mixed:>8.2f}x")
+
+
+if __name__ == "__main__":
+    benchmark_buffer()
@@ -0,0 +1,775 @@
+"""
+Núcleo AVL compartido por los benchmarks.
+
+- Inserción iterativa (sin recursión) con una pila explícita del camino.
+- El retroceso hacia la raíz se detiene en cuanto la altura de un subárbol
+  deja de cambiar o tras la única rotación que necesita una inserción.
+- Las claves duplicadas se insertan a la derecha, igual que en las
+  versiones recursivas originales.
+- avl_from_sorted construye un árbol perfectamente balanceado en O(N)
+  a partir de claves ya ordenadas.
+- avl_insert_persistent inserta copiando el camino (path copying): nunca
+  modifica nodos existentes y devuelve una raíz nueva.
+- avl_delete borra de forma iterativa (retroceso con rotaciones hasta la
+  raíz); avl_delete_persistent es su versión con copia de camino.
+- avl_search_many responde un lote de búsquedas repartiendo el lote
+  ordenado entre los subárboles.
+- Cada nodo guarda el tamaño de su subárbol (size), lo que permite
+  avl_rank, avl_select y avl_count_range en O(log n).
+- avl_range recorre en orden con una pila explícita sembrada en lo;
+  avl_floor, avl_ceiling y avl_successor son descensos iterativos.
+- AVLTree.save/load guardan y recargan una instantánea binaria
+  (instantaneas.py).
+- avl_split / avl_join y, sobre ellos, avl_union, avl_intersection y
+  avl_difference en O(m log(n/m + 1)) (algoritmos basados en join);
+  avl_set_op_parallel reparte rangos independientes en un pool de procesos.
+- La clase de nodo es configurable (node_class): SlottedAVLNode usa
+  __slots__ y ocupa bastante menos memoria por clave (benchmark_memoria.py).
+"""
+
+import os
+from bisect import bisect_left, bisect_right
+
+
+class AVLNode:
+    def __init__(self, key):
+        self.key = key
+        self.left = None
+        self.right = None
+        self.height = 1
+        self.size = 1
+
+
+class SlottedAVLNode:
+    """Mismo nodo sin __dict__ por instancia."""
+    __slots__ = ("key", "left", "right", "height", "size")
+
+    def __init__(self, key):
+        self.key = key
+        self.left = None
+        self.right = None
+        self.height = 1
+        self.size = 1
+
+
+def height(n):
+    return n.height if n else 0
+
+
+def size(n):
+    return n.size if n else 0
+
+
+def update_height(n):
+    n.height = max(height(n.left), height(n.right)) + 1
+
+
+def update(n):
+    """Recalcula altura y tamaño del subárbol a partir de los hijos."""
+    n.height = max(height(n.left), height(n.right)) + 1
+    n.size = size(n.left) + size(n.right) + 1
+
+
+def get_balance(n):
+    return height(n.left) - height(n.right) if n else 0
+
+
+def rotate_left(z):
+    y = z.right
+    T2 = y.left
+    y.left = z
+    z.right = T2
+    update(z)
+    update(y)
+    return y
+
+
+def rotate_right(z):
+    y = z.left
+    T3 = y.right
+    y.right = z
+    z.left = T3
+    update(z)
+    update(y)
+    return y
+
+
+def rebalance(node):
+    """Aplica la rotación LL, RR, LR o RL que corresponda y devuelve la nueva raíz del subárbol."""
+    balance = get_balance(node)
+
+    if balance > 1:
+        # Left Right: primero se endereza el hijo izquierdo
+        if get_balance(node.left) < 0:
+            node.left = rotate_left(node.left)
+        return rotate_right(node)
+
+    if balance < -1:
+        # Right Left: primero se endereza el hijo derecho
+        if get_balance(node.right) > 0:
+            node.right = rotate_right(node.right)
+        return rotate_left(node)
+
+    return node
+
+
+def avl_insert(root, key, node_class=AVLNode):
+    """Inserta key y devuelve la (posiblemente nueva) raíz del árbol."""
+    new_node = node_class(key)
+    if root is None:
+        return new_node
+    return _retrace_insert(root, _insert_leaf(root, new_node))[0]
+
+
+def _insert_leaf(root, new_node):
+    """Descenso BST: engancha new_node como hoja y devuelve el camino desde la raíz."""
+    # todo ancestro gana un descendiente
+    key = new_node.key
+    path = []
+    node = root
+    while node:
+        path.append(node)
+        node.size += 1
+        node = node.left if key < node.key else node.right
+
+    parent = path[-1]
+    if key < parent.key:
+        parent.left = new_node
+    else:
+        parent.right = new_node
+    return path
+
+
+def _retrace_insert(root, path, rebalance=rebalance):
+    """
+    Retroceso tras _insert_leaf: actualiza alturas hasta que dejen de cambiar
+    y rota donde haga falta. Devuelve (raíz, ancestros recorridos).
+    """
+    for i in range(len(path) - 1, -1, -1):
+        node = path[i]
+        old_height = node.height
+        update_height(node)
+
+        balance = height(node.left) - height(node.right)
+        if balance > 1 or balance < -1:
+            subtree = rebalance(node)
+            # Tras una rotación por inserción la altura del subárbol vuelve a
+            # la previa, así que los ancestros no cambian: basta reenganchar.
+            if i == 0:
+                return subtree, len(path)
+            up = path[i - 1]
+            if up.left is node:
+                up.left = subtree
+            else:
+                up.right = subtree
+            return root, len(path) - i
+
+        if node.height == old_height:
+            return root, len(path) - i
+
+    return root, len(path)
+
+
+def avl_delete(root, key):
+    """
+    Borra una aparición de key y devuelve la (posiblemente nueva) raíz; si key
+    no está, devuelve root sin cambios. Iterativo: un nodo con dos hijos toma
+    la clave de su sucesor y se borra el sucesor, que tiene a lo sumo un hijo.
+    El retroceso llega hasta la raíz porque un borrado puede necesitar una
+    rotación en cada nivel (y los tamaños cambian en todo el camino).
+    """
+    path = []
+    node = root
+    while node and node.key != key:
+        path.append(node)
+        node = node.left if key < node.key else node.right
+    if node is None:
+        return root
+
+    if node.left and node.right:
+        path.append(node)
+        succ = node.right
+        while succ.left:
+            path.append(succ)
+            succ = succ.left
+        node.key = succ.key
+        node = succ
+
+    child = node.left or node.right
+    if not path:
+        return child
+    parent = path[-1]
+    if parent.left is node:
+        parent.left = child
+    else:
+        parent.right = child
+
+    for i in range(len(path) - 1, -1, -1):
+        node = path[i]
+        update(node)
+        balance = height(node.left) - height(node.right)
+        if balance > 1 or balance < -1:
+            subtree = rebalance(node)
+            if i == 0:
+                root = subtree
+            elif path[i - 1].left is node:
+                path[i - 1].left = subtree
+            else:
+                path[i - 1].right = subtree
+    return root
+
+
+def _copy_node(n):
+    c = type(n)(n.key)
+    c.left = n.left
+    c.right = n.right
+    c.height = n.height
+    c.size = n.size
+    return c
+
+
+def avl_insert_persistent(root, key, node_class=AVLNode):
+    """
+    Inserción persistente: copia los nodos del camino raíz-hoja y devuelve la
+    raíz de la nueva versión. La versión anterior queda intacta, así que un
+    lector que ya tomó root puede seguir recorriéndola sin locks.
+    """
+    new_node = node_class(key)
+    if root is None:
+        return new_node
+
+    path = []
+    node = root
+    while node:
+        path.append(node)
+        node = node.left if key < node.key else node.right
+
+    # Reconstrucción de abajo hacia arriba; las rotaciones solo tocan
+    # copias porque los nodos desbalanceados están siempre en el camino.
+    child = new_node
+    for i in range(len(path) - 1, -1, -1):
+        copy = _copy_node(path[i])
+        if key < copy.key:
+            copy.left = child
+        else:
+            copy.right = child
+        update(copy)
+        child = rebalance(copy)
+
+    return child
+
+
+def _rebalance_copy(node):
+    """rebalance para nodos recién copiados: copia antes los hijos que va a rotar."""
+    balance = get_balance(node)
+    if balance > 1:
+        node.left = _copy_node(node.left)
+        if get_balance(node.left) < 0:
+            node.left.right = _copy_node(node.left.right)
+    elif balance < -1:
+        node.right = _copy_node(node.right)
+        if get_balance(node.right) > 0:
+            node.right.left = _copy_node(node.right.left)
+    return rebalance(node)
+
+
+def avl_delete_persistent(root, key):
+    """
+    Borrado persistente: copia el camino y devuelve la raíz de la nueva versión
+    (root mismo si key no está). A diferencia de la inserción, la rotación de un
+    borrado toca al hermano del camino, así que también se copia.
+    """
+    if root is None:
+        return None
+    if key < root.key or key > root.key:
+        side = "left" if key < root.key else "right"
+        child = getattr(root, side)
+        new_child = avl_delete_persistent(child, key)
+        if new_child is child:
+            return root
+        copy = _copy_node(root)
+        setattr(copy, side, new_child)
+        update(copy)
+        return _rebalance_copy(copy)
+
+    if root.left is None:
+        return root.right
+    if root.right is None:
+        return root.left
+    succ = root.right
+    while succ.left:
+        succ = succ.left
+    copy = type(root)(succ.key)
+    copy.left = root.left
+    copy.right = avl_delete_persistent(root.right, succ.key)
+    update(copy)
+    return _rebalance_copy(copy)
+
+
+def avl_from_sorted(iterable, node_class=AVLNode):
+    """Construye un AVL perfectamente balanceado (O(N)) y devuelve su raíz."""
+    keys = list(iterable)
+    for i in range(1, len(keys)):
+        if keys[i] < keys[i - 1]:
+            raise ValueError("from_sorted requiere claves en orden no decreciente")
+    return _build_balanced(keys, node_class)
+
+
+def _build_balanced(keys, node_class=AVLNode):
+    """Como avl_from_sorted, pero confía en que keys (lista) ya está ordenada."""
+
+    def build(lo, hi):
+        # la profundidad de esta recursión es log2(N), no N
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        node = node_class(keys[mid])
+        node.left = build(lo, mid)
+        node.right = build(mid + 1, hi)
+        update(node)
+        return node
+
+    return build(0, len(keys))
+
+
+def avl_search(node, key):
+    while node:
+        if key == node.key:
+            return True
+        elif key < node.key:
+            node = node.left
+        else:
+            node = node.right
+    return False
+
+
+def avl_search_many(root, keys):
+    """
+    Busca un lote de claves y devuelve una lista de bool en el orden original.
+
+    El lote se ordena una vez; en cada nodo se parte con bisect en las consultas
+    menores (van al subárbol izquierdo), iguales (encontradas) y mayores (van al
+    derecho). Cada nodo se visita como mucho una vez por lote.
+    """
+    keys = list(keys)
+    n = len(keys)
+    order = sorted(range(n), key=keys.__getitem__)
+    sorted_keys = [keys[i] for i in order]
+    found = [False] * n
+
+    stack = [(root, 0, n)]
+    while stack:
+        node, lo, hi = stack.pop()
+        if node is None or lo >= hi:
+            continue
+        if hi - lo == 1:
+            # una sola consulta en este subárbol: descenso directo
+            found[lo] = avl_search(node, sorted_keys[lo])
+            continue
+        a = bisect_left(sorted_keys, node.key, lo, hi)
+        b = bisect_right(sorted_keys, node.key, a, hi)
+        for j in range(a, b):
+            found[j] = True
+        stack.append((node.left, lo, a))
+        stack.append((node.right, b, hi))
+
+    result = [False] * n
+    for j, i in enumerate(order):
+        result[i] = found[j]
+    return result
+
+
+def avl_rank(node, key):
+    """Cantidad de claves estrictamente menores que key."""
+    rank = 0
+    while node:
+        if node.key < key:
+            rank += size(node.left) + 1
+            node = node.right
+        else:
+            node = node.left
+    return rank
+
+
+def avl_select(node, k):
+    """k-ésima clave más pequeña (k empieza en 0)."""
+    if not 0 <= k < size(node):
+        raise IndexError("select fuera de rango")
+    while node:
+        left = size(node.left)
+        if k < left:
+            node = node.left
+        elif k == left:
+            return node.key
+        else:
+            k -= left + 1
+            node = node.right
+
+
+def avl_count_range(node, lo, hi):
+    """Cantidad de claves en [lo, hi)."""
+    if hi <= lo:
+        return 0
+    return avl_rank(node, hi) - avl_rank(node, lo)
+
+
+def avl_range(node, lo, hi):
+    """Genera en orden las claves en [lo, hi)."""
+    # sembrar la pila con el camino hacia lo: solo los nodos >= lo quedan pendientes
+    stack = []
+    while node:
+        if node.key < lo:
+            node = node.right
+        else:
+            stack.append(node)
+            node = node.left
+
+    while stack:
+        node = stack.pop()
+        if node.key >= hi:
+            return
+        yield node.key
+        node = node.right
+        while node:
+            stack.append(node)
+            node = node.left
+
+
+def avl_keys(node):
+    """Genera todas las claves en orden (recorrido iterativo)."""
+    stack = []
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        yield node.key
+        node = node.right
+
+
+def avl_floor(node, key):
+    """Mayor clave <= key, o None."""
+    best = None
+    while node:
+        if node.key <= key:
+            best = node.key
+            node = node.right
+        else:
+            node = node.left
+    return best
+
+
+def avl_ceiling(node, key):
+    """Menor clave >= key, o None."""
+    best = None
+    while node:
+        if node.key >= key:
+            best = node.key
+            node = node.left
+        else:
+            node = node.right
+    return best
+
+
+def avl_successor(node, key):
+    """Menor clave estrictamente mayor que key, o None."""
+    best = None
+    while node:
+        if node.key > key:
+            best = node.key
+            node = node.left
+        else:
+            node = node.right
+    return best
+
+
+# ============================================================
+# OPERACIONES DE CONJUNTO BASADAS EN JOIN
+# ============================================================
+# Todas tratan los árboles como conjuntos (sin claves repetidas) y reutilizan
+# los nodos de sus argumentos: los árboles de entrada quedan inservibles.
+
+
+def _join_right(tl, m, tr):
+    # tl es más alto que tr: bajar por la espina derecha de tl hasta una altura compatible
+    l, c = tl.left, tl.right
+    if height(c) <= height(tr) + 1:
+        m.left, m.right = c, tr
+        update(m)
+        if height(m) <= height(l) + 1:
+            tl.right = m
+            update(tl)
+            return tl
+        tl.right = rotate_right(m)
+        update(tl)
+        return rotate_left(tl)
+    tl.right = _join_right(c, m, tr)
+    update(tl)
+    if height(tl.right) <= height(l) + 1:
+        return tl
+    return rotate_left(tl)
+
+
+def _join_left(tl, m, tr):
+    # simétrico de _join_right: tr es más alto que tl
+    c, r = tr.left, tr.right
+    if height(c) <= height(tl) + 1:
+        m.left, m.right = tl, c
+        update(m)
+        if height(m) <= height(r) + 1:
+            tr.left = m
+            update(tr)
+            return tr
+        tr.left = rotate_left(m)
+        update(tr)
+        return rotate_right(tr)
+    tr.left = _join_left(tl, m, c)
+    update(tr)
+    if height(tr.left) <= height(r) + 1:
+        return tr
+    return rotate_right(tr)
+
+
+def _join(left, m, right):
+    """Une left < m.key < right usando el nodo m como pivote; O(|h(left) - h(right)|)."""
+    if height(left) > height(right) + 1:
+        return _join_right(left, m, right)
+    if height(right) > height(left) + 1:
+        return _join_left(left, m, right)
+    m.left, m.right = left, right
+    update(m)
+    return m
+
+
+def avl_join(left, key, right, node_class=AVLNode):
+    """Raíz del AVL con las claves de left, key y las de right (left < key < right)."""
+    return _join(left, node_class(key), right)
+
+
+def avl_split(node, key):
+    """
+    Parte el árbol en (claves < key, nodo con key o None, claves > key).
+    O(log n): cada nivel del camino hace un join de costo proporcional a la
+    diferencia de alturas, y esas diferencias suman O(log n).
+    """
+    if node is None:
+        return None, None, None
+    if key == node.key:
+        return node.left, node, node.right
+    if key < node.key:
+        left, found, right = avl_split(node.left, key)
+        return left, found, _join(right, node, node.right)
+    left, found, right = avl_split(node.right, key)
+    return _join(node.left, node, left), found, right
+
+
+def _split_last(node):
+    """Separa el nodo con la clave máxima: (resto, nodo)."""
+    if node.right is None:
+        return node.left, node
+    rest, last = _split_last(node.right)
+    return _join(node.left, node, rest), last
+
+
+def avl_join2(left, right):
+    """Une left < right sin pivote."""
+    if left is None:
+        return right
+    rest, last = _split_last(left)
+    return _join(rest, last, right)
+
+
+def avl_union(t1, t2):
+    if t1 is None:
+        return t2
+    if t2 is None:
+        return t1
+    left, right = t1.left, t1.right
+    l2, _, r2 = avl_split(t2, t1.key)
+    # las dos mitades son independientes (ver avl_set_op_parallel)
+    return _join(avl_union(left, l2), t1, avl_union(right, r2))
+
+
+def avl_intersection(t1, t2):
+    if t1 is None or t2 is None:
+        return None
+    left, right = t1.left, t1.right
+    l2, found, r2 = avl_split(t2, t1.key)
+    l = avl_intersection(left, l2)
+    r = avl_intersection(right, r2)
+    return _join(l, t1, r) if found else avl_join2(l, r)
+
+
+def avl_difference(t1, t2):
+    """Claves de t1 que no están en t2."""
+    if t1 is None or t2 is None:
+        return t1
+    left, right = t2.left, t2.right
+    l1, _, r1 = avl_split(t1, t2.key)
+    return avl_join2(avl_difference(l1, left), avl_difference(r1, right))
+
+
+SET_OPERATIONS = {
+    "union": avl_union,
+    "intersection": avl_intersection,
+    "difference": avl_difference,
+}
+
+
+def avl_set_op_parallel(op, t1, t2, executor, parts=None):
+    """
+    Igual que SET_OPERATIONS[op](t1, t2), pero repartiendo rangos de claves
+    independientes en executor (por ejemplo un ProcessPoolExecutor).
+
+    parts es la cantidad de rangos (por defecto os.cpu_count(); conviene
+    pasar el número de workers del executor). Se eligen parts - 1 pivotes en los cuantiles de t1 (select en O(log n)),
+    se parten ambos árboles por esos pivotes, cada par de trozos se procesa
+    en un worker y los resultados se unen con join junto a los pivotes que
+    correspondan. Los trozos viajan serializados con pickle, así que solo
+    compensa si la operación cuesta más que copiar los árboles entre procesos.
+    """
+    fn = SET_OPERATIONS[op]
+    if parts is None:
+        parts = os.cpu_count() or 2
+    n = size(t1)
+    if parts < 2 or n < parts:
+        return fn(t1, t2)
+
+    pivots = []
+    for i in range(1, parts):
+        key = avl_select(t1, i * n // parts)
+        if not pivots or key != pivots[-1]:
+            pivots.append(key)
+
+    pieces1, pieces2, found1, found2 = [], [], [], []
+    rest1, rest2 = t1, t2
+    for key in pivots:
+        l1, m1, rest1 = avl_split(rest1, key)
+        l2, m2, rest2 = avl_split(rest2, key)
+        pieces1.append(l1)
+        pieces2.append(l2)
+        found1.append(m1)
+        found2.append(m2)
+    pieces1.append(rest1)
+    pieces2.append(rest2)
+
+    results = list(executor.map(fn, pieces1, pieces2))
+
+    root = results[0]
+    for i, key in enumerate(pivots):
+        m1, m2 = found1[i], found2[i]
+        if op == "union":
+            keep = m1 or m2
+        elif op == "intersection":
+            keep = m1 if m2 else None
+        else:
+            keep = None if m2 else m1
+        if keep is not None:
+            root = _join(root, keep, results[i + 1])
+        else:
+            root = avl_join2(root, results[i + 1])
+    return root
+
+
+class AVLTree:
+    """Envoltura con estado (self.root) sobre las funciones del núcleo."""
+
+    node_class = AVLNode
+
+    def __init__(self):
+        self.root = None
+
+    @classmethod
+    def from_sorted(cls, iterable):
+        tree = cls()
+        tree.root = avl_from_sorted(iterable, cls.node_class)
+        return tree
+
+    def save(self, path):
+        """Guarda una instantánea binaria en preorden (ver instantaneas.py)."""
+        from instantaneas import save_avl
+        save_avl(self.root, path)
+
+    @classmethod
+    def load(cls, path):
+        from instantaneas import load_avl
+        return load_avl(path, cls)
+
+    def insert(self, key):
+        self.root = avl_insert(self.root, key, self.node_class)
+
+    def delete(self, key):
+        """Borra una aparición de key; devuelve True si estaba."""
+        before = size(self.root)
+        self.root = avl_delete(self.root, key)
+        return size(self.root) < before
+
+    def search(self, key):
+        return avl_search(self.root, key)
+
+    def search_many(self, keys):
+        return avl_search_many(self.root, keys)
+
+    def __len__(self):
+        return size(self.root)
+
+    def rank(self, key):
+        return avl_rank(self.root, key)
+
+    def select(self, k):
+        return avl_select(self.root, k)
+
+    def count_range(self, lo, hi):
+        return avl_count_range(self.root, lo, hi)
+
+    def range(self, lo, hi):
+        return avl_range(self.root, lo, hi)
+
+    def floor(self, key):
+        return avl_floor(self.root, key)
+
+    def ceiling(self, key):
+        return avl_ceiling(self.root, key)
+
+    def successor(self, key):
+        return avl_successor(self.root, key)
+
+    @classmethod
+    def join(cls, left, key, right):
+        """Nuevo árbol con left, key y right (left < key < right); left y right quedan vacíos."""
+        tree = cls()
+        tree.root = avl_join(left.root, key, right.root, cls.node_class)
+        left.root = right.root = None
+        return tree
+
+    def split(self, key):
+        """Devuelve (árbol < key, key estaba, árbol > key) y deja este árbol vacío."""
+        l, found, r = avl_split(self.root, key)
+        self.root = None
+        left, right = type(self)(), type(self)()
+        left.root, right.root = l, r
+        return left, found is not None, right
+
+    def _set_update(self, op, other, executor, parts):
+        if executor is None:
+            self.root = SET_OPERATIONS[op](self.root, other.root)
+        else:
+            self.root = avl_set_op_parallel(op, self.root, other.root, executor, parts)
+        other.root = None
+
+    def union_update(self, other, executor=None, parts=None):
+        """
+        self |= other en O(m log(n/m + 1)); other queda vacío. Con executor se
+        reparte en parts rangos (por defecto os.cpu_count()).
+        """
+        self._set_update("union", other, executor, parts)
+
+    def intersection_update(self, other, executor=None, parts=None):
+        self._set_update("intersection", other, executor, parts)
+
+    def difference_update(self, other, executor=None, parts=None):
+        self._set_update("difference", other, executor, parts)
+
+
+class SlottedAVLTree(AVLTree):
+    node_class = SlottedAVLNode
@@ -0,0 +1,312 @@
+"""
+Punto de entrada único y no interactivo para los benchmarks.
+
+Ejemplos:
+    python benchmark_cli.py --structure skiplist --structure avl -n 200000
+    python benchmark_cli.py --mode threads --structure lazy-skiplist --workers 1 2 4 8 --format csv
+    python benchmark_cli.py --mode processes --structure avl --workers 4 --output resultados.json
+    python benchmark_cli.py --mode memory --structure avl --structure avl-slots -n 1000000
+
+Modos:
+    sequential : N inserciones y luego --queries búsquedas aleatorias.
+    threads    : --workers hilos sobre una estructura compartida; cada hilo
+                 inserta su bloque de claves y hace --searches-per-insert
+                 búsquedas por inserción (igual que benchmark_concurrente_8_hilos).
+    processes  : misma carga que threads sobre el índice particionado
+                 (indice_particionado.ShardedIndex), un proceso por worker;
+                 cada lote toma el tramo siguiente del bloque de cada worker.
+    memory     : construye la estructura y mide bytes/clave, pico, bloques
+                 y RSS (benchmark_memoria.py); no hay búsquedas.
+
+Cada ejecución produce un registro con tiempos, ops/s, percentiles de
+latencia por operación (p50/p99/p999, medidos con perf_counter_ns alrededor
+de cada insert/search) y datos del entorno, en JSON (por defecto), CSV o texto.
+"""
+
+import argparse
+import csv
+import datetime
+import json
+import os
+import platform
+import random
+import sys
+import threading
+import time
+
+import benchmark_concurrente_8_hilos as concurrente
+from avl_core import AVLTree
+from benchmark_memoria import MEMORY_STRUCTURES, measure_memory
+from cargas import insert_order
+from indice_particionado import ShardedIndex, interleaved_batches
+from latencias import LatencyHistogram
+from lista_bloques import BlockedSortedList
+from skiplist_compacta import CompactSkipList
+from skiplist_core import SkipList
+
+SEQUENTIAL_STRUCTURES = {
+    "skiplist": SkipList,
+    "avl": AVLTree,
+    "compact-skiplist": CompactSkipList,
+    "blocked-list": BlockedSortedList,
+    "tuned-skiplist": SkipList.tuned,
+}
+
+THREADED_STRUCTURES = {
+    "skiplist": concurrente.SkipList,
+    "avl": concurrente.AVLTree,
+    "lazy-skiplist": concurrente.LazySkipList,
+    "persistent-avl": concurrente.PersistentAVLTree,
+    "blocked-list": concurrente.LockedBlockedList,
+}
+
+PROCESS_STRUCTURES = ("skiplist", "avl")
+
+FIELDS = [
+    "structure", "mode", "n", "queries", "workers", "searches_per_insert", "order", "seed",
+    "insert_time", "search_time", "wall_time", "insert_ops_per_sec", "search_ops_per_sec",
+    "insert_latency_total", "search_latency_total",
+    "insert_p50_us", "insert_p99_us", "insert_p999_us",
+    "search_p50_us", "search_p99_us", "search_p999_us",
+    "build_time", "bytes_per_key", "peak_bytes_per_key", "blocks_per_key", "rss_bytes_per_key",
+    "python", "implementation", "platform", "cpu_count", "gil_enabled", "timestamp",
+]
+
+
+def environment():
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "gil_enabled": concurrente.gil_enabled(),
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+    }
+
+
+def run_sequential(factory, keys, queries):
+    structure = factory()
+    insert_hist = LatencyHistogram()
+    search_hist = LatencyHistogram()
+    clock = time.perf_counter_ns
+
+    t0 = time.perf_counter()
+    for k in keys:
+        s = clock()
+        structure.insert(k)
+        insert_hist.record(clock() - s)
+    t1 = time.perf_counter()
+    for q in queries:
+        s = clock()
+        structure.search(q)
+        search_hist.record(clock() - s)
+    t2 = time.perf_counter()
+
+    return insert_hist, search_hist, t1 - t0, t2 - t1, t2 - t0
+
+
+def run_threads(factory, keys, workers, searches_per_insert, seed):
+    structure = factory()
+    n = len(keys)
+    block = (n + workers - 1) // workers
+    totals = []
+
+    def work(part, thread_seed):
+        rng = random.Random(thread_seed)
+        insert_hist = LatencyHistogram()
+        search_hist = LatencyHistogram()
+        clock = time.perf_counter_ns
+        for k in part:
+            s = clock()
+            structure.insert(k)
+            insert_hist.record(clock() - s)
+            for _ in range(searches_per_insert):
+                q = rng.randint(1, n)
+                s = clock()
+                structure.search(q)
+                search_hist.record(clock() - s)
+        totals.append((insert_hist, search_hist))
+
+    threads = [threading.Thread(target=work, args=(keys[i * block:(i + 1) * block], seed + i))
+               for i in range(workers)]
+    t0 = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - t0
+
+    return (LatencyHistogram.merged(t[0] for t in totals),
+            LatencyHistogram.merged(t[1] for t in totals), wall)
+
+
+def run_processes(structure, keys, workers, searches_per_insert, rng, batch=10_000):
+    """
+    Solo se miden lotes completos: no hay latencias por operación individual.
+    Cada worker recibe el mismo bloque de claves que un hilo en run_threads.
+    """
+    n = len(keys)
+    insert_time = 0.0
+    search_time = 0.0
+
+    t0 = time.perf_counter()
+    with ShardedIndex(structure, workers, key_range=(1, n + 1)) as index:
+        for chunk in interleaved_batches(keys, workers, batch):
+            queries = [rng.randint(1, n) for _ in range(len(chunk) * searches_per_insert)]
+            t1 = time.perf_counter()
+            index.insert_many(chunk)
+            t2 = time.perf_counter()
+            index.search_many(queries)
+            t3 = time.perf_counter()
+            insert_time += t2 - t1
+            search_time += t3 - t2
+    wall = time.perf_counter() - t0
+
+    return insert_time, search_time, wall
+
+
+def run_memory(args, structure):
+    record = {"structure": structure, "mode": args.mode, "n": args.n, "workers": 1,
+              "order": args.order, "seed": args.seed}
+    for field, value in measure_memory(structure, args.n, args.order, args.seed).items():
+        record[field] = None if value is None else round(value, 3)
+    record.update(environment())
+    return record
+
+
+def run_one(args, structure, workers):
+    if args.mode == "memory":
+        return run_memory(args, structure)
+
+    rng = random.Random(args.seed)
+    keys = insert_order(args.n, args.order, args.seed)
+
+    # insert_time/search_time: wall time de cada fase. En threads las fases se
+    # intercalan dentro de cada hilo, así que no existen por separado y el
+    # throughput se calcula sobre el wall time total.
+    if args.mode == "sequential":
+        queries = [rng.randint(1, args.n) for _ in range(args.queries)]
+        insert_hist, search_hist, insert_time, search_time, wall = run_sequential(
+            SEQUENTIAL_STRUCTURES[structure], keys, queries)
+        searches = args.queries
+        workers = 1
+    elif args.mode == "threads":
+        insert_hist, search_hist, wall = run_threads(
+            THREADED_STRUCTURES[structure], keys, workers, args.searches_per_insert, args.seed)
+        insert_time = search_time = None
+        searches = args.n * args.searches_per_insert
+    else:
+        insert_time, search_time, wall = run_processes(
+            structure, keys, workers, args.searches_per_insert, rng)
+        searches = args.n * args.searches_per_insert
+        insert_hist = search_hist = None
+
+    insert_elapsed = insert_time if insert_time is not None else wall
+    search_elapsed = search_time if search_time is not None else wall
+
+    record = {
+        "structure": structure,
+        "mode": args.mode,
+        "n": args.n,
+        "queries": searches,
+        "workers": workers,
+        "searches_per_insert": args.searches_per_insert if args.mode != "sequential" else 0,
+        "order": args.order,
+        "seed": args.seed,
+        "insert_time": round(insert_time, 6) if insert_time is not None else None,
+        "search_time": round(search_time, 6) if search_time is not None else None,
+        "wall_time": round(wall, 6),
+        "insert_ops_per_sec": round(args.n / insert_elapsed, 1) if insert_elapsed else None,
+        "search_ops_per_sec": round(searches / search_elapsed, 1) if search_elapsed else None,
+    }
+    # suma de las latencias de todas las operaciones (en threads incluye la espera por locks y el GIL)
+    for prefix, hist in (("insert", insert_hist), ("search", search_hist)):
+        record[f"{prefix}_latency_total"] = round(hist.total_ns / 1e9, 6) if hist is not None else None
+    for prefix, hist in (("insert", insert_hist), ("search", search_hist)):
+        summary = hist.summary() if hist is not None else {}
+        for p in ("p50", "p99", "p999"):
+            value = summary.get(f"{p}_us")
+            record[f"{prefix}_{p}_us"] = round(value, 3) if value is not None else None
+    record.update(environment())
+    return record
+
+
+def write_records(records, fmt, out):
+    if fmt == "json":
+        json.dump(records, out, indent=2, ensure_ascii=False)
+        out.write("\n")
+    elif fmt == "csv":
+        writer = csv.DictWriter(out, fieldnames=FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(records)
+    else:
+        for r in records:
+            if r["mode"] == "memory":
+                rss = "n/d" if r["rss_bytes_per_key"] is None else f"{r['rss_bytes_per_key']:.1f} bytes/clave"
+                out.write(f"{r['structure']:<26} {r['bytes_per_key']:.1f} bytes/clave  "
+                          f"pico={r['peak_bytes_per_key']:.1f}  bloques={r['blocks_per_key']:.2f}  "
+                          f"RSS={rss}  "
+                          f"construcción={r['build_time']:.4f} s\n")
+                continue
+            out.write(f"{r['structure']:<18} {r['mode']:<10} workers={r['workers']:<3} ")
+            for prefix in ("insert", "search"):
+                ops = f"{r[f'{prefix}_ops_per_sec']:,.0f} ops/s"
+                if r[f"{prefix}_time"] is not None:
+                    out.write(f"{prefix}={r[f'{prefix}_time']:.4f} s ({ops})  ")
+                else:
+                    out.write(f"{prefix}={ops}  ")
+            out.write(f"wall={r['wall_time']:.4f} s")
+            if r["search_p99_us"] is not None:
+                out.write(f"  search p50={r['search_p50_us']:.2f} µs p99={r['search_p99_us']:.2f} µs "
+                          f"p999={r['search_p999_us']:.2f} µs")
+            out.write("\n")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Benchmarks de SkipList y AVL sin interacción.")
+    parser.add_argument("--structure", action="append",
+                        help="estructura a medir (repetible); por defecto skiplist y avl")
+    parser.add_argument("--mode", choices=("sequential", "threads", "processes", "memory"),
+                        default="sequential")
+    parser.add_argument("-n", "--keys", dest="n", type=int, default=1_000_000, help="claves a insertar")
+    parser.add_argument("--queries", type=int, default=100_000, help="búsquedas en modo sequential")
+    parser.add_argument("--workers", type=int, nargs="+", default=[8], help="hilos o procesos (lista)")
+    parser.add_argument("--searches-per-insert", type=int, default=10)
+    parser.add_argument("--order", choices=("asc", "desc", "random", "nearly"), default="asc",
+                        help="orden de inserción de las claves")
+    parser.add_argument("--seed", type=int, default=12345)
+    parser.add_argument("--format", choices=("json", "csv", "text"), default="json")
+    parser.add_argument("--output", help="archivo de salida (por defecto stdout)")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    available = {
+        "sequential": SEQUENTIAL_STRUCTURES,
+        "threads": THREADED_STRUCTURES,
+        "processes": PROCESS_STRUCTURES,
+        "memory": MEMORY_STRUCTURES,
+    }[args.mode]
+    structures = args.structure or ["skiplist", "avl"]
+    for name in structures:
+        if name not in available:
+            parser.error(f"estructura {name!r} no disponible en modo {args.mode}: "
+                         f"{', '.join(available)}")
+
+    records = []
+    for name in structures:
+        for workers in (args.workers if args.mode in ("threads", "processes") else [1]):
+            records.append(run_one(args, name, workers))
+
+    if args.output:
+        with open(args.output, "w", newline="", encoding="utf-8") as out:
+            write_records(records, args.format, out)
+    else:
+        write_records(records, args.format, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
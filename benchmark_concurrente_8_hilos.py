@@ -1,91 +1,123 @@
 import threading
 import random
+import sys
 import time
+from collections import deque
+from random import getrandbits
+
+from avl_core import (_build_balanced, avl_delete, avl_delete_persistent, avl_insert,
+                      avl_insert_persistent, avl_keys, avl_search)
+from cache_busquedas import CachedIndex
+from cargas import insert_order, new_histograms, preset, replay
+from filtro_bloom import BloomFilteredIndex
+from latencias import LatencyHistogram
+from lista_bloques import BlockedSortedList
+from skiplist_core import level_for
+
+# claves que se esperan por defecto: run_benchmark inserta 1,000,000
+EXPECTED_SIZE = 1_000_000
 
 # ============================================================
 # AVL TREE
 # ============================================================
-class AVLNode:
-    def __init__(self, key):
-        self.key = key
-        self.left = None
-        self.right = None
-        self.height = 1
-
 class AVLTree:
-    def __init__(self):
+    """
+    AVL con un lock para los escritores; no guarda duplicados (igual que SkipList).
+
+    Con lazy=True, delete solo anota la clave en tombstones (O(1) bajo el
+    lock) y compact() la quita del árbol por lotes tomando el lock una sola
+    vez: con pocas lápidas borra una a una con avl_delete_persistent; si son
+    más de la cuarta parte del árbol lo reconstruye balanceado en O(n). En
+    los dos casos arma un árbol nuevo sin tocar el publicado, porque search
+    no toma el lock, y lo publica con una sola asignación.
+    """
+    def __init__(self, lazy=False):
         self.root = None
         self.lock = threading.Lock()
+        self.lazy = lazy
+        self.tombstones = set()  # claves borradas lógicamente, todavía en el árbol
 
-    def _height(self, node):
-        return node.height if node else 0
-
-    def _update_height(self, node):
-        node.height = 1 + max(self._height(node.left), self._height(node.right))
-
-    def _balance_factor(self, node):
-        return self._height(node.left) - self._height(node.right)
-
-    def _rotate_right(self, y):
-        x = y.left
-        T2 = x.right
-        x.right = y
-        y.left = T2
-        self._update_height(y)
-        self._update_height(x)
-        return x
-
-    def _rotate_left(self, x):
-        y = x.right
-        T2 = y.left
-        y.left = x
-        x.right = T2
-        self._update_height(x)
-        self._update_height(y)
-        return y
-
-    def _insert(self, node, key):
-        if not node:
-            return AVLNode(key)
-
-        if key < node.key:
-            node.left = self._insert(node.left, key)
-        else:
-            node.right = self._insert(node.right, key)
-
-        self._update_height(node)
-        balance = self._balance_factor(node)
-
-        if balance > 1 and key < node.left.key:
-            return self._rotate_right(node)
-
-        if balance < -1 and key > node.right.key:
-            return self._rotate_left(node)
-
-        if balance > 1 and key > node.left.key:
-            node.left = self._rotate_left(node.left)
-            return self._rotate_right(node)
-
-        if balance < -1 and key < node.right.key:
-            node.right = self._rotate_right(node.right)
-            return self._rotate_left(node)
+    def insert(self, key):
+        with self.lock:
+            if key in self.tombstones:
+                self.tombstones.discard(key)  # el nodo sigue en el árbol: se revive
+                return True
+            if avl_search(self.root, key):
+                return False  # No insertar duplicado
+            self.root = avl_insert(self.root, key)
+            return True
+
+    def delete(self, key):
+        with self.lock:
+            if key in self.tombstones or not avl_search(self.root, key):
+                return False
+            if self.lazy:
+                self.tombstones.add(key)
+            else:
+                self.root = avl_delete(self.root, key)
+            return True
 
-        return node
+    def search(self, key):
+        # primero las lápidas y después la raíz: compact() publica la raíz nueva
+        # antes de vaciar tombstones, así nunca se ve una clave ya borrada
+        if key in self.tombstones:
+            return False
+        return avl_search(self.root, key)
+
+    def compact(self):
+        """Quita del árbol las claves con lápida; devuelve cuántas se reclamaron."""
+        with self.lock:
+            dead = self.tombstones
+            reclaimed = len(dead)
+            if reclaimed * 4 > (self.root.size if self.root else 0):
+                root = _build_balanced([k for k in avl_keys(self.root) if k not in dead])
+            else:
+                # copia de caminos: los lectores en el árbol viejo no ven rotaciones
+                root = self.root
+                for key in dead:
+                    root = avl_delete_persistent(root, key)
+            self.root = root
+            self.tombstones = set()
+            return reclaimed
+
+
+class PersistentAVLTree:
+    """
+    AVL persistente: el escritor copia el camino (avl_insert_persistent) y
+    publica la nueva raíz con una sola asignación atómica. Los lectores toman
+    una instantánea de self.root y la recorren sin locks; nunca ven subárboles
+    a medio rotar porque los nodos publicados no se modifican.
+    """
+    def __init__(self):
+        self.root = None
+        self.lock = threading.Lock()  # solo serializa a los escritores
 
     def insert(self, key):
         with self.lock:
-            start = time.time()
-            self.root = self._insert(self.root, key)
-            return time.time() - start
+            if avl_search(self.root, key):
+                return False  # No insertar duplicado
+            self.root = avl_insert_persistent(self.root, key)
+            return True
+
+    def delete(self, key):
+        # el borrado también copia el camino: no hace falta modo perezoso,
+        # los lectores nunca esperan y los nodos viejos se liberan solos
+        with self.lock:
+            root = avl_delete_persistent(self.root, key)
+            if root is self.root:
+                return False
+            self.root = root
+            return True
 
     def search(self, key):
-        node = self.root
-        start = time.time()
-        while node:
-            if key == node.key:
-                return True, time.time() - start
-            node = node.left if key < node.key else node.right
-        return False, time.time() - start
+        return avl_search(self.root, key)  # instantánea
+
+
+class LockedReadAVLTree(AVLTree):
+    """AVL in-place con lectores bajo el mismo lock: la alternativa correcta sin persistencia."""
+    def search(self, key):
+        with self.lock:
+            return super().search(key)
 
 
 # ============================================================
@@ -95,36 +127,45 @@ class SkipListNode:
     def __init__(self, key, level):
         self.key = key
         self.forward = [None] * (level + 1)
+        self.deleted = False  # lápida del modo perezoso
+
+class SlottedSkipListNode:
+    __slots__ = ("key", "forward", "deleted")
+
+    def __init__(self, key, level):
+        self.key = key
+        self.forward = [None] * (level + 1)
+        self.deleted = False
 
 class SkipList:
-    MAX_LEVEL = 16
-    P = 0.5
+    node_class = SkipListNode
 
-    def __init__(self):
-        self.header = SkipListNode(-1, self.MAX_LEVEL)
+    def __init__(self, lazy=False, max_level=None, expected_size=EXPECTED_SIZE):
+        # el nivel máximo se fija al construir (L(N) de skiplist_core.level_for):
+        # crecerlo después cambiaría header.forward mientras leen los hilos
+        self.max_level = max_level if max_level is not None else level_for(expected_size, 0.5)
+        self.header = self.node_class(-1, self.max_level)
         self.level = 0
-        self.insert_lock = threading.Lock()  # Único lock global para inserción
+        self.insert_lock = threading.Lock()  # Único lock global para inserción y borrado
+        # lazy: delete solo marca el nodo y compact() lo desenlaza por lotes
+        self.lazy = lazy
+        self.pending = 0  # nodos marcados todavía enlazados
 
     def random_level(self):
-        lvl = 0
-        while random.random() < self.P and lvl < self.MAX_LEVEL:
-            lvl += 1
-        return lvl
+        # P = 1/2: ceros a la izquierda de max_level bits aleatorios (ver skiplist_core)
+        return self.max_level - getrandbits(self.max_level).bit_length()
 
     def search(self, key):
         node = self.header
-        start = time.time()
         for lvl in reversed(range(self.level + 1)):
             while node.forward[lvl] and node.forward[lvl].key < key:
                 node = node.forward[lvl]
         node = node.forward[0]
-        if node and node.key == key:
-            return True, time.time() - start
-        return False, time.time() - start
+        return node is not None and node.key == key and not node.deleted
 
     def insert(self, key):
         with self.insert_lock:
-            update = [None] * (self.MAX_LEVEL + 1)
+            update = [None] * (self.max_level + 1)
             node = self.header
 
             # 1. Encontrar posición
@@ -136,7 +177,11 @@ class SkipList:
             node = node.forward[0]
 
             if node and node.key == key:
-                return 0.0  # No insertar duplicado
+                if node.deleted:
+                    node.deleted = False  # lápida pendiente: se revive el nodo
+                    self.pending -= 1
+                    return True
+                return False  # No insertar duplicado
 
             # 2. Nivel para el nuevo nodo
             lvl = self.random_level()
@@ -147,67 +192,561 @@ class SkipList:
                 self.level = lvl
 
             # 3. Inserción real
-            new_node = SkipListNode(key, lvl)
-
-            start = time.time()
+            new_node = self.node_class(key, lvl)
             for i in range(lvl + 1):
                 new_node.forward[i] = update[i].forward[i]
                 update[i].forward[i] = new_node
 
-            return time.time() - start
+            return True
+
+    def delete(self, key):
+        with self.insert_lock:
+            update = [None] * (self.max_level + 1)
+            node = self.header
+            for lvl in reversed(range(self.level + 1)):
+                while node.forward[lvl] and node.forward[lvl].key < key:
+                    node = node.forward[lvl]
+                update[lvl] = node
+
+            node = node.forward[0]
+            if node is None or node.key != key or node.deleted:
+                return False
+            if self.lazy:
+                node.deleted = True
+                self.pending += 1
+                return True
+
+            # un lector parado sobre node sigue avanzando por node.forward, que no cambia
+            for lvl in range(len(node.forward)):
+                update[lvl].forward[lvl] = node.forward[lvl]
+            while self.level > 0 and self.header.forward[self.level] is None:
+                self.level -= 1
+            return True
+
+    def compact(self):
+        """Desenlaza en una pasada por nivel todos los nodos marcados; devuelve cuántos."""
+        with self.insert_lock:
+            if not self.pending:
+                return 0
+            for lvl in range(self.level, -1, -1):
+                pred = self.header
+                node = pred.forward[lvl]
+                while node:
+                    if node.deleted:
+                        pred.forward[lvl] = node.forward[lvl]
+                    else:
+                        pred = node
+                    node = node.forward[lvl]
+            while self.level > 0 and self.header.forward[self.level] is None:
+                self.level -= 1
+            reclaimed = self.pending
+            self.pending = 0
+            return reclaimed
+
+
+class SlottedSkipList(SkipList):
+    node_class = SlottedSkipListNode
+
+
+# ============================================================
+# LISTA POR BLOQUES
+# ============================================================
+class LockedBlockedList(BlockedSortedList):
+    # Escritores serializados con un lock; search no toma el lock porque el
+    # índice (maxes, chunks) se publica en una sola tupla.
+    def __init__(self):
+        super().__init__()
+        self.lock = threading.Lock()
+
+    def insert(self, key):
+        with self.lock:
+            super().insert(key)
+
+    def delete(self, key):
+        with self.lock:
+            return super().delete(key)
+
+
+# ============================================================
+# SKIPLIST CONCURRENTE (LAZY, LOCKS POR NODO)
+# ============================================================
+class LazySkipListNode:
+    def __init__(self, key, level):
+        self.key = key
+        self.forward = [None] * (level + 1)
+        self.top_level = level
+        self.lock = threading.Lock()
+        self.marked = False        # borrado lógico
+        self.fully_linked = False  # enlazado en todos sus niveles
+        self.unlinked = False      # ya desenlazado de todos sus niveles
+
+
+class LazySkipList:
+    """
+    Skip list perezosa (Herlihy, Lev, Luchangco y Shavit).
+
+    - insert bloquea solo los predecesores del nuevo nodo y valida de forma
+      optimista que sigan apuntando a los sucesores observados; si no, reintenta.
+      Inserciones en regiones disjuntas no compiten por ningún lock.
+    - search no toma locks: una clave está presente si su nodo está
+      completamente enlazado y no marcado (linealizable).
+    - delete marca el nodo bajo su propio lock (el punto de linealización) y
+      luego lo desenlaza con _unlink bloqueando sus predecesores. Con
+      lazy=True el desenlace se difiere: el nodo marcado va a garbage y
+      compact() los desenlaza por lotes. Un insert que tropieza con un nodo
+      marcado ayuda a desenlazarlo antes de reintentar.
+    """
+    def __init__(self, lazy=False, max_level=None, expected_size=EXPECTED_SIZE):
+        # nivel máximo fijo desde la construcción, como en SkipList
+        self.max_level = max_level if max_level is not None else level_for(expected_size, 0.5)
+        self.header = LazySkipListNode(-1, self.max_level)
+        self.header.fully_linked = True
+        self.lazy = lazy
+        self.garbage = deque()  # nodos marcados pendientes de desenlazar (modo lazy)
+
+    def random_level(self):
+        # P = 1/2: ceros a la izquierda de max_level bits aleatorios (ver skiplist_core)
+        return self.max_level - getrandbits(self.max_level).bit_length()
+
+    def _find(self, key, preds, succs):
+        """Llena preds/succs en todos los niveles; devuelve el nivel más alto donde está key o -1."""
+        found = -1
+        pred = self.header
+        for lvl in range(self.max_level, -1, -1):
+            curr = pred.forward[lvl]
+            while curr is not None and curr.key < key:
+                pred = curr
+                curr = pred.forward[lvl]
+            if found == -1 and curr is not None and curr.key == key:
+                found = lvl
+            preds[lvl] = pred
+            succs[lvl] = curr
+        return found
+
+    def search(self, key):
+        pred = self.header
+        for lvl in range(self.max_level, -1, -1):
+            curr = pred.forward[lvl]
+            while curr is not None and curr.key < key:
+                pred = curr
+                curr = pred.forward[lvl]
+            if curr is not None and curr.key == key:
+                return curr.fully_linked and not curr.marked
+        return False
+
+    def insert(self, key):
+        top = self.random_level()
+        preds = [None] * (self.max_level + 1)
+        succs = [None] * (self.max_level + 1)
+
+        while True:
+            found = self._find(key, preds, succs)
+            if found != -1:
+                node = succs[found]
+                if not node.marked:
+                    # otro hilo la está insertando: esperar a que quede visible
+                    while not node.fully_linked:
+                        time.sleep(0)
+                    return False  # No insertar duplicado
+                self._unlink(node)  # ayudar: la clave vieja sale antes de volver a entrar
+                continue
+
+            locked = []
+            try:
+                valid = True
+                prev = None
+                for lvl in range(top + 1):
+                    pred = preds[lvl]
+                    succ = succs[lvl]
+                    if pred is not prev:
+                        pred.lock.acquire()
+                        locked.append(pred)
+                        prev = pred
+                    # un pred marcado pero aún enlazado sirve (no cambia mientras
+                    # tengamos su lock); solo importa que no esté ya desenlazado
+                    valid = not pred.unlinked and pred.forward[lvl] is succ
+                    if not valid:
+                        break
+                if not valid:
+                    continue  # validación optimista fallida: reintentar
+
+                new_node = LazySkipListNode(key, top)
+                for lvl in range(top + 1):
+                    new_node.forward[lvl] = succs[lvl]
+                for lvl in range(top + 1):
+                    preds[lvl].forward[lvl] = new_node
+                new_node.fully_linked = True
+                return True
+            finally:
+                for node in locked:
+                    node.lock.release()
+
+    def delete(self, key):
+        preds = [None] * (self.max_level + 1)
+        succs = [None] * (self.max_level + 1)
+        found = self._find(key, preds, succs)
+        if found == -1:
+            return False
+        victim = succs[found]
+        # solo se borra un nodo visible (completamente enlazado y no marcado)
+        if not victim.fully_linked or victim.top_level != found:
+            return False
+        with victim.lock:
+            if victim.marked:
+                return False  # otro hilo ganó el borrado
+            victim.marked = True
+        if self.lazy:
+            self.garbage.append(victim)
+        else:
+            self._unlink(victim)
+        return True
+
+    def _unlink(self, victim):
+        """
+        Desenlaza un nodo marcado de todos sus niveles. Toma el lock del nodo y
+        luego el de sus predecesores (claves decrecientes, el mismo orden que
+        insert), así que puede llamarlo cualquier hilo sin riesgo de deadlock.
+        """
+        preds = [None] * (self.max_level + 1)
+        succs = [None] * (self.max_level + 1)
+        with victim.lock:
+            while not victim.unlinked:
+                self._find(victim.key, preds, succs)
+                locked = []
+                try:
+                    valid = True
+                    prev = None
+                    for lvl in range(victim.top_level + 1):
+                        pred = preds[lvl]
+                        if pred is not prev:
+                            pred.lock.acquire()
+                            locked.append(pred)
+                            prev = pred
+                        valid = not pred.unlinked and pred.forward[lvl] is victim
+                        if not valid:
+                            break
+                    if valid:
+                        for lvl in range(victim.top_level, -1, -1):
+                            preds[lvl].forward[lvl] = victim.forward[lvl]
+                        victim.unlinked = True
+                finally:
+                    for node in locked:
+                        node.lock.release()
+
+    def compact(self):
+        """Desenlaza los nodos marcados acumulados en garbage; devuelve cuántos desenlazó esta pasada."""
+        reclaimed = 0
+        garbage = self.garbage
+        while garbage:
+            try:
+                victim = garbage.popleft()
+            except IndexError:
+                break  # otro compactador vació la cola
+            if not victim.unlinked:
+                self._unlink(victim)
+                reclaimed += 1
+        return reclaimed
+
+
+# ============================================================
+# COMPACTACIÓN EN SEGUNDO PLANO
+# ============================================================
+class Compactor(threading.Thread):
+    """Hilo demonio que llama a structure.compact() cada interval segundos."""
+    def __init__(self, structure, interval=0.05):
+        super().__init__(daemon=True)
+        self.structure = structure
+        self.interval = interval
+        self.stop_event = threading.Event()
+        self.passes = 0
+        self.reclaimed = 0
+
+    def run(self):
+        while not self.stop_event.wait(self.interval):
+            self.reclaimed += self.structure.compact()
+            self.passes += 1
+
+    def stop(self):
+        self.stop_event.set()
+        self.join()
+
+
+def physical_size(structure):
+    """Nodos realmente enlazados, incluidos los marcados que aún no se compactaron."""
+    if hasattr(structure, "header"):
+        count = 0
+        node = structure.header.forward[0]
+        while node:
+            count += 1
+            node = node.forward[0]
+        return count
+    if hasattr(structure, "root"):
+        return structure.root.size if structure.root else 0
+    return len(structure)
 
 
 # ============================================================
 # TRABAJO DE LOS HILOS
 # ============================================================
-def worker(structure, values, results):
-    insert_time = 0.0
-    search_time = 0.0
+def worker(structure, values, results, max_key=1_000_000, searches_per_insert=10):
+    # Cada operación se mide con el mismo límite para todas las estructuras:
+    # la llamada completa a insert/search, locks incluidos.
+    insert_hist = LatencyHistogram()
+    search_hist = LatencyHistogram()
+    clock = time.perf_counter_ns
 
     for x in values:
-        insert_time += structure.insert(x)
+        t0 = clock()
+        structure.insert(x)
+        insert_hist.record(clock() - t0)
 
         # Lote de búsquedas aleatorias
-        for _ in range(10):
-            target = random.randint(1, 1_000_000)
-            _, t = structure.search(target)
-            search_time += t
+        for _ in range(searches_per_insert):
+            target = random.randint(1, max_key)
+            t0 = clock()
+            structure.search(target)
+            search_hist.record(clock() - t0)
 
-    results.append((insert_time, search_time))
+    results.append((insert_hist, search_hist))
+
+
+def replay_worker(structure, ops, results):
+    histograms = new_histograms()
+    counts = replay(structure, ops, histograms)
+    results.append((histograms, counts))
 
 
 # ============================================================
 # BENCHMARK GENERAL
 # ============================================================
-def run_benchmark(structure, name):
-    print(f"\nEjecutando {name}...")
+def run_benchmark(structure, name, num_threads=8, N=1_000_000, searches_per_insert=10,
+                  workload=None, order="asc", seed=0, bloom_fp_rate=None,
+                  cache_policy=None, cache_size=10_000):
+    # con bloom_fp_rate la estructura se envuelve en un filtro de Bloom dimensionado para N claves
+    if bloom_fp_rate is not None:
+        ops_per_thread = N // num_threads * (searches_per_insert + 1)
+        capacity = N + (ops_per_thread * num_threads if workload is not None else 0)
+        structure = BloomFilteredIndex(structure, capacity, bloom_fp_rate)
+        name = f"{name} + Bloom ({bloom_fp_rate:.1%})"
+    # con cache_policy ("lru" o "clock") las búsquedas pasan por una caché acotada
+    if cache_policy is not None:
+        structure = CachedIndex(structure, cache_size, cache_policy)
+        name = f"{name} + caché {cache_policy} ({cache_size:,})"
+
+    if workload is not None:
+        total_time = run_workload(structure, name, workload, num_threads, N,
+                                  N // num_threads * (searches_per_insert + 1), order, seed)
+        report_wrappers(structure)
+        return total_time
+
+    print(f"\nEjecutando {name} ({num_threads} hilos, {N:,} claves, orden {order})...")
 
     threads = []
     results = []
 
-    NUM_THREADS = 8
-    BLOCK = 1_000_000 // NUM_THREADS
+    NUM_THREADS = num_threads
+    BLOCK = N // NUM_THREADS
+    # cada hilo inserta un bloque contiguo de la secuencia 1..N en el orden pedido
+    keys = insert_order(BLOCK * NUM_THREADS, order, seed)
 
-    start_global = time.time()
+    start_global = time.perf_counter()
 
     for i in range(NUM_THREADS):
-        start = i * BLOCK + 1
-        end = (i + 1) * BLOCK
-        t = threading.Thread(target=worker, args=(structure, range(start, end+1), results))
+        block = keys[i * BLOCK:(i + 1) * BLOCK]
+        t = threading.Thread(target=worker, args=(structure, block, results, N, searches_per_insert))
         threads.append(t)
         t.start()
 
     for t in threads:
         t.join()
 
-    total_insert = sum(r[0] for r in results)
-    total_search = sum(r[1] for r in results)
-    total_time = time.time() - start_global
+    total_time = time.perf_counter() - start_global
+    insert_hist = LatencyHistogram.merged(r[0] for r in results)
+    search_hist = LatencyHistogram.merged(r[1] for r in results)
+
+    print("\nResultados:")
+    print(f"- Tiempo total concurrente: {total_time:.4f} segundos")
+    print(f"- Tiempo acumulado en inserciones: {insert_hist.total_ns / 1e9:.4f} segundos")
+    print(f"- Tiempo acumulado en búsquedas: {search_hist.total_ns / 1e9:.4f} segundos")
+    print(f"- Latencia inserción: {insert_hist.format()}")
+    print(f"- Latencia búsqueda : {search_hist.format()}")
+    report_wrappers(structure)
+    return total_time
+
+
+def report_wrappers(structure):
+    """Imprime los contadores de la caché y del filtro de Bloom, si la estructura los tiene."""
+    if isinstance(structure, CachedIndex):
+        stats = structure.stats()
+        print(f"- Caché {stats['policy']} ({stats['size']:,}/{stats['capacity']:,}): "
+              f"aciertos={stats['hits']:,}  fallos={stats['misses']:,}  "
+              f"tasa de aciertos={stats['hit_rate']:.1%}  desalojos={stats['evictions']:,}  "
+              f"invalidaciones={stats['invalidations']:,}")
+        structure = structure.structure
+    if not isinstance(structure, BloomFilteredIndex):
+        return
+    stats = structure.stats()
+    print(f"- Filtro de Bloom ({structure.filter.memory_bytes() / 1e6:.2f} MB, "
+          f"{structure.filter.num_hashes} hashes): aciertos={stats['hits']:,}  "
+          f"descartes={stats['misses']:,}  falsos positivos={stats['false_positives']:,} "
+          f"({stats['fp_rate']:.2%} de las ausentes)")
+
+
+def run_workload(structure, name, workload, num_threads=8, N=1_000_000,
+                 ops_per_thread=100_000, order="asc", seed=0):
+    """
+    Carga 1..N en el orden pedido (fuera de la medición) y luego cada hilo
+    reproduce su propio flujo de workload; las claves nuevas de cada hilo son
+    disjuntas.
+    """
+    print(f"\nEjecutando {name} con carga {workload.distribution} "
+          f"({num_threads} hilos, {ops_per_thread:,} ops/hilo, carga inicial {order})...")
+    for key in insert_order(N, order, seed):
+        structure.insert(key)
+
+    streams = [workload.generate(ops_per_thread, seed, stream_id=i, num_streams=num_threads)
+               for i in range(num_threads)]
+    results = []
+    threads = [threading.Thread(target=replay_worker, args=(structure, ops, results))
+               for ops in streams]
+
+    start_global = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    total_time = time.perf_counter() - start_global
 
     print("\nResultados:")
     print(f"- Tiempo total concurrente: {total_time:.4f} segundos")
-    print(f"- Tiempo acumulado en inserciones: {total_insert:.4f} segundos")
-    print(f"- Tiempo acumulado en búsquedas: {total_search:.4f} segundos")
+    skipped = sum(r[1]["skipped"] for r in results)
+    if skipped:
+        print(f"- Operaciones omitidas (no soportadas por {name}): {skipped:,}")
+    for op in results[0][0]:
+        hist = LatencyHistogram.merged(r[0][op] for r in results)
+        if hist.count:
+            print(f"- Latencia {op:<6}: {hist.format()}")
+    return total_time
+
+
+def gil_enabled():
+    # sys._is_gil_enabled solo existe a partir de Python 3.13
+    check = getattr(sys, "_is_gil_enabled", None)
+    return True if check is None else check()
+
+
+def run_thread_sweep(factories, thread_counts=(1, 2, 4, 8), N=100_000):
+    """Ejecuta run_benchmark para cada estructura y número de hilos y resume el wall time."""
+    print(f"\n=== BARRIDO DE HILOS ({N:,} claves, GIL {'activo' if gil_enabled() else 'desactivado'}) ===")
+    table = {}
+    for name, factory in factories:
+        for n in thread_counts:
+            table[(name, n)] = run_benchmark(factory(), name, num_threads=n, N=N)
+
+    print("\nResumen (wall time en segundos):")
+    print(f"{'Estructura':<14}" + "".join(f"{n:>10} h" for n in thread_counts))
+    for name, _ in factories:
+        print(f"{name:<14}" + "".join(f"{table[(name, n)]:>12.3f}" for n in thread_counts))
+
+
+# ============================================================
+# LATENCIA DE LECTURA CON ESCRITORES ACTIVOS
+# ============================================================
+def _read_phase(structure, num_readers, num_writers, max_key, next_key, duration):
+    """Lectores miden cada search con perf_counter_ns; escritores insertan claves nuevas."""
+    stop = threading.Event()
+    histograms = []
+
+    def reader():
+        hist = LatencyHistogram()
+        clock = time.perf_counter_ns
+        while not stop.is_set():
+            target = random.randint(1, max_key)
+            t0 = clock()
+            structure.search(target)
+            hist.record(clock() - t0)
+        histograms.append(hist)
+
+    def writer(start):
+        key = start
+        while not stop.is_set():
+            structure.insert(key)
+            key += num_writers
+
+    threads = [threading.Thread(target=reader) for _ in range(num_readers)]
+    threads += [threading.Thread(target=writer, args=(next_key + i,)) for i in range(num_writers)]
+    for t in threads:
+        t.start()
+    time.sleep(duration)
+    stop.set()
+    for t in threads:
+        t.join()
+
+    return LatencyHistogram.merged(histograms)
+
+
+def run_read_latency_benchmark(N=200_000, num_readers=4, num_writers=2, duration=2.0):
+    """Compara la latencia de search sin y con escritores activos para cada variante de AVL."""
+    print(f"\n=== LATENCIA DE LECTURA ({num_readers} lectores, {num_writers} escritores, {N:,} claves) ===")
+    variants = [
+        ("AVL (lectores sin lock)", AVLTree),
+        ("AVL (lectores con lock)", LockedReadAVLTree),
+        ("AVL persistente", PersistentAVLTree),
+    ]
+    for name, factory in variants:
+        structure = factory()
+        for i in range(1, N + 1):
+            structure.insert(i)
+
+        print(f"\n{name}:")
+        for label, writers in (("sin escritores", 0), ("con escritores", num_writers)):
+            hist = _read_phase(structure, num_readers, writers, N, N + 1, duration)
+            print(f"- {label:<15} {hist.format()}")
+
+
+# ============================================================
+# CHURN: INSERCIONES, BORRADOS Y BÚSQUEDAS MEZCLADOS
+# ============================================================
+def run_churn_benchmark(N=200_000, num_threads=8, ops_per_thread=50_000, interval=0.05):
+    """
+    Preset churn de cargas.py (50 % search, 25 % insert, 25 % delete) sobre
+    cada variante, con borrado inmediato y perezoso. En modo perezoso un
+    Compactor desenlaza los nodos marcados mientras corre la carga; al final
+    se cuentan los nodos físicos antes y después de la última compactación.
+    """
+    print(f"\n=== CHURN ({num_threads} hilos, {ops_per_thread:,} ops/hilo, {N:,} claves iniciales) ===")
+    variants = [
+        ("SkipList", lambda: SkipList(expected_size=N), False),
+        ("SkipList perezosa", lambda: SkipList(lazy=True, expected_size=N), True),
+        ("SkipList perezosa sin compactador", lambda: SkipList(lazy=True, expected_size=N), False),
+        ("AVL", lambda: AVLTree(), False),
+        ("AVL perezoso", lambda: AVLTree(lazy=True), True),
+        ("LazySkipList", lambda: LazySkipList(expected_size=N), False),
+        ("LazySkipList perezosa", lambda: LazySkipList(lazy=True, expected_size=N), True),
+        ("AVL persistente", PersistentAVLTree, False),
+        ("Lista por bloques", LockedBlockedList, False),
+    ]
+    workload = preset("churn", N)
+    for name, factory, background in variants:
+        structure = factory()
+        compactor = Compactor(structure, interval) if background else None
+        if compactor:
+            compactor.start()
+        run_workload(structure, name, workload, num_threads, N, ops_per_thread)
+        if compactor:
+            compactor.stop()
+        before = physical_size(structure)
+        if getattr(structure, "lazy", False):
+            t0 = time.perf_counter()
+            structure.compact()
+            final = time.perf_counter() - t0
+            after = physical_size(structure)
+            extra = (f", compactador: {compactor.passes} pasadas, {compactor.reclaimed:,} reclamados"
+                     if compactor else "")
+            print(f"- Nodos físicos: {before:,} antes de la última compactación, {after:,} después "
+                  f"({final * 1e3:.1f} ms{extra})")
+        else:
+            print(f"- Nodos físicos: {before:,}")
 
 
 # ============================================================
@@ -216,6 +755,17 @@ def run_benchmark(structure, name):
 if __name__ == "__main__":
     run_benchmark(SkipList(), "SkipList")
     run_benchmark(AVLTree(), "AVL")
+    run_benchmark(LazySkipList(), "LazySkipList")
+    run_benchmark(LockedBlockedList(), "Lista por bloques")
+    run_benchmark(SkipList(), "SkipList", bloom_fp_rate=0.01)
+    run_benchmark(AVLTree(), "AVL", bloom_fp_rate=0.01)
+    for policy in ("lru", "clock"):
+        run_benchmark(SkipList(expected_size=200_000), "SkipList", N=200_000, workload=preset("B", 200_000),
+                      cache_policy=policy)
+    run_thread_sweep([("SkipList", SkipList), ("LazySkipList", LazySkipList),
+                      ("Bloques", LockedBlockedList)])
+    run_read_latency_benchmark()
+    run_churn_benchmark()
 
 
 
@@ -0,0 +1,73 @@
+"""
+Benchmark de operaciones masivas sobre el AVL: fusionar un delta de m claves
+en un índice de N claves con inserciones individuales, con union basada en
+join (split/join, O(m log(N/m + 1))), reconstruyendo desde la lista ordenada,
+y con union repartida en un pool de procesos. También mide intersection y
+difference.
+"""
+
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from avl_core import AVLTree, avl_insert, avl_keys
+
+
+def _main_index(N):
+    # claves pares: el delta (aleatorio en el mismo rango) coincide en parte con el índice
+    return AVLTree.from_sorted(range(2, 2 * N + 1, 2))
+
+
+def benchmark_conjuntos(N=1_000_000, deltas=(1_000, 10_000, 100_000, 1_000_000), workers=None, seed=0):
+    workers = workers or os.cpu_count() or 2
+    print(f"\n=== FUSIÓN DE UN DELTA EN UN ÍNDICE AVL ({N:,} claves, pool de {workers} procesos) ===")
+    rng = random.Random(seed)
+    print(f"{'delta':>10} {'inserciones':>12} {'union':>9} {'reconstrucción':>15} {'union (pool)':>13}")
+
+    with ProcessPoolExecutor(workers) as executor:
+        for m in deltas:
+            delta_keys = sorted(set(rng.randint(1, 2 * N) for _ in range(m)))
+
+            # línea base generosa: inserta sin comprobar si la clave ya estaba
+            main = _main_index(N)
+            t0 = time.perf_counter()
+            root = main.root
+            for k in delta_keys:
+                root = avl_insert(root, k)
+            inserts = time.perf_counter() - t0
+
+            main = _main_index(N)
+            delta = AVLTree.from_sorted(delta_keys)
+            t0 = time.perf_counter()
+            main.union_update(delta)
+            union = time.perf_counter() - t0
+            expected = len(main)
+
+            main = _main_index(N)
+            t0 = time.perf_counter()
+            rebuilt = AVLTree.from_sorted(sorted(set(avl_keys(main.root)).union(delta_keys)))
+            rebuild = time.perf_counter() - t0
+            assert len(rebuilt) == expected
+
+            main = _main_index(N)
+            delta = AVLTree.from_sorted(delta_keys)
+            t0 = time.perf_counter()
+            main.union_update(delta, executor, parts=workers)
+            pooled = time.perf_counter() - t0
+            assert len(main) == expected
+
+            print(f"{m:>10,} {inserts:>11.3f}s {union:>8.3f}s {rebuild:>14.3f}s {pooled:>12.3f}s")
+
+    m = deltas[0]
+    delta_keys = sorted(set(rng.randint(1, 2 * N) for _ in range(m)))
+    for op in ("intersection_update", "difference_update"):
+        main = _main_index(N)
+        delta = AVLTree.from_sorted(delta_keys)
+        t0 = time.perf_counter()
+        getattr(main, op)(delta)
+        print(f"{op} con delta de {m:,}: {time.perf_counter() - t0:.4f} s ({len(main):,} claves)")
+
+
+if __name__ == "__main__":
+    benchmark_conjuntos()
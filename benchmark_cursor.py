@@ -0,0 +1,42 @@
+"""
+Benchmark de búsqueda por dedo (SkipListCursor) frente a reiniciar cada
+operación desde la cabecera (SkipList.insert / SkipList.search), con flujos
+de claves secuenciales, casi ordenados y aleatorios.
+"""
+
+import time
+
+from cargas import insert_order
+from skiplist_core import SkipList
+
+
+def _time(fn, keys):
+    t0 = time.perf_counter()
+    for k in keys:
+        fn(k)
+    return time.perf_counter() - t0
+
+
+def benchmark_cursor(N=200_000, seed=0):
+    print(f"\n=== CURSOR (FINGER SEARCH) vs CABECERA ({N:,} claves) ===")
+    print(f"{'flujo':<8} {'operación':<10} {'cabecera':>10} {'cursor':>10} {'mejora':>8}")
+    for order in ("asc", "nearly", "random"):
+        keys = insert_order(N, order, seed)
+
+        plain = SkipList()
+        insert_plain = _time(plain.insert, keys)
+        fingered = SkipList()
+        cursor = fingered.cursor()
+        insert_cursor = _time(cursor.insert, keys)
+
+        # las búsquedas siguen el mismo orden del flujo
+        search_plain = _time(plain.search, keys)
+        search_cursor = _time(cursor.search, keys)
+
+        for op, base, fast in (("insert", insert_plain, insert_cursor),
+                               ("search", search_plain, search_cursor)):
+            print(f"{order:<8} {op:<10} {base:>9.3f}s {fast:>9.3f}s {base / fast:>7.2f}x")
+
+
+if __name__ == "__main__":
+    benchmark_cursor()
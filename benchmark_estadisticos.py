@@ -0,0 +1,90 @@
+"""
+Benchmark de estadísticos de orden: rank, select y count_range en O(log n)
+(AVL con tamaños de subárbol e IndexableSkipList con anchos de enlace)
+frente al recorrido lineal por el nivel 0 / en orden.
+"""
+
+import random
+import time
+
+from avl_core import AVLTree
+from cargas import insert_order
+from skiplist_core import IndexableSkipList
+
+
+def linear_rank_skiplist(sl, key):
+    count = 0
+    node = sl.header.forward[0]
+    while node and node.key < key:
+        count += 1
+        node = node.forward[0]
+    return count
+
+
+def linear_rank_avl(root, key):
+    # recorrido en orden iterativo con pila explícita
+    count = 0
+    stack = []
+    node = root
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        if node.key >= key:
+            break
+        count += 1
+        node = node.right
+    return count
+
+
+def _time_per_op(fn, args_list):
+    t0 = time.perf_counter()
+    for args in args_list:
+        fn(*args)
+    return (time.perf_counter() - t0) / len(args_list)
+
+
+def benchmark_estadisticos(N=200_000, M=5_000, L=20, seed=0):
+    print(f"\n=== ESTADÍSTICOS DE ORDEN ({N:,} claves, inserción aleatoria) ===")
+    keys = insert_order(N, "random", seed)
+    rng = random.Random(seed)
+
+    avl = AVLTree()
+    sl = IndexableSkipList()
+    for k in keys:
+        avl.insert(k)
+        sl.insert(k)
+
+    probes = [(rng.randint(1, N),) for _ in range(M)]
+    positions = [(rng.randrange(N),) for _ in range(M)]
+    ranges = []
+    for _ in range(M):
+        lo = rng.randint(1, N)
+        ranges.append((lo, lo + rng.randint(1, N // 10)))
+    linear_probes = probes[:L]
+
+    rows = [
+        ("AVL", "rank", _time_per_op(avl.rank, probes)),
+        ("AVL", "select", _time_per_op(avl.select, positions)),
+        ("AVL", "count_range", _time_per_op(avl.count_range, ranges)),
+        ("AVL", "rank lineal", _time_per_op(lambda k: linear_rank_avl(avl.root, k), linear_probes)),
+        ("IndexableSkipList", "rank", _time_per_op(sl.rank, probes)),
+        ("IndexableSkipList", "select", _time_per_op(sl.select, positions)),
+        ("IndexableSkipList", "count_range", _time_per_op(sl.count_range, ranges)),
+        ("IndexableSkipList", "rank lineal", _time_per_op(lambda k: linear_rank_skiplist(sl, k),
+                                                          linear_probes)),
+    ]
+
+    print(f"{'Estructura':<18} {'operación':<12} {'µs/op':>12}")
+    for name, op, seconds in rows:
+        print(f"{name:<18} {op:<12} {seconds * 1e6:>12.2f}")
+
+    print("\nPercentiles de las claves (select):")
+    for q in (0.50, 0.90, 0.99, 0.999):
+        k = int(q * (N - 1))
+        print(f"- p{q * 100:g}: AVL={avl.select(k):,}  SkipList={sl.select(k):,}")
+
+
+if __name__ == "__main__":
+    benchmark_estadisticos()
@@ -0,0 +1,124 @@
+"""
+Benchmark de memoria: bytes por clave, pico durante la construcción y
+número de bloques asignados para cada estructura y variante.
+
+- tracemalloc mide los bytes y bloques vivos que deja la estructura y el
+  pico durante la construcción (sin contar la lista de claves, creada antes).
+- RSS: diferencia de memoria residente del proceso antes y después de
+  construir, leída de /proc/self/statm. Sin /proc no se reporta (None).
+- Cada medición corre en un proceso nuevo para que no se mezclen los restos
+  de una estructura con la siguiente, y tracemalloc y RSS se miden en
+  procesos separados porque tracemalloc agrega su propia memoria.
+- Las variantes "-slots" usan nodos con __slots__ (sin __dict__ por nodo).
+"""
+
+import gc
+import multiprocessing
+import os
+import time
+import tracemalloc
+
+import benchmark_concurrente_8_hilos as concurrente
+from avl_core import AVLTree, SlottedAVLTree
+from cargas import insert_order
+from lista_bloques import BlockedSortedList
+from skiplist_compacta import CompactSkipList
+from skiplist_core import IndexableSkipList, SkipList, SlottedSkipList
+
+MEMORY_STRUCTURES = {
+    "skiplist": SkipList,
+    "skiplist-slots": SlottedSkipList,
+    "indexable-skiplist": IndexableSkipList,
+    "tuned-skiplist": SkipList.tuned,
+    "compact-skiplist": CompactSkipList,
+    "avl": AVLTree,
+    "avl-slots": SlottedAVLTree,
+    "blocked-list": BlockedSortedList,
+    "concurrent-skiplist": concurrente.SkipList,
+    "concurrent-skiplist-slots": concurrente.SlottedSkipList,
+    "lazy-skiplist": concurrente.LazySkipList,
+}
+
+
+def current_rss():
+    """Memoria residente actual del proceso en bytes, o None si no hay /proc."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # ru_maxrss es el máximo histórico, no la memoria actual: la diferencia
+        # antes/después no sería comparable, así que no se reporta
+        return None
+
+
+def _build(name, keys):
+    structure = MEMORY_STRUCTURES[name]()
+    for k in keys:
+        structure.insert(k)
+    return structure
+
+
+def _measure_child(conn, name, n, order, seed, traced):
+    keys = insert_order(n, order, seed)
+    gc.collect()
+    if traced:
+        tracemalloc.start()
+        structure = _build(name, keys)
+        current, peak = tracemalloc.get_traced_memory()
+        blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+        tracemalloc.stop()
+        conn.send({"bytes": current, "peak": peak, "blocks": blocks})
+    else:
+        rss0 = current_rss()
+        t0 = time.perf_counter()
+        structure = _build(name, keys)
+        build_time = time.perf_counter() - t0
+        rss1 = current_rss()
+        rss = None if rss0 is None or rss1 is None else rss1 - rss0
+        conn.send({"rss": rss, "build_time": build_time})
+    del structure
+    conn.close()
+
+
+def _in_child(name, n, order, seed, traced):
+    parent, child = multiprocessing.Pipe()
+    proc = multiprocessing.Process(target=_measure_child, args=(child, name, n, order, seed, traced))
+    proc.start()
+    child.close()
+    result = parent.recv()
+    proc.join()
+    return result
+
+
+def measure_memory(name, n, order="asc", seed=0):
+    """
+    Devuelve bytes/clave, pico/clave, bloques/clave, RSS/clave (None sin
+    /proc) y tiempo de construcción.
+    """
+    if name not in MEMORY_STRUCTURES:
+        raise ValueError(f"estructura desconocida: {name!r}")
+    traced = _in_child(name, n, order, seed, True)
+    plain = _in_child(name, n, order, seed, False)
+    return {
+        "build_time": plain["build_time"],
+        "bytes_per_key": traced["bytes"] / n,
+        "peak_bytes_per_key": traced["peak"] / n,
+        "blocks_per_key": traced["blocks"] / n,
+        "rss_bytes_per_key": None if plain["rss"] is None else plain["rss"] / n,
+    }
+
+
+def benchmark_memoria(N=1_000_000, order="asc", seed=0, structures=None):
+    print(f"\n=== MEMORIA POR ESTRUCTURA ({N:,} claves, inserción {order}) ===")
+    print(f"{'Estructura':<26} {'bytes/clave':>12} {'pico/clave':>11} {'bloques/clave':>14} "
+          f"{'RSS/clave':>10} {'total':>10} {'construcción':>13}")
+    for name in structures or MEMORY_STRUCTURES:
+        m = measure_memory(name, N, order, seed)
+        rss = "n/d" if m["rss_bytes_per_key"] is None else f"{m['rss_bytes_per_key']:.1f}"
+        print(f"{name:<26} {m['bytes_per_key']:>12.1f} {m['peak_bytes_per_key']:>11.1f} "
+              f"{m['blocks_per_key']:>14.2f} {rss:>10} "
+              f"{m['bytes_per_key'] * N / 2**20:>7.1f} MB {m['build_time']:>12.3f}s")
+
+
+if __name__ == "__main__":
+    benchmark_memoria()
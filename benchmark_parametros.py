@@ -0,0 +1,97 @@
+"""
+Barrido de parámetros de la Skip List: p en {1/2, 1/e, 1/4, 1/8} con
+max_level = L(N) = log_{1/p} N, más las listas auto-ajustadas
+(SkipList.tuned) con y sin tamaño esperado.
+
+Por cada configuración mide µs por inserción y por búsqueda, altura
+alcanzada, punteros forward por nodo y bytes por clave (tracemalloc, en una
+construcción aparte para que su coste no entre en los tiempos). Al final
+compara random_level (una palabra aleatoria) con el bucle de un random()
+por nivel.
+"""
+
+import gc
+import math
+import random
+import time
+import tracemalloc
+
+from cargas import insert_order
+from skiplist_core import SkipList, level_for
+
+P_VALUES = (("1/2", 0.5), ("1/e", 1 / math.e), ("1/4", 0.25), ("1/8", 0.125))
+
+
+def loop_level(sl):
+    """random_level anterior: un random() por nivel."""
+    lvl = 0
+    while random.random() < sl.p and lvl < sl.max_level:
+        lvl += 1
+    return lvl
+
+
+def pointers_per_node(sl):
+    total = 0
+    node = sl.header.forward[0]
+    while node:
+        total += len(node.forward)
+        node = node.forward[0]
+    return total / max(1, len(sl))
+
+
+def _bytes_per_key(factory, keys):
+    gc.collect()
+    tracemalloc.start()
+    sl = factory()
+    for k in keys:
+        sl.insert(k)
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return current / len(keys)
+
+
+def benchmark_parametros(N=200_000, Q=100_000, draws=1_000_000, seed=0):
+    print(f"\n=== PARÁMETROS DE LA SKIP LIST ({N:,} claves aleatorias, {Q:,} búsquedas) ===")
+    keys = insert_order(N, "random", seed)
+    rng = random.Random(seed)
+    queries = [rng.randint(1, N) for _ in range(Q)]
+
+    configs = [(f"p={label}", lambda p=p: SkipList(level_for(N, p), p)) for label, p in P_VALUES]
+    configs += [("tuned()", SkipList.tuned),
+                (f"tuned({N:,})", lambda: SkipList.tuned(N)),
+                ("tuned(memoria)", lambda: SkipList.tuned(N, prefer="memory"))]
+
+    print(f"{'Configuración':<18} {'p':>6} {'max_level':>9} {'altura':>7} {'insert µs':>10} "
+          f"{'search µs':>10} {'punteros':>9} {'bytes/clave':>12}")
+    for name, factory in configs:
+        sl = factory()
+        t0 = time.perf_counter()
+        for k in keys:
+            sl.insert(k)
+        insert_us = (time.perf_counter() - t0) / N * 1e6
+        t0 = time.perf_counter()
+        for q in queries:
+            sl.search(q)
+        search_us = (time.perf_counter() - t0) / Q * 1e6
+        memory = _bytes_per_key(factory, keys)
+        print(f"{name:<18} {sl.p:>6.3f} {sl.max_level:>9} {sl.level + 1:>7} {insert_us:>10.2f} "
+              f"{search_us:>10.2f} {pointers_per_node(sl):>9.2f} {memory:>12.1f}")
+
+    print(f"\nGeneración de niveles ({draws:,} niveles, max_level = L(N)):")
+    print(f"{'p':<6} {'random_level ns':>16} {'bucle ns':>10}")
+    for label, p in P_VALUES:
+        sl = SkipList(level_for(N, p), p)
+        draw = sl.random_level
+        t0 = time.perf_counter()
+        for _ in range(draws):
+            draw()
+        fast = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        for _ in range(draws):
+            loop_level(sl)
+        loop = time.perf_counter() - t0
+        print(f"{label:<6} {fast / draws * 1e9:>16.0f} {loop / draws * 1e9:>10.0f}")
+
+
+if __name__ == "__main__":
+    benchmark_parametros()
@@ -0,0 +1,75 @@
+"""
+Benchmark de consultas por rango: iteradores range(lo, hi) de SkipList y AVL
+con scans cortos y largos, frente a volcar todas las claves en una lista y
+filtrarla (lo que se hacía antes).
+"""
+
+import random
+import time
+
+from avl_core import AVLTree
+from cargas import insert_order
+from skiplist_core import SkipList
+
+
+def all_keys(sl):
+    keys = []
+    node = sl.header.forward[0]
+    while node:
+        keys.append(node.key)
+        node = node.forward[0]
+    return keys
+
+
+def _scan_rate(fn, ranges):
+    """Devuelve (scans/s, claves/s)."""
+    total = 0
+    t0 = time.perf_counter()
+    for lo, hi in ranges:
+        for _ in fn(lo, hi):
+            total += 1
+    elapsed = time.perf_counter() - t0
+    return len(ranges) / elapsed, total / elapsed
+
+
+def benchmark_rangos(N=200_000, scans=(("corto", 10, 5_000), ("largo", 10_000, 50)), seed=0):
+    print(f"\n=== CONSULTAS POR RANGO ({N:,} claves) ===")
+    rng = random.Random(seed)
+    sl = SkipList()
+    avl = AVLTree()
+    for k in insert_order(N, "random", seed):
+        sl.insert(k)
+        avl.insert(k)
+
+    def list_and_filter(lo, hi):
+        return [k for k in all_keys(sl) if lo <= k < hi]
+
+    print(f"{'Estructura':<18} {'scan':<6} {'longitud':>9} {'scans/s':>12} {'claves/s':>14}")
+    for label, length, count in scans:
+        ranges = []
+        for _ in range(count):
+            lo = rng.randint(1, N - length)
+            ranges.append((lo, lo + length))
+
+        contenders = [("SkipList.range", sl.range), ("AVLTree.range", avl.range),
+                      ("lista + filtro", list_and_filter)]
+        for name, fn in contenders:
+            # el volcado completo es O(N) por scan: pocas repeticiones bastan
+            sample = ranges if name != "lista + filtro" else ranges[:5]
+            per_scan, per_key = _scan_rate(fn, sample)
+            print(f"{name:<18} {label:<6} {length:>9,} {per_scan:>12,.0f} {per_key:>14,.0f}")
+
+    # vecinos puntuales
+    probes = [rng.randint(1, N) for _ in range(20_000)]
+    for name, structure in (("SkipList", sl), ("AVL", avl)):
+        for op in ("floor", "ceiling", "successor"):
+            fn = getattr(structure, op)
+            t0 = time.perf_counter()
+            for p in probes:
+                fn(p)
+            elapsed = time.perf_counter() - t0
+            print(f"{name:<9} {op:<10} {len(probes) / elapsed:>12,.0f} ops/s")
+
+
+if __name__ == "__main__":
+    benchmark_rangos()
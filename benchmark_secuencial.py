@@ -1,150 +1,26 @@
 import random
 import time
 
-# ============================
-#   AVL TREE IMPLEMENTATION
-# ============================
-
-class AVLNode:
-    def __init__(self, key):
-        self.key = key
-        self.left = None
-        self.right = None
-        self.height = 1
-
-def height(n):
-    return n.height if n else 0
-
-def update_height(n):
-    n.height = max(height(n.left), height(n.right)) + 1
-
-def get_balance(n):
-    return height(n.left) - height(n.right) if n else 0
-
-def rotate_left(z):
-    y = z.right
-    T2 = y.left
-    y.left = z
-    z.right = T2
-    update_height(z)
-    update_height(y)
-    return y
-
-def rotate_right(z):
-    y = z.left
-    T3 = y.right
-    y.right = z
-    z.left = T3
-    update_height(z)
-    update_height(y)
-    return y
-
-def avl_insert(node, key):
-    if not node:
-        return AVLNode(key)
-
-    if key < node.key:
-        node.left = avl_insert(node.left, key)
-    else:
-        node.right = avl_insert(node.right, key)
-
-    update_height(node)
-
-    balance = get_balance(node)
-
-    # Left Left Case
-    if balance > 1 and key < node.left.key:
-        return rotate_right(node)
-
-    # Right Right Case
-    if balance < -1 and key > node.right.key:
-        return rotate_left(node)
-
-    # Left Right Case
-    if balance > 1 and key > node.left.key:
-        node.left = rotate_left(node.left)
-        return rotate_right(node)
-
-    # Right Left Case
-    if balance < -1 and key < node.right.key:
-        node.right = rotate_right(node.right)
-        return rotate_left(node)
-
-    return node
-
-def avl_search(node, key):
-    while node:
-        if key == node.key:
-            return True
-        elif key < node.key:
-            node = node.left
-        else:
-            node = node.right
-    return False
-
-
-# ============================
-#      SKIP LIST
-# ============================
-
-class Node:
-    def __init__(self, value, level):
-        self.value = value
-        self.forward = [None] * (level + 1)
-
-class SkipList:
-    def __init__(self, max_level=20, p=0.5):
-        self.max_level = max_level
-        self.p = p
-        self.header = Node(-1, max_level)
-        self.level = 0
-
-    def random_level(self):
-        lvl = 0
-        while random.random() < self.p and lvl < self.max_level:
-            lvl += 1
-        return lvl
-
-    def insert(self, value):
-        update = [None] * (self.max_level + 1)
-        current = self.header
-
-        for i in range(self.level, -1, -1):
-            while current.forward[i] and current.forward[i].value < value:
-                current = current.forward[i]
-            update[i] = current
-
-        new_level = self.random_level()
-
-        if new_level > self.level:
-            for i in range(self.level + 1, new_level + 1):
-                update[i] = self.header
-            self.level = new_level
-
-        new_node = Node(value, new_level)
-        for i in range(new_level + 1):
-            new_node.forward[i] = update[i].forward[i]
-            update[i].forward[i] = new_node
-
-    def search(self, value):
-        current = self.header
-        for i in range(self.level, -1, -1):
-            while current.forward[i] and current.forward[i].value < value:
-                current = current.forward[i]
-        current = current.forward[0]
-        return (current is not None and current.value == value)
-
+from avl_core import AVLTree, avl_from_sorted, avl_insert, avl_search, avl_search_many
+from cargas import insert_order, new_histograms, replay
+from instrumentacion import InstrumentedAVLTree, InstrumentedSkipList, print_counters
+from lista_bloques import BlockedSortedList
+from skiplist_core import SkipList
 
 # ============================
 #    BENCHMARK SECUENCIAL
 # ============================
 
-def benchmark_secuencial():
-
-    N = 1_000_000
-    Q = 100_000  # búsquedas aleatorias
+def benchmark_secuencial(bulk=True, N=1_000_000, Q=100_000, order="asc", workload=None, seed=0,
+                         instrument=False):
+    # Q: búsquedas aleatorias (o número de operaciones de workload)
+    # order: orden de inserción de 1..N (asc, desc, random, nearly)
+    # workload: cargas.Workload opcional; su flujo se reproduce en ambas estructuras
+    # instrument: repite inserciones y búsquedas con las clases instrumentadas
+    #             (aparte, sin afectar los tiempos) e imprime los contadores
 
-    print("\n=== BENCHMARK SECUENCIAL: SKIP LIST vs AVL ===")
+    print(f"\n=== BENCHMARK SECUENCIAL: SKIP LIST vs AVL vs LISTA POR BLOQUES (inserción {order}) ===")
+    keys = insert_order(N, order, seed)
 
     # ------------------------
     #       SKIP LIST
@@ -153,13 +29,20 @@ def benchmark_secuencial():
     sl = SkipList()
 
     t0 = time.perf_counter()
-    for i in range(1, N + 1):
+    for i in keys:
         sl.insert(i)
     t1 = time.perf_counter()
 
     sl_insert_time = t1 - t0
     print(f"Tiempo inserción SkipList: {sl_insert_time:.4f} s")
 
+    if bulk:
+        t0 = time.perf_counter()
+        SkipList.from_sorted(range(1, N + 1))
+        t1 = time.perf_counter()
+        sl_bulk_time = t1 - t0
+        print(f"Tiempo carga masiva SkipList (from_sorted): {sl_bulk_time:.4f} s")
+
     # Búsquedas aleatorias
     queries = [random.randint(1, N) for _ in range(Q)]
 
@@ -171,9 +54,17 @@ def benchmark_secuencial():
     sl_search_total = t3 - t2
     sl_search_avg = sl_search_total / Q * 1e6  # microsegundos
 
-    print(f"Tiempo total búsqueda SkipList (100k): {sl_search_total:.4f} s")
+    print(f"Tiempo total búsqueda SkipList ({Q:,}): {sl_search_total:.4f} s")
     print(f"Promedio por búsqueda: {sl_search_avg:.3f} µs")
 
+    # Mismo lote en una sola llamada (search_many)
+    t2 = time.perf_counter()
+    sl.search_many(queries)
+    t3 = time.perf_counter()
+
+    sl_batch_total = t3 - t2
+    print(f"Tiempo búsqueda en lote SkipList (search_many): {sl_batch_total:.4f} s")
+
     # ------------------------
     #           AVL
     # ------------------------
@@ -181,13 +72,20 @@ def benchmark_secuencial():
     root = None
 
     t4 = time.perf_counter()
-    for i in range(1, N + 1):
+    for i in keys:
         root = avl_insert(root, i)
     t5 = time.perf_counter()
 
     avl_insert_time = t5 - t4
     print(f"Tiempo inserción AVL: {avl_insert_time:.4f} s")
 
+    if bulk:
+        t0 = time.perf_counter()
+        avl_from_sorted(range(1, N + 1))
+        t1 = time.perf_counter()
+        avl_bulk_time = t1 - t0
+        print(f"Tiempo carga masiva AVL (from_sorted): {avl_bulk_time:.4f} s")
+
     # Búsquedas aleatorias
     t6 = time.perf_counter()
     for q in queries:
@@ -197,21 +95,107 @@ def benchmark_secuencial():
     avl_search_total = t7 - t6
     avl_search_avg = avl_search_total / Q * 1e6
 
-    print(f"Tiempo total búsqueda AVL (100k): {avl_search_total:.4f} s")
+    print(f"Tiempo total búsqueda AVL ({Q:,}): {avl_search_total:.4f} s")
     print(f"Promedio por búsqueda: {avl_search_avg:.3f} µs")
 
+    t6 = time.perf_counter()
+    avl_search_many(root, queries)
+    t7 = time.perf_counter()
+
+    avl_batch_total = t7 - t6
+    print(f"Tiempo búsqueda en lote AVL (search_many): {avl_batch_total:.4f} s")
+
+    # ------------------------
+    #    LISTA POR BLOQUES
+    # ------------------------
+    print("\n--- LISTA POR BLOQUES ---")
+    bl = BlockedSortedList()
+
+    t0 = time.perf_counter()
+    for i in keys:
+        bl.insert(i)
+    t1 = time.perf_counter()
+
+    bl_insert_time = t1 - t0
+    print(f"Tiempo inserción lista por bloques: {bl_insert_time:.4f} s")
+
+    if bulk:
+        t0 = time.perf_counter()
+        BlockedSortedList.from_sorted(range(1, N + 1))
+        t1 = time.perf_counter()
+        bl_bulk_time = t1 - t0
+        print(f"Tiempo carga masiva lista por bloques (from_sorted): {bl_bulk_time:.4f} s")
+
+    t2 = time.perf_counter()
+    for q in queries:
+        bl.search(q)
+    t3 = time.perf_counter()
+
+    bl_search_total = t3 - t2
+    bl_search_avg = bl_search_total / Q * 1e6
+
+    print(f"Tiempo total búsqueda lista por bloques ({Q:,}): {bl_search_total:.4f} s")
+    print(f"Promedio por búsqueda: {bl_search_avg:.3f} µs")
+
+    t2 = time.perf_counter()
+    bl.search_many(queries)
+    t3 = time.perf_counter()
+
+    bl_batch_total = t3 - t2
+    print(f"Tiempo búsqueda en lote lista por bloques (search_many): {bl_batch_total:.4f} s")
+
     # ------------------------
     #       COMPARACIÓN
     # ------------------------
     print("\n=== RESUMEN ===")
     print(f"SkipList inserción: {sl_insert_time:.4f} s")
     print(f"AVL inserción     : {avl_insert_time:.4f} s")
+    print(f"Bloques inserción : {bl_insert_time:.4f} s")
+
+    if bulk:
+        print(f"SkipList carga masiva: {sl_bulk_time:.4f} s")
+        print(f"AVL carga masiva     : {avl_bulk_time:.4f} s")
+        print(f"Bloques carga masiva : {bl_bulk_time:.4f} s")
 
     print(f"SkipList búsqueda total: {sl_search_total:.4f} s")
     print(f"AVL búsqueda total     : {avl_search_total:.4f} s")
+    print(f"Bloques búsqueda total : {bl_search_total:.4f} s")
 
     print(f"SkipList promedio búsqueda: {sl_search_avg:.3f} µs")
     print(f"AVL promedio búsqueda     : {avl_search_avg:.3f} µs")
+    print(f"Bloques promedio búsqueda : {bl_search_avg:.3f} µs")
+
+    print(f"SkipList throughput por llamada: {Q / sl_search_total:,.0f} búsquedas/s")
+    print(f"SkipList throughput en lote    : {Q / sl_batch_total:,.0f} búsquedas/s")
+    print(f"AVL throughput por llamada     : {Q / avl_search_total:,.0f} búsquedas/s")
+    print(f"AVL throughput en lote         : {Q / avl_batch_total:,.0f} búsquedas/s")
+    print(f"Bloques throughput por llamada : {Q / bl_search_total:,.0f} búsquedas/s")
+    print(f"Bloques throughput en lote     : {Q / bl_batch_total:,.0f} búsquedas/s")
+
+    if instrument:
+        print("\n=== CONTADORES (mismas claves y búsquedas, clases instrumentadas) ===")
+        for name, structure in (("SkipList", InstrumentedSkipList()), ("AVL", InstrumentedAVLTree())):
+            for k in keys:
+                structure.insert(k)
+            for q in queries:
+                structure.search(q)
+            print_counters(name, structure)
+
+    if workload is not None:
+        # Mismo flujo determinista para ambas estructuras
+        ops = workload.generate(Q, seed)
+        avl = AVLTree()
+        avl.root = root
+        print(f"\n=== CARGA DE TRABAJO ({Q:,} operaciones, distribución {workload.distribution}) ===")
+        for name, structure in (("SkipList", sl), ("AVL", avl), ("Bloques", bl)):
+            histograms = new_histograms()
+            t0 = time.perf_counter()
+            counts = replay(structure, ops, histograms)
+            t1 = time.perf_counter()
+            print(f"\n{name}: {t1 - t0:.4f} s, omitidas={counts['skipped']:,}")
+            for op, hist in histograms.items():
+                if hist.count:
+                    print(f"- {op:<6} {hist.format()}")
 
 
 if __name__ == "__main__":
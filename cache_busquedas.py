@@ -0,0 +1,211 @@
+"""
+Caché acotada de resultados de búsqueda para claves calientes.
+
+- CachedIndex envuelve cualquier estructura con insert/search (y delete si la
+  tiene) y recuerda el resultado (True/False) de las búsquedas recientes.
+- Políticas de reemplazo intercambiables: LRU (OrderedDict) y CLOCK (segunda
+  oportunidad con un bit de referencia por entrada; un acierto no reordena nada).
+- insert y delete invalidan la clave. Un contador de versión evita guardar un
+  resultado calculado antes de una escritura concurrente: si hubo escrituras
+  mientras se buscaba en la estructura, el resultado no se guarda.
+- Las operaciones sobre la caché van bajo un lock; la búsqueda en la estructura
+  se hace fuera de él.
+
+Ejecutar este archivo mide la tasa de aciertos con consultas uniformes y Zipf.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from avl_core import AVLTree
+from cargas import Workload, replay
+from skiplist_core import SkipList
+
+MISSING = object()
+
+
+class LRUCache:
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.entries = OrderedDict()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        value = self.entries.get(key, MISSING)
+        if value is not MISSING:
+            self.entries.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        """Guarda key -> value; devuelve True si tuvo que desalojar otra entrada."""
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+            return True
+        return False
+
+    def invalidate(self, key):
+        return self.entries.pop(key, MISSING) is not MISSING
+
+
+class ClockCache:
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.keys = [None] * capacity
+        self.values = [None] * capacity
+        self.referenced = bytearray(capacity)
+        self.slots = {}      # clave -> posición en el reloj
+        self.free = list(range(capacity - 1, -1, -1))
+        self.hand = 0
+
+    def __len__(self):
+        return len(self.slots)
+
+    def get(self, key):
+        slot = self.slots.get(key)
+        if slot is None:
+            return MISSING
+        self.referenced[slot] = 1
+        return self.values[slot]
+
+    def put(self, key, value):
+        slot = self.slots.get(key)
+        if slot is not None:
+            self.values[slot] = value
+            self.referenced[slot] = 1
+            return False
+
+        evicted = False
+        if self.free:
+            slot = self.free.pop()
+        else:
+            # la manecilla apaga bits de referencia hasta encontrar una víctima
+            referenced = self.referenced
+            hand = self.hand
+            while referenced[hand]:
+                referenced[hand] = 0
+                hand = (hand + 1) % self.capacity
+            slot = hand
+            self.hand = (hand + 1) % self.capacity
+            del self.slots[self.keys[slot]]
+            evicted = True
+
+        self.keys[slot] = key
+        self.values[slot] = value
+        self.referenced[slot] = 0
+        self.slots[key] = slot
+        return evicted
+
+    def invalidate(self, key):
+        slot = self.slots.pop(key, None)
+        if slot is None:
+            return False
+        self.keys[slot] = None
+        self.values[slot] = None
+        self.referenced[slot] = 0
+        self.free.append(slot)
+        return True
+
+
+POLICIES = {"lru": LRUCache, "clock": ClockCache}
+
+
+class CachedIndex:
+    def __init__(self, structure, capacity=10_000, policy="lru"):
+        if policy not in POLICIES:
+            raise ValueError(f"política desconocida: {policy!r}")
+        if capacity <= 0:
+            raise ValueError("capacity debe ser > 0")
+        self.structure = structure
+        self.policy = policy
+        self.cache = POLICIES[policy](capacity)
+        self.lock = threading.Lock()
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        # delete solo se expone si la estructura envuelta lo implementa (replay lo detecta con getattr)
+        if hasattr(structure, "delete"):
+            self.delete = self._delete
+
+    def __getattr__(self, name):
+        return getattr(self.structure, name)
+
+    def _written(self, key):
+        with self.lock:
+            self.version += 1
+            if self.cache.invalidate(key):
+                self.invalidations += 1
+
+    def insert(self, key):
+        result = self.structure.insert(key)
+        self._written(key)
+        return result
+
+    def _delete(self, key):
+        result = self.structure.delete(key)
+        self._written(key)
+        return result
+
+    def search(self, key):
+        with self.lock:
+            value = self.cache.get(key)
+            if value is not MISSING:
+                self.hits += 1
+                return value
+            self.misses += 1
+            version = self.version
+
+        found = self.structure.search(key)
+
+        with self.lock:
+            if self.version == version and self.cache.put(key, found):
+                self.evictions += 1
+        return found
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "policy": self.policy,
+                "size": len(self.cache),
+                "capacity": self.cache.capacity,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+def benchmark_cache(N=200_000, Q=200_000, capacities=(1_000, 10_000), seed=0):
+    print(f"\n=== CACHÉ DE BÚSQUEDAS ({N:,} claves, {Q:,} consultas) ===")
+    structures = [("SkipList", SkipList.from_sorted(range(1, N + 1))),
+                  ("AVL", AVLTree.from_sorted(range(1, N + 1)))]
+
+    print(f"{'Estructura':<10} {'consultas':<9} {'caché':<14} {'tiempo':>9} {'aciertos':>9} {'x':>7}")
+    for distribution in ("uniform", "zipfian"):
+        ops = Workload(N, read=1.0, distribution=distribution).generate(Q, seed)
+        for name, structure in structures:
+            t0 = time.perf_counter()
+            replay(structure, ops)
+            base = time.perf_counter() - t0
+            print(f"{name:<10} {distribution:<9} {'sin caché':<14} {base:>8.3f}s {'-':>9} {1:>6.2f}x")
+            for policy in POLICIES:
+                for capacity in capacities:
+                    cached = CachedIndex(structure, capacity, policy)
+                    t0 = time.perf_counter()
+                    replay(cached, ops)
+                    elapsed = time.perf_counter() - t0
+                    label = f"{policy} {capacity:,}"
+                    print(f"{name:<10} {distribution:<9} {label:<14} {elapsed:>8.3f}s "
+                          f"{cached.stats()['hit_rate']:>8.1%} {base / elapsed:>6.2f}x")
+
+
+if __name__ == "__main__":
+    benchmark_cache()
@@ -0,0 +1,154 @@
+"""
+Generador de carga para servidor_indice.py.
+
+- --connections conexiones; cada una mantiene --depth peticiones en vuelo
+  (pipelining) y reproduce su propio flujo de cargas.Workload.
+- Con --many K las búsquedas se agrupan de a K en una petición search_many.
+- Mide la latencia de cada petición (del envío a la respuesta) con
+  LatencyHistogram y reporta throughput, percentiles por operación y los
+  contadores del servidor (cuántas peticiones entraron en cada lote y
+  cuántas llamadas a search_many hicieron falta).
+- Sin --unix ni --port levanta el servidor en un proceso hijo sobre un
+  socket Unix temporal y lo detiene al terminar.
+
+Uso:
+    python carga_servidor.py --structure avl -n 200000 --connections 8 --depth 32
+    python carga_servidor.py --unix /tmp/indice.sock -n 100000 --workload churn
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import tempfile
+import time
+
+from cargas import PRESETS, preset
+from latencias import LatencyHistogram
+from servidor_indice import STRUCTURES, IndexClient, serve
+
+
+async def _run_stream(client, ops, many, histograms):
+    """Ejecuta ops en orden sobre una conexión; lo usan varias tareas a la vez (depth)."""
+    clock = time.perf_counter_ns
+    i = 0
+    while i < len(ops):
+        op = ops[i]
+        t0 = clock()
+        if op[0] == "search" and many > 1:
+            keys = [op[1]]
+            i += 1
+            while i < len(ops) and ops[i][0] == "search" and len(keys) < many:
+                keys.append(ops[i][1])
+                i += 1
+            await client.search_many(keys)
+            histograms["search_many"].record(clock() - t0)
+            continue
+        if op[0] == "search":
+            await client.search(op[1])
+        elif op[0] == "insert":
+            await client.insert(op[1])
+        elif op[0] == "delete":
+            await client.delete(op[1])
+        else:
+            await client.range(op[1], op[2])
+        histograms[op[0]].record(clock() - t0)
+        i += 1
+
+
+async def run_load(path=None, host="127.0.0.1", port=7070, n=100_000, workload="B",
+                   connections=4, depth=16, ops_per_connection=20_000, many=1, seed=0):
+    clients = [await IndexClient.connect(path, host, port) for _ in range(connections)]
+    generator = preset(workload, n)
+    names = ("search", "search_many", "insert", "delete", "range")
+    tasks = []
+    histograms = []
+    for c, client in enumerate(clients):
+        stream = generator.generate(ops_per_connection, seed, stream_id=c, num_streams=connections)
+        # el flujo de la conexión se reparte entre depth tareas: depth peticiones en vuelo
+        for d in range(depth):
+            hist = {name: LatencyHistogram() for name in names}
+            histograms.append(hist)
+            tasks.append(_run_stream(client, stream[d::depth], many, hist))
+
+    before = await clients[0].stats()
+    t0 = time.perf_counter()
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - t0
+    after = await clients[0].stats()
+    for client in clients:
+        await client.close()
+
+    merged = {name: LatencyHistogram.merged(h[name] for h in histograms) for name in names}
+    requests = sum(h.count for h in merged.values())
+    print(f"\n=== CARGA SOBRE EL SERVIDOR ({workload}, {connections} conexiones x {depth} en vuelo"
+          f"{f', search_many de {many}' if many > 1 else ''}) ===")
+    print(f"- Peticiones: {requests:,} en {elapsed:.3f} s ({requests / elapsed:,.0f} peticiones/s)")
+    for name, hist in merged.items():
+        if hist.count:
+            print(f"- Latencia {name:<11}: {hist.format()}")
+
+    served = after["requests"] - before["requests"] - 1  # sin la petición stats
+    batches = after["batches"] - before["batches"] - 1
+    calls = after["search_calls"] - before["search_calls"]
+    keys = after["keys_searched"] - before["keys_searched"]
+    print(f"- Servidor: {served:,} peticiones en {batches:,} lotes ({served / max(1, batches):.1f} por lote), "
+          f"{keys:,} claves buscadas en {calls:,} llamadas a search_many "
+          f"({keys / max(1, calls):.1f} por llamada, {keys / elapsed:,.0f} claves/s)")
+    return requests / elapsed
+
+
+def _serve_child(structure, path, preload):
+    try:
+        asyncio.run(serve(structure, path, preload=preload))
+    except KeyboardInterrupt:
+        pass
+
+
+def spawn_server(structure, preload, timeout=60.0):
+    """Levanta servidor_indice en un proceso hijo; devuelve (proceso, ruta del socket)."""
+    path = os.path.join(tempfile.mkdtemp(), "indice.sock")
+    proc = multiprocessing.Process(target=_serve_child, args=(structure, path, preload), daemon=True)
+    proc.start()
+    deadline = time.perf_counter() + timeout
+    while not os.path.exists(path):
+        if not proc.is_alive() or time.perf_counter() > deadline:
+            raise RuntimeError("el servidor no arrancó")
+        time.sleep(0.05)
+    return proc, path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generador de carga para servidor_indice.py.")
+    parser.add_argument("--unix", help="socket Unix de un servidor ya levantado")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, help="puerto TCP de un servidor ya levantado")
+    parser.add_argument("--structure", choices=tuple(STRUCTURES), default="skiplist",
+                        help="estructura del servidor propio (sin --unix ni --port)")
+    parser.add_argument("-n", "--keys", dest="n", type=int, default=100_000,
+                        help="claves 1..N precargadas en el servidor")
+    parser.add_argument("--workload", choices=tuple(PRESETS), default="B")
+    parser.add_argument("--connections", type=int, default=4)
+    parser.add_argument("--depth", type=int, default=16, help="peticiones en vuelo por conexión")
+    parser.add_argument("--ops", type=int, default=20_000, help="operaciones por conexión")
+    parser.add_argument("--many", type=int, default=1, help="búsquedas por petición search_many")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    proc = None
+    path = args.unix
+    if path is None and args.port is None:
+        proc, path = spawn_server(args.structure, args.n)
+    try:
+        asyncio.run(run_load(path, args.host, args.port or 7070, args.n, args.workload,
+                             args.connections, args.depth, args.ops, args.many, args.seed))
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.join()
+            os.remove(path)
+            os.rmdir(os.path.dirname(path))
+
+
+if __name__ == "__main__":
+    main()
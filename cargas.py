@@ -0,0 +1,218 @@
+"""
+Generador de cargas de trabajo deterministas (con semilla) estilo YCSB.
+
+- Orden de la carga inicial: asc, desc, random o nearly (casi ordenado).
+- Distribución de las claves leídas: uniform, zipfian (theta = 0.99, claves
+  calientes dispersas con un hash), hotspot o latest (las más recientes).
+- Mezclas configurables de search / insert / delete / range; PRESETS trae las
+  mezclas clásicas de YCSB adaptadas a las operaciones de estas estructuras.
+
+Cada operación es una tupla: ("search", k), ("insert", k), ("delete", k) o
+("range", lo, hi). replay() reproduce un flujo sobre cualquier estructura y
+cuenta como omitidas las operaciones que la estructura no implementa.
+"""
+
+import random
+import time
+
+from latencias import LatencyHistogram
+
+OPERATIONS = ("search", "insert", "delete", "range")
+
+ZIPF_THETA = 0.99
+
+
+def insert_order(n, order="asc", seed=0, swaps=0.01):
+    """Claves 1..n en el orden pedido. nearly intercambia una fracción swaps de posiciones vecinas."""
+    keys = list(range(1, n + 1))
+    rng = random.Random(seed)
+    if order == "desc":
+        keys.reverse()
+    elif order == "random":
+        rng.shuffle(keys)
+    elif order == "nearly":
+        for _ in range(int(n * swaps)):
+            i = rng.randrange(n)
+            j = min(n - 1, i + rng.randint(1, 16))
+            keys[i], keys[j] = keys[j], keys[i]
+    elif order != "asc":
+        raise ValueError(f"orden desconocido: {order!r}")
+    return keys
+
+
+def _fnv64(value):
+    # FNV-1a de 64 bits sobre los 8 bytes del entero (como ScrambledZipfian de YCSB)
+    h = 0xCBF29CE484222325
+    for _ in range(8):
+        h ^= value & 0xFF
+        h = (h * 0x100000001B3) & 0xFFFFFFFFFFFFFFFF
+        value >>= 8
+    return h
+
+
+class ZipfianGenerator:
+    """Rangos 0..n-1 con distribución Zipf (algoritmo de Gray et al., usado por YCSB)."""
+
+    def __init__(self, n, theta=ZIPF_THETA):
+        self.theta = theta
+        self.alpha = 1.0 / (1.0 - theta)
+        self.zeta2 = 1.0 + 0.5 ** theta
+        self.n = 0
+        self.zetan = 0.0
+        self.resize(n)
+
+    def resize(self, n):
+        # zeta(n) se actualiza de forma incremental cuando el conjunto crece
+        if n > self.n:
+            self.zetan += sum(1.0 / i ** self.theta for i in range(self.n + 1, n + 1))
+        elif n < self.n:
+            self.zetan = sum(1.0 / i ** self.theta for i in range(1, n + 1))
+        self.n = n
+        self.eta = ((1.0 - (2.0 / n) ** (1.0 - self.theta)) / (1.0 - self.zeta2 / self.zetan)
+                    if n > 1 else 0.0)
+
+    def next(self, rng):
+        u = rng.random()
+        uz = u * self.zetan
+        if uz < 1.0:
+            return 0
+        if uz < self.zeta2:
+            return 1
+        return min(self.n - 1, int(self.n * (self.eta * u - self.eta + 1.0) ** self.alpha))
+
+
+class Workload:
+    """
+    Mezcla de operaciones sobre un conjunto inicial de n claves (1..n).
+
+    read/insert/delete/scan: proporciones de search, insert, delete y range
+    (se normalizan; todas valen 0 por defecto, así que la mezcla se escribe
+    completa).
+    distribution: uniform, zipfian, hotspot o latest.
+    hot_fraction / hot_op_fraction: para hotspot, la fracción hot_fraction del
+    espacio recibe hot_op_fraction de los accesos.
+    range_length: longitud máxima de un range (uniforme en 1..range_length).
+    """
+
+    def __init__(self, n, read=0.0, insert=0.0, delete=0.0, scan=0.0,
+                 distribution="uniform", hot_fraction=0.2, hot_op_fraction=0.8, range_length=100):
+        if distribution not in ("uniform", "zipfian", "hotspot", "latest"):
+            raise ValueError(f"distribución desconocida: {distribution!r}")
+        total = read + insert + delete + scan
+        if total <= 0:
+            raise ValueError("la mezcla debe tener al menos una operación")
+        self.n = n
+        self.mix = [("search", read / total), ("insert", insert / total),
+                    ("delete", delete / total), ("range", scan / total)]
+        self.distribution = distribution
+        self.hot_fraction = hot_fraction
+        self.hot_op_fraction = hot_op_fraction
+        self.range_length = range_length
+
+    def generate(self, count, seed=0, stream_id=0, num_streams=1):
+        """
+        Genera count operaciones. Con varios flujos (uno por hilo), las claves
+        nuevas de cada flujo son disjuntas: n + 1 + stream_id + i * num_streams.
+        """
+        rng = random.Random(seed * 1_000_003 + stream_id)
+        ops = []
+        thresholds = []
+        acc = 0.0
+        for name, frac in self.mix:
+            acc += frac
+            thresholds.append((acc, name))
+
+        max_key = self.n
+        next_key = self.n + 1 + stream_id
+        zipf = ZipfianGenerator(max(1, self.n)) if self.distribution in ("zipfian", "latest") else None
+
+        for _ in range(count):
+            r = rng.random()
+            op = thresholds[-1][1]
+            for limit, name in thresholds:
+                if r < limit:
+                    op = name
+                    break
+
+            if op == "insert":
+                ops.append(("insert", next_key))
+                max_key = max(max_key, next_key)
+                next_key += num_streams
+                continue
+
+            key = self._choose(rng, max_key, zipf)
+            if op == "range":
+                ops.append(("range", key, key + rng.randint(1, self.range_length)))
+            else:
+                ops.append((op, key))
+        return ops
+
+    def _choose(self, rng, max_key, zipf):
+        if self.distribution == "uniform":
+            return rng.randint(1, max_key)
+        if self.distribution == "zipfian":
+            # rango Zipf dispersado por hash para que las claves calientes no sean contiguas
+            return 1 + _fnv64(zipf.next(rng)) % self.n
+        if self.distribution == "latest":
+            if zipf.n != max_key:
+                zipf.resize(max_key)
+            return max_key - zipf.next(rng)
+        hot = max(1, int(max_key * self.hot_fraction))
+        if rng.random() < self.hot_op_fraction:
+            return rng.randint(1, hot)
+        return rng.randint(min(hot + 1, max_key), max_key)
+
+
+# Mezclas clásicas de YCSB; "update" se modela como insert de clave nueva.
+PRESETS = {
+    "A": dict(read=0.50, insert=0.50, distribution="zipfian"),
+    "B": dict(read=0.95, insert=0.05, distribution="zipfian"),
+    "C": dict(read=1.00, distribution="zipfian"),
+    "D": dict(read=0.95, insert=0.05, distribution="latest"),
+    "E": dict(read=0.0, scan=0.95, insert=0.05, distribution="zipfian"),
+    "churn": dict(read=0.50, insert=0.25, delete=0.25, distribution="uniform"),
+}
+
+
+def preset(name, n, **overrides):
+    params = dict(PRESETS[name])
+    params.update(overrides)
+    return Workload(n, **params)
+
+
+def replay(structure, ops, histograms=None):
+    """
+    Ejecuta ops sobre structure y devuelve {operación: cantidad, "skipped": omitidas}.
+    Si se pasa histograms (dict operación -> LatencyHistogram) registra la latencia
+    de cada llamada.
+    """
+    handlers = {
+        "search": getattr(structure, "search", None),
+        "insert": getattr(structure, "insert", None),
+        "delete": getattr(structure, "delete", None),
+        "range": getattr(structure, "range", None),
+    }
+    counts = dict.fromkeys(OPERATIONS, 0)
+    counts["skipped"] = 0
+    clock = time.perf_counter_ns
+
+    for op in ops:
+        handler = handlers[op[0]]
+        if handler is None:
+            counts["skipped"] += 1
+            continue
+        t0 = clock()
+        if op[0] == "range":
+            # consumir el iterador completo: el coste del scan es parte de la operación
+            for _ in handler(op[1], op[2]):
+                pass
+        else:
+            handler(op[1])
+        if histograms is not None:
+            histograms[op[0]].record(clock() - t0)
+        counts[op[0]] += 1
+    return counts
+
+
+def new_histograms():
+    return {op: LatencyHistogram() for op in OPERATIONS}
@@ -0,0 +1,129 @@
+"""
+Filtro de Bloom para descartar búsquedas fallidas antes de recorrer la estructura.
+
+- Arreglo de bits en un bytearray, con m bits y k funciones hash calculados a
+  partir de la capacidad esperada y la tasa de falsos positivos deseada.
+- Doble hashing (Kirsch-Mitzenmacher): las k posiciones son h1 + i * h2, con
+  h1 y h2 sacados de un único hash multiplicativo de 64 bits de la clave.
+- Nunca da falsos negativos: si dice que no está, la clave no está.
+
+BloomFilteredIndex envuelve cualquier estructura con insert/search: la
+inserción marca el filtro (bajo un lock) antes de insertar en la estructura,
+así una búsqueda concurrente nunca descarta una clave ya insertada; la
+búsqueda consulta el filtro sin lock y solo baja a la estructura si el filtro
+dice "quizás".
+"""
+
+import math
+import threading
+
+MASK64 = 0xFFFFFFFFFFFFFFFF
+GOLDEN64 = 0x9E3779B97F4A7C15
+
+
+def _hash64(key):
+    # hash multiplicativo de Fibonacci: una multiplicación, bits altos bien dispersos
+    return (hash(key) * GOLDEN64) & MASK64
+
+
+class BloomFilter:
+    def __init__(self, capacity, fp_rate=0.01):
+        if capacity <= 0 or not 0 < fp_rate < 1:
+            raise ValueError("capacity debe ser > 0 y fp_rate estar en (0, 1)")
+        ln2 = math.log(2)
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(fp_rate) / (ln2 * ln2))))
+        self.num_hashes = max(1, round(self.num_bits / capacity * ln2))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.capacity = capacity
+        self.fp_rate = fp_rate
+
+    def _positions(self, key):
+        h = _hash64(key)
+        h1 = h >> 32
+        h2 = (h & 0xFFFFFFFF) | 1   # impar: recorre posiciones distintas
+        m = self.num_bits
+        return [(h1 + i * h2) % m for i in range(self.num_hashes)]
+
+    def add(self, key):
+        bits = self.bits
+        for pos in self._positions(key):
+            bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key):
+        # se corta en el primer bit apagado: la mayoría de las ausentes sale en 1 o 2 sondas
+        h = _hash64(key)
+        h1 = h >> 32
+        h2 = (h & 0xFFFFFFFF) | 1
+        m = self.num_bits
+        bits = self.bits
+        for _ in range(self.num_hashes):
+            pos = h1 % m
+            if not bits[pos >> 3] >> (pos & 7) & 1:
+                return False
+            h1 += h2
+        return True
+
+    def memory_bytes(self):
+        return len(self.bits)
+
+
+class BloomFilteredIndex:
+    """
+    Envoltorio que corta en el filtro las búsquedas de claves ausentes.
+
+    Los contadores son por hilo (sin locks en la ruta de búsqueda) y stats()
+    los suma: hits (búsquedas encontradas), misses (descartadas por el filtro)
+    y false_positives (el filtro dijo "quizás" y la estructura no la tenía).
+    """
+
+    def __init__(self, structure, capacity, fp_rate=0.01):
+        self.structure = structure
+        self.filter = BloomFilter(capacity, fp_rate)
+        self.lock = threading.Lock()
+        self._local = threading.local()
+        self._counters = []
+
+    def __getattr__(self, name):
+        # range, delete, etc. pasan directo a la estructura envuelta
+        return getattr(self.structure, name)
+
+    def _thread_counters(self):
+        counters = getattr(self._local, "counters", None)
+        if counters is None:
+            counters = self._local.counters = [0, 0, 0]
+            with self.lock:
+                self._counters.append(counters)
+        return counters
+
+    def insert(self, key):
+        # el bit se marca antes de insertar: no puede haber falsos negativos
+        with self.lock:
+            self.filter.add(key)
+        return self.structure.insert(key)
+
+    def search(self, key):
+        try:
+            counters = self._local.counters
+        except AttributeError:
+            counters = self._thread_counters()
+        if key not in self.filter:
+            counters[1] += 1
+            return False
+        found = self.structure.search(key)
+        if found:
+            counters[0] += 1
+        else:
+            counters[2] += 1
+        return found
+
+    def stats(self):
+        hits = sum(c[0] for c in self._counters)
+        misses = sum(c[1] for c in self._counters)
+        false_positives = sum(c[2] for c in self._counters)
+        absent = misses + false_positives
+        return {
+            "hits": hits,
+            "misses": misses,
+            "false_positives": false_positives,
+            "fp_rate": false_positives / absent if absent else 0.0,
+        }
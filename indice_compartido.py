@@ -0,0 +1,221 @@
+"""
+Índice de solo lectura en memoria compartida (multiprocessing.shared_memory).
+
+Una SkipList o un AVL ya construidos se exportan a un bloque plano de enteros
+de 64 bits que cualquier proceso puede abrir por nombre y consultar sin copiar:
+
+- Cabecera: magic, tipo, n, aux (nivel de la skip list / raíz del AVL) y
+  número de punteros.
+- SkipList: keys[n+1], offsets[n+1] y links (mismo esquema que
+  CompactSkipList: nivel i del nodo id -> links[offsets[id] + i]; el nodo 0
+  es la cabecera y -1 indica "sin siguiente").
+- AVL: keys[n], left[n], right[n] en preorden (índices de hijo, -1 = vacío).
+
+Ejecutar este archivo construye un índice, lo exporta y lanza varios procesos
+que buscan sobre el mismo bloque.
+"""
+
+import multiprocessing
+import random
+import struct
+import time
+from array import array
+from multiprocessing import shared_memory
+
+from avl_core import avl_from_sorted
+from skiplist_core import SkipList
+
+MAGIC = b"IDXSHM01"
+HEADER = struct.Struct("<8sqqqq")  # magic, tipo, n, aux, n_links
+KIND_SKIPLIST = 0
+KIND_AVL = 1
+NIL = -1
+
+
+def _skiplist_arrays(sl):
+    keys = array('q', [-1])
+    heights = [sl.level + 1]
+    node = sl.header.forward[0]
+    while node:
+        keys.append(node.key)
+        heights.append(len(node.forward))
+        node = node.forward[0]
+
+    offsets = array('q', bytes(8 * len(keys)))
+    total = 0
+    for i, h in enumerate(heights):
+        offsets[i] = total
+        total += h
+    links = array('q', [NIL]) * total
+
+    # un solo recorrido en orden: el último nodo visto en cada nivel apunta al actual
+    tails = [0] * (sl.level + 1)
+    for i in range(1, len(keys)):
+        for lvl in range(heights[i]):
+            links[offsets[tails[lvl]] + lvl] = i
+            tails[lvl] = i
+    return keys, offsets, links
+
+
+def _avl_arrays(root):
+    keys = array('q')
+    left = array('q')
+    right = array('q')
+    # preorden iterativo; (nodo, índice del padre, 0 = hijo izquierdo / 1 = derecho)
+    stack = [(root, NIL, 0)] if root else []
+    while stack:
+        node, parent, side = stack.pop()
+        idx = len(keys)
+        keys.append(node.key)
+        left.append(NIL)
+        right.append(NIL)
+        if parent != NIL:
+            (left if side == 0 else right)[parent] = idx
+        if node.right:
+            stack.append((node.right, idx, 1))
+        if node.left:
+            stack.append((node.left, idx, 0))
+    return keys, left, right
+
+
+class SharedIndex:
+    """Bloque de memoria compartida creado por el proceso que exporta (dueño)."""
+
+    def __init__(self, structure):
+        if hasattr(structure, "header"):
+            keys, offsets, links = _skiplist_arrays(structure)
+            kind, n, aux = KIND_SKIPLIST, len(keys) - 1, structure.level
+            parts = (keys, offsets, links)
+            n_links = len(links)
+        else:
+            root = getattr(structure, "root", structure)
+            keys, left, right = _avl_arrays(root)
+            kind, n, aux = KIND_AVL, len(keys), 0 if len(keys) else NIL
+            parts = (keys, left, right)
+            n_links = 0
+
+        size = HEADER.size + sum(len(p) * 8 for p in parts)
+        self.shm = shared_memory.SharedMemory(create=True, size=size)
+        self.name = self.shm.name
+
+        buf = self.shm.buf
+        HEADER.pack_into(buf, 0, MAGIC, kind, n, aux, n_links)
+        pos = HEADER.size
+        for part in parts:
+            raw = part.tobytes()
+            buf[pos:pos + len(raw)] = raw
+            pos += len(raw)
+
+    def close(self):
+        self.shm.close()
+
+    def unlink(self):
+        self.shm.unlink()
+
+
+class SharedIndexReader:
+    """Abre un índice exportado por nombre y busca directamente sobre el bloque."""
+
+    def __init__(self, name):
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # Python < 3.13 no tiene track=False
+            self.shm = shared_memory.SharedMemory(name=name)
+
+        magic, self.kind, self.n, self.aux, n_links = HEADER.unpack_from(self.shm.buf, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{name!r} no es un índice compartido")
+
+        words = self.shm.buf[HEADER.size:].cast('q')
+        self._words = words
+        if self.kind == KIND_SKIPLIST:
+            n = self.n + 1
+            self.keys = words[:n]
+            self.offsets = words[n:2 * n]
+            self.links = words[2 * n:2 * n + n_links]
+        else:
+            n = self.n
+            self.keys = words[:n]
+            self.left = words[n:2 * n]
+            self.right = words[2 * n:3 * n]
+
+    def __len__(self):
+        return self.n
+
+    def search(self, key) -> bool:
+        keys = self.keys
+        if self.kind == KIND_SKIPLIST:
+            offsets = self.offsets
+            links = self.links
+            current = 0
+            for i in range(self.aux, -1, -1):
+                nxt = links[offsets[current] + i]
+                while nxt != NIL and keys[nxt] < key:
+                    current = nxt
+                    nxt = links[offsets[current] + i]
+            nxt = links[offsets[current]]
+            return nxt != NIL and keys[nxt] == key
+
+        left = self.left
+        right = self.right
+        node = self.aux
+        while node != NIL:
+            k = keys[node]
+            if key == k:
+                return True
+            node = left[node] if key < k else right[node]
+        return False
+
+    def search_many(self, keys):
+        return [self.search(k) for k in keys]
+
+    def close(self):
+        # las vistas deben liberarse antes de cerrar el bloque
+        views = [self._words, self.keys]
+        if self.kind == KIND_SKIPLIST:
+            views += [self.offsets, self.links]
+        else:
+            views += [self.left, self.right]
+        for view in reversed(views):
+            view.release()
+        self.shm.close()
+
+
+def _reader_process(name, queries, results):
+    reader = SharedIndexReader(name)
+    t0 = time.perf_counter()
+    found = sum(reader.search_many(queries))
+    elapsed = time.perf_counter() - t0
+    reader.close()
+    results.put((found, elapsed))
+
+
+def demo_indice_compartido(N=200_000, Q=50_000, procesos=4):
+    print(f"\n=== ÍNDICE COMPARTIDO ({N:,} claves, {procesos} procesos lectores) ===")
+    for name, structure in (("SkipList", SkipList.from_sorted(range(1, N + 1))),
+                            ("AVL", avl_from_sorted(range(1, N + 1)))):
+        t0 = time.perf_counter()
+        index = SharedIndex(structure)
+        export_time = time.perf_counter() - t0
+
+        results = multiprocessing.Queue()
+        queries = [random.randint(1, 2 * N) for _ in range(Q)]
+        procs = [multiprocessing.Process(target=_reader_process, args=(index.name, queries, results))
+                 for _ in range(procesos)]
+        for p in procs:
+            p.start()
+        stats = [results.get() for _ in procs]
+        for p in procs:
+            p.join()
+
+        index.close()
+        index.unlink()
+
+        avg = sum(e for _, e in stats) / len(stats)
+        print(f"{name:<8} exportación={export_time:.3f} s  tamaño={index.shm.size / N:.1f} bytes/clave  "
+              f"búsquedas/proceso={Q / avg:,.0f} ops/s  encontradas={stats[0][0]:,}")
+
+
+if __name__ == "__main__":
+    demo_indice_compartido()
@@ -0,0 +1,181 @@
+"""
+Índice particionado por rangos de clave en varios procesos (escapa del GIL).
+
+- El espacio de claves [lo, hi) se divide en num_shards rangos contiguos.
+- Cada shard vive en su propio proceso (multiprocessing.Process) y es dueño
+  de una SkipList o un AVL; se comunica con el router por un Pipe.
+- El router agrupa las operaciones por shard, envía todos los lotes y solo
+  después recoge las respuestas, así los shards trabajan en paralelo.
+- Se usan procesos dedicados y no ProcessPoolExecutor porque cada shard debe
+  conservar su estructura entre llamadas.
+
+Ejecutar este archivo compara el índice particionado contra el benchmark
+con hilos de benchmark_concurrente_8_hilos.py con 1, 2, 4 y 8 workers.
+"""
+
+import multiprocessing
+import random
+import time
+from bisect import bisect_right
+
+from avl_core import AVLTree
+from cargas import insert_order
+from skiplist_core import SkipList
+
+STRUCTURES = {
+    "skiplist": SkipList,
+    "avl": AVLTree,
+}
+
+
+def _shard_main(conn, structure_name):
+    structure = STRUCTURES[structure_name]()
+    while True:
+        op, keys = conn.recv()
+        if op == "insert":
+            for key in keys:
+                structure.insert(key)
+            conn.send(len(keys))
+        elif op == "search":
+            conn.send(structure.search_many(keys))
+        elif op == "close":
+            conn.close()
+            return
+
+
+class ShardedIndex:
+    def __init__(self, structure="skiplist", num_shards=4, key_range=(1, 1_000_001)):
+        if structure not in STRUCTURES:
+            raise ValueError(f"estructura desconocida: {structure!r}")
+        lo, hi = key_range
+        self.num_shards = num_shards
+        step = max(1, (hi - lo) // num_shards)
+        # límites internos: la clave k va al shard bisect_right(bounds, k)
+        self.bounds = [lo + step * i for i in range(1, num_shards)]
+
+        self.conns = []
+        self.procs = []
+        for _ in range(num_shards):
+            parent, child = multiprocessing.Pipe()
+            proc = multiprocessing.Process(target=_shard_main, args=(child, structure), daemon=True)
+            proc.start()
+            child.close()
+            self.conns.append(parent)
+            self.procs.append(proc)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _route(self, keys):
+        """Agrupa las claves por shard; devuelve (claves por shard, posiciones originales)."""
+        batches = [[] for _ in range(self.num_shards)]
+        positions = [[] for _ in range(self.num_shards)]
+        bounds = self.bounds
+        for pos, key in enumerate(keys):
+            shard = bisect_right(bounds, key)
+            batches[shard].append(key)
+            positions[shard].append(pos)
+        return batches, positions
+
+    def insert_many(self, keys):
+        batches, _ = self._route(keys)
+        pending = []
+        for conn, batch in zip(self.conns, batches):
+            if batch:
+                conn.send(("insert", batch))
+                pending.append(conn)
+        return sum(conn.recv() for conn in pending)
+
+    def search_many(self, keys):
+        keys = list(keys)
+        batches, positions = self._route(keys)
+        pending = []
+        for shard, (conn, batch) in enumerate(zip(self.conns, batches)):
+            if batch:
+                conn.send(("search", batch))
+                pending.append((shard, conn))
+
+        result = [False] * len(keys)
+        for shard, conn in pending:
+            for pos, found in zip(positions[shard], conn.recv()):
+                result[pos] = found
+        return result
+
+    def insert(self, key):
+        self.insert_many([key])
+
+    def search(self, key):
+        return self.search_many([key])[0]
+
+    def close(self):
+        for conn in self.conns:
+            conn.send(("close", None))
+            conn.close()
+        for proc in self.procs:
+            proc.join()
+        self.conns = []
+        self.procs = []
+
+
+def interleaved_batches(keys, workers, batch):
+    """
+    Reparte keys en workers bloques contiguos (como los hilos de
+    run_benchmark) y genera lotes de unas batch claves que toman el tramo
+    siguiente de cada bloque. Con claves ordenadas cada bloque cae en un
+    shard distinto, así que todos los shards trabajan en cada lote.
+    """
+    block = (len(keys) + workers - 1) // workers
+    blocks = [keys[i * block:(i + 1) * block] for i in range(workers)]
+    step = max(1, batch // workers)
+    for i in range(0, block, step):
+        yield [k for b in blocks for k in b[i:i + step]]
+
+
+def run_sharded(structure, num_shards, N, searches_per_insert=10, batch=10_000, order="asc", seed=0):
+    """
+    Misma carga que run_benchmark: cada worker inserta un bloque contiguo de
+    insert_order(N) y hace searches_per_insert búsquedas aleatorias por
+    inserción. Cada lote toma el tramo siguiente de todos los bloques, como
+    si los hilos avanzaran a la par. Solo se miden los lotes (como en
+    benchmark_cli.run_processes): el arranque y cierre de los procesos y la
+    generación de las consultas quedan fuera.
+    """
+    keys = insert_order(N // num_shards * num_shards, order, seed)
+
+    elapsed = 0.0
+    with ShardedIndex(structure, num_shards, key_range=(1, N + 1)) as index:
+        for chunk in interleaved_batches(keys, num_shards, batch):
+            queries = [random.randint(1, N) for _ in range(len(chunk) * searches_per_insert)]
+            t0 = time.perf_counter()
+            index.insert_many(chunk)
+            index.search_many(queries)
+            elapsed += time.perf_counter() - t0
+    return elapsed
+
+
+def benchmark_particionado(N=200_000, worker_counts=(1, 2, 4, 8)):
+    # import local: el benchmark con hilos solo se necesita para la comparación
+    from benchmark_concurrente_8_hilos import AVLTree as ThreadedAVLTree
+    from benchmark_concurrente_8_hilos import SkipList as ThreadedSkipList
+    from benchmark_concurrente_8_hilos import run_benchmark
+
+    print(f"\n=== ÍNDICE PARTICIONADO vs HILOS ({N:,} claves, 10 búsquedas por inserción) ===")
+    rows = []
+    for name, structure, threaded_factory in (("SkipList", "skiplist", ThreadedSkipList),
+                                              ("AVL", "avl", ThreadedAVLTree)):
+        for workers in worker_counts:
+            threaded = run_benchmark(threaded_factory(), name, num_threads=workers, N=N)
+            sharded = run_sharded(structure, workers, N)
+            rows.append((name, workers, threaded, sharded))
+
+    print("\nResumen (segundos; en procesos solo el tiempo de los lotes):")
+    print(f"{'Estructura':<10} {'workers':>8} {'hilos':>10} {'procesos':>10} {'speedup':>8}")
+    for name, workers, threaded, sharded in rows:
+        print(f"{name:<10} {workers:>8} {threaded:>10.3f} {sharded:>10.3f} {threaded / sharded:>7.2f}x")
+
+
+if __name__ == "__main__":
+    benchmark_particionado()
@@ -0,0 +1,211 @@
+"""
+Instantáneas binarias de SkipList y AVL para un arranque en frío rápido.
+
+Formato (little endian):
+- Cabecera: magic, tipo (0 = SkipList, 1 = AVL), n, max_level y p.
+- n claves int64: en orden para la SkipList, en preorden para el AVL.
+- n bytes: altura (nivel) de cada nodo de la SkipList, o la forma del AVL
+  en preorden (bit 0 = tiene hijo izquierdo, bit 1 = tiene hijo derecho).
+
+load_* abre el archivo con mmap y reconstruye la estructura en tiempo lineal
+sin búsquedas ni rotaciones. MappedKeys responde búsquedas directamente sobre
+las claves ordenadas mapeadas de una instantánea de SkipList, sin reconstruir.
+
+Ejecutar este archivo compara el tiempo de carga con el de reconstrucción.
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+import time
+from array import array
+from bisect import bisect_left
+
+from avl_core import AVLNode, AVLTree, update
+from cargas import insert_order
+from skiplist_core import SkipList
+
+MAGIC = b"SNAPIDX1"
+HEADER = struct.Struct("<8sqqqd")  # magic, tipo, n, max_level, p
+KIND_SKIPLIST = 0
+KIND_AVL = 1
+HAS_LEFT = 1
+HAS_RIGHT = 2
+
+
+def _write(path, kind, keys, extra, max_level=0, p=0.0):
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, kind, len(keys), max_level, p))
+        f.write(keys.tobytes())
+        f.write(bytes(extra))
+
+
+def save_skiplist(sl, path):
+    keys = array('q')
+    levels = bytearray()
+    node = sl.header.forward[0]
+    while node:
+        keys.append(node.key)
+        levels.append(len(node.forward) - 1)
+        node = node.forward[0]
+    _write(path, KIND_SKIPLIST, keys, levels, sl.max_level, sl.p)
+
+
+def save_avl(root, path):
+    keys = array('q')
+    shape = bytearray()
+    stack = [root] if root else []
+    while stack:
+        node = stack.pop()
+        keys.append(node.key)
+        shape.append((HAS_LEFT if node.left else 0) | (HAS_RIGHT if node.right else 0))
+        if node.right:
+            stack.append(node.right)
+        if node.left:
+            stack.append(node.left)
+    _write(path, KIND_AVL, keys, shape)
+
+
+class _Mapped:
+    """Abre una instantánea con mmap y expone cabecera, claves y bytes extra."""
+
+    def __init__(self, path, kind):
+        with open(path, "rb") as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, file_kind, self.n, self.max_level, self.p = HEADER.unpack_from(self.mm, 0)
+        if magic != MAGIC or file_kind != kind:
+            self.mm.close()
+            raise ValueError(f"{path!r} no es una instantánea del tipo esperado")
+        start = HEADER.size
+        end = start + 8 * self.n
+        self._view = memoryview(self.mm)
+        self.keys = self._view[start:end].cast('q')
+        self.extra = self._view[end:end + self.n]
+
+    def close(self):
+        self.keys.release()
+        self.extra.release()
+        self._view.release()
+        self.mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_skiplist(path, cls=SkipList):
+    with _Mapped(path, KIND_SKIPLIST) as m:
+        sl = cls(m.max_level, m.p)
+        sl._link_sorted(zip(m.keys, m.extra))
+    return sl
+
+
+def load_avl_root(path, node_class=AVLNode):
+    with _Mapped(path, KIND_AVL) as m:
+        nodes = []
+        slots = []   # (padre, lado) pendientes de llenar, en preorden
+        root = None
+        for key, flags in zip(m.keys, m.extra):
+            node = node_class(key)
+            nodes.append(node)
+            if slots:
+                parent, side = slots.pop()
+                if side == HAS_LEFT:
+                    parent.left = node
+                else:
+                    parent.right = node
+            else:
+                root = node
+            if flags & HAS_RIGHT:
+                slots.append((node, HAS_RIGHT))
+            if flags & HAS_LEFT:
+                slots.append((node, HAS_LEFT))
+
+    # en preorden inverso los hijos se procesan antes que su padre
+    for node in reversed(nodes):
+        update(node)
+    return root
+
+
+def load_avl(path, cls=AVLTree):
+    tree = cls()
+    tree.root = load_avl_root(path, cls.node_class)
+    return tree
+
+
+class MappedKeys(_Mapped):
+    """Búsquedas con bisect directamente sobre las claves mapeadas de una SkipList guardada."""
+
+    def __init__(self, path):
+        super().__init__(path, KIND_SKIPLIST)
+
+    def __len__(self):
+        return self.n
+
+    def search(self, key) -> bool:
+        i = bisect_left(self.keys, key)
+        return i < self.n and self.keys[i] == key
+
+
+def benchmark_instantaneas(N=200_000, seed=0):
+    print(f"\n=== INSTANTÁNEAS: CARGA vs RECONSTRUCCIÓN ({N:,} claves) ===")
+    keys = insert_order(N, "random", seed)
+    workdir = tempfile.mkdtemp()
+
+    sl = SkipList()
+    avl = AVLTree()
+    t0 = time.perf_counter()
+    for k in keys:
+        sl.insert(k)
+    sl_rebuild = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for k in keys:
+        avl.insert(k)
+    avl_rebuild = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    SkipList.from_sorted(range(1, N + 1))
+    sl_bulk = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    AVLTree.from_sorted(range(1, N + 1))
+    avl_bulk = time.perf_counter() - t0
+
+    sl_path = os.path.join(workdir, "skiplist.snap")
+    avl_path = os.path.join(workdir, "avl.snap")
+    t0 = time.perf_counter()
+    sl.save(sl_path)
+    sl_save = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    avl.save(avl_path)
+    avl_save = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    SkipList.load(sl_path)
+    sl_load = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    AVLTree.load(avl_path)
+    avl_load = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    mapped = MappedKeys(sl_path)
+    mapped.search(N // 2)
+    mapped_open = time.perf_counter() - t0
+    mapped.close()
+
+    print(f"{'Estructura':<10} {'inserción':>10} {'from_sorted':>12} {'save':>8} {'load':>8} {'archivo':>12}")
+    for name, rebuild, bulk, save, load, path in (
+            ("SkipList", sl_rebuild, sl_bulk, sl_save, sl_load, sl_path),
+            ("AVL", avl_rebuild, avl_bulk, avl_save, avl_load, avl_path)):
+        print(f"{name:<10} {rebuild:>9.3f}s {bulk:>11.3f}s {save:>7.3f}s {load:>7.3f}s "
+              f"{os.path.getsize(path) / 1e6:>9.2f} MB")
+    print(f"Apertura mapeada + primera búsqueda (MappedKeys): {mapped_open * 1e3:.3f} ms")
+
+    os.remove(sl_path)
+    os.remove(avl_path)
+    os.rmdir(workdir)
+
+
+if __name__ == "__main__":
+    benchmark_instantaneas()
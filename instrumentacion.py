@@ -0,0 +1,194 @@
+"""
+Variantes instrumentadas de SkipList y AVLTree.
+
+Para explicar las diferencias de tiempo sin tocar el camino rápido: las
+clases por defecto no cambian y no pagan nada; quien quiera contadores
+cambia SkipList por InstrumentedSkipList o AVLTree por InstrumentedAVLTree.
+
+Contadores:
+- comparisons: comparaciones de claves (< y ==) hechas por search/insert.
+- SkipList: saltos (forward hops) por nivel, lecturas de forward[i] y la
+  distribución de niveles generada por random_level.
+- AVL: nodos visitados, rotaciones por caso (LL, RR, LR, RL) y profundidad
+  del retroceso (cuántos ancestros se actualizan tras cada inserción).
+"""
+
+import random
+import time
+from collections import Counter
+
+from avl_core import AVLTree, _insert_leaf, _retrace_insert, get_balance, rebalance
+from cargas import insert_order
+from skiplist_core import SkipList
+
+
+class InstrumentedSkipList(SkipList):
+    def __init__(self, max_level=20, p=0.5, **kwargs):
+        super().__init__(max_level, p, **kwargs)
+        self.counts = Counter()
+        self.hops = [0] * (max_level + 1)
+        self.levels = [0] * (max_level + 1)
+
+    def _grow(self):
+        super()._grow()
+        self.hops.append(0)
+        self.levels.append(0)
+
+    def random_level(self):
+        lvl = super().random_level()
+        self.levels[lvl] += 1
+        return lvl
+
+    def _descend(self, key, update=None):
+        """Mismo descenso que search/insert, contando comparaciones, saltos y lecturas de forward."""
+        comparisons = 0
+        reads = 0
+        hops = self.hops
+        current = self.header
+        for i in range(self.level, -1, -1):
+            while True:
+                nxt = current.forward[i]
+                reads += 1
+                if nxt is None:
+                    break
+                comparisons += 1
+                if not nxt.key < key:
+                    break
+                current = nxt
+                hops[i] += 1
+            if update is not None:
+                update[i] = current
+        self.counts["comparisons"] += comparisons
+        self.counts["forward_reads"] += reads
+        return current
+
+    def search(self, key) -> bool:
+        self.counts["searches"] += 1
+        current = self._descend(key).forward[0]
+        if current is None:
+            return False
+        self.counts["comparisons"] += 1
+        return current.key == key
+
+    def insert(self, key):
+        self.counts["inserts"] += 1
+        update = [None] * (self.max_level + 1)
+        self._descend(key, update)
+        self._link_new(update, key)
+
+    def report(self):
+        c = self.counts
+        lines = []
+        for op in ("searches", "inserts"):
+            if c[op]:
+                lines.append(f"{op}: {c[op]:,}")
+        ops = c["searches"] + c["inserts"]
+        if ops:
+            lines.append(f"comparaciones por operación: {c['comparisons'] / ops:.2f}  "
+                         f"lecturas de forward por operación: {c['forward_reads'] / ops:.2f}  "
+                         f"saltos por operación: {sum(self.hops) / ops:.2f}")
+        top = max((i for i, h in enumerate(self.hops) if h), default=-1)
+        if top >= 0:
+            lines.append("saltos por nivel: " + "  ".join(f"{i}:{self.hops[i]:,}" for i in range(top + 1)))
+        generated = sum(self.levels)
+        if generated:
+            top = max(i for i, n in enumerate(self.levels) if n)
+            lines.append("niveles generados: " + "  ".join(
+                f"{i}:{self.levels[i] / generated:.1%}" for i in range(top + 1)))
+        return lines
+
+
+class InstrumentedAVLTree(AVLTree):
+    def __init__(self):
+        super().__init__()
+        self.counts = Counter()
+        self.retrace = Counter()   # profundidad del retroceso -> inserciones
+
+    def insert(self, key):
+        # mismos pasos que avl_core.avl_insert, contando alrededor de cada uno
+        self.counts["inserts"] += 1
+        new_node = self.node_class(key)
+        if self.root is None:
+            self.root = new_node
+            return
+        path = _insert_leaf(self.root, new_node)
+        self.counts["comparisons"] += len(path) + 1
+        self.counts["nodes_visited"] += len(path)
+        self.root, depth = _retrace_insert(self.root, path, self._rebalance)
+        self.retrace[depth] += 1
+
+    def _rebalance(self, node):
+        """avl_core.rebalance, registrando el caso de rotación."""
+        if get_balance(node) > 1:
+            case = "LR" if get_balance(node.left) < 0 else "LL"
+        else:
+            case = "RL" if get_balance(node.right) > 0 else "RR"
+        self.counts[f"rotation_{case}"] += 1
+        return rebalance(node)
+
+    def search(self, key):
+        self.counts["searches"] += 1
+        comparisons = 0
+        visited = 0
+        node = self.root
+        found = False
+        while node:
+            visited += 1
+            comparisons += 1
+            if key == node.key:
+                found = True
+                break
+            comparisons += 1
+            node = node.left if key < node.key else node.right
+        self.counts["comparisons"] += comparisons
+        self.counts["nodes_visited"] += visited
+        return found
+
+    def report(self):
+        c = self.counts
+        lines = []
+        for op in ("searches", "inserts"):
+            if c[op]:
+                lines.append(f"{op}: {c[op]:,}")
+        ops = c["searches"] + c["inserts"]
+        if ops:
+            lines.append(f"comparaciones por operación: {c['comparisons'] / ops:.2f}  "
+                         f"nodos visitados por operación: {c['nodes_visited'] / ops:.2f}")
+        rotations = {case: c[f"rotation_{case}"] for case in ("LL", "RR", "LR", "RL")}
+        lines.append("rotaciones: " + "  ".join(f"{case}={n:,}" for case, n in rotations.items()))
+        if self.retrace:
+            total = sum(self.retrace.values())
+            mean = sum(d * n for d, n in self.retrace.items()) / total
+            top = max(self.retrace)
+            lines.append(f"profundidad de retroceso: media={mean:.2f}  máx={top}  " + "  ".join(
+                f"{d}:{self.retrace[d] / total:.1%}" for d in range(1, min(top, 8) + 1)))
+        return lines
+
+
+def print_counters(name, structure):
+    print(f"\nContadores {name}:")
+    for line in structure.report():
+        print(f"- {line}")
+
+
+def benchmark_instrumentado(N=200_000, Q=100_000, order="random", seed=0):
+    print(f"\n=== CONTADORES: SKIP LIST vs AVL ({N:,} claves, inserción {order}) ===")
+    keys = insert_order(N, order, seed)
+    rng = random.Random(seed)
+    queries = [rng.randint(1, N) for _ in range(Q)]
+
+    for name, structure in (("SkipList", InstrumentedSkipList()), ("AVL", InstrumentedAVLTree())):
+        t0 = time.perf_counter()
+        for k in keys:
+            structure.insert(k)
+        t1 = time.perf_counter()
+        for q in queries:
+            structure.search(q)
+        t2 = time.perf_counter()
+        print(f"\n{name}: inserción {t1 - t0:.3f} s, búsqueda {(t2 - t1) / Q * 1e6:.2f} µs/op "
+              f"(tiempos con instrumentación)")
+        print_counters(name, structure)
+
+
+if __name__ == "__main__":
+    benchmark_instrumentado()
@@ -0,0 +1,99 @@
+"""
+Histogramas de latencia de bajo coste (estilo HDR, buckets logarítmicos).
+
+- Los valores se registran en nanosegundos (time.perf_counter_ns).
+- Hasta 2 * SUB ns cada valor tiene su propio bucket; por encima, cada
+  potencia de dos se divide en SUB sub-buckets, así que el error relativo
+  de un percentil es como mucho 1 / SUB (~3 % con SUB = 32).
+- Cada hilo registra en su propio histograma (sin locks) y al final se
+  combinan con merge.
+"""
+
+SUB_BITS = 5
+SUB = 1 << SUB_BITS
+
+
+def bucket_index(value):
+    if value < 2 * SUB:
+        return value
+    shift = value.bit_length() - SUB_BITS - 1
+    return shift * SUB + (value >> shift)
+
+
+def bucket_value(index):
+    """Valor representativo (punto medio) del bucket."""
+    if index < 2 * SUB:
+        return index
+    shift = index // SUB - 1
+    top = index - shift * SUB
+    return (top << shift) + (1 << (shift - 1))
+
+
+class LatencyHistogram:
+    def __init__(self):
+        self.counts = [0] * (4 * SUB)
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def record(self, ns):
+        if ns < 0:
+            ns = 0
+        idx = bucket_index(ns)
+        counts = self.counts
+        if idx >= len(counts):
+            counts.extend([0] * (idx + 1 - len(counts)))
+        counts[idx] += 1
+        self.count += 1
+        self.total_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    def merge(self, other):
+        if len(other.counts) > len(self.counts):
+            self.counts.extend([0] * (len(other.counts) - len(self.counts)))
+        for i, c in enumerate(other.counts):
+            if c:
+                self.counts[i] += c
+        self.count += other.count
+        self.total_ns += other.total_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+        return self
+
+    @classmethod
+    def merged(cls, histograms):
+        result = cls()
+        for h in histograms:
+            result.merge(h)
+        return result
+
+    def percentile(self, q):
+        """Latencia (ns) bajo la cual cae la fracción q de las muestras (0 < q <= 1)."""
+        if self.count == 0:
+            return 0
+        target = max(1, int(q * self.count + 0.5))
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= target:
+                return min(bucket_value(i), self.max_ns)
+        return self.max_ns
+
+    def mean(self):
+        return self.total_ns / self.count if self.count else 0.0
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "total_s": self.total_ns / 1e9,
+            "mean_us": self.mean() / 1e3,
+            "p50_us": self.percentile(0.50) / 1e3,
+            "p99_us": self.percentile(0.99) / 1e3,
+            "p999_us": self.percentile(0.999) / 1e3,
+            "max_us": self.max_ns / 1e3,
+        }
+
+    def format(self):
+        s = self.summary()
+        return (f"n={s['count']:,}  media={s['mean_us']:.2f} µs  p50={s['p50_us']:.2f} µs  "
+                f"p99={s['p99_us']:.2f} µs  p999={s['p999_us']:.2f} µs  max={s['max_us']:.2f} µs")
@@ -0,0 +1,114 @@
+"""
+Conjunto ordenado por bloques (lista de listas ordenadas, estilo sortedcontainers).
+
+- Las claves viven en bloques: listas ordenadas de entre load y 2 * load
+  claves (load = 1000 por defecto).
+- maxes guarda la clave máxima de cada bloque; bisect sobre maxes elige el
+  bloque y bisect dentro del bloque encuentra la posición. Son dos búsquedas
+  binarias en C sobre listas contiguas en lugar de ~20 saltos entre objetos
+  Python, y no hay un objeto nodo por clave.
+- insert usa insort dentro del bloque; si el bloque supera 2 * load claves
+  se parte en dos.
+- delete quita una clave de su bloque; un bloque que queda vacío se elimina.
+- Las claves duplicadas se guardan, como en SkipList y AVLTree.
+- maxes y chunks se publican juntos en una sola tupla (index), así un
+  lector que toma index ve siempre un par coherente aunque otro hilo parta
+  un bloque (la versión con lock de benchmark_concurrente_8_hilos.py busca
+  sin lock).
+"""
+
+from bisect import bisect_left, insort
+
+
+class BlockedSortedList:
+    def __init__(self, load=1000):
+        self.load = load
+        self.index = ([], [])   # (maxes, chunks)
+        self.size = 0
+
+    @classmethod
+    def from_sorted(cls, iterable, load=1000):
+        """Carga masiva O(N) desde claves en orden no decreciente."""
+        keys = list(iterable)
+        for i in range(1, len(keys)):
+            if keys[i] < keys[i - 1]:
+                raise ValueError("from_sorted requiere claves en orden no decreciente")
+        bl = cls(load)
+        chunks = [keys[i:i + load] for i in range(0, len(keys), load)]
+        bl.index = ([c[-1] for c in chunks], chunks)
+        bl.size = len(keys)
+        return bl
+
+    def __len__(self):
+        return self.size
+
+    def insert(self, key):
+        maxes, chunks = self.index
+        if not chunks:
+            self.index = ([key], [[key]])
+            self.size = 1
+            return
+
+        i = bisect_left(maxes, key)
+        if i == len(maxes):
+            i -= 1
+        chunk = chunks[i]
+        insort(chunk, key)
+        maxes[i] = chunk[-1]
+        self.size += 1
+
+        if len(chunk) > 2 * self.load:
+            # índice nuevo en lugar de modificarlo: los lectores nunca ven maxes y chunks desalineados
+            left, right = chunk[:self.load], chunk[self.load:]
+            self.index = (maxes[:i] + [left[-1], right[-1]] + maxes[i + 1:],
+                          chunks[:i] + [left, right] + chunks[i + 1:])
+
+    def delete(self, key):
+        """Borra una aparición de key; devuelve True si estaba. Los bloques vacíos se eliminan."""
+        maxes, chunks = self.index
+        i = bisect_left(maxes, key)
+        if i == len(maxes):
+            return False
+        chunk = chunks[i]
+        j = bisect_left(chunk, key)
+        if chunk[j] != key:
+            return False
+        # bloque nuevo en lugar de del: un lector sin lock que ya tomó el bloque
+        # no lo ve encogerse entre su bisect y el acceso chunk[j]
+        chunk = chunk[:j] + chunk[j + 1:]
+        self.size -= 1
+        if chunk:
+            chunks[i] = chunk
+            maxes[i] = chunk[-1]
+        else:
+            self.index = (maxes[:i] + maxes[i + 1:], chunks[:i] + chunks[i + 1:])
+        return True
+
+    def search(self, key) -> bool:
+        maxes, chunks = self.index
+        i = bisect_left(maxes, key)
+        if i == len(maxes):
+            return False
+        chunk = chunks[i]
+        j = bisect_left(chunk, key)
+        return j < len(chunk) and chunk[j] == key
+
+    def search_many(self, keys):
+        return [self.search(k) for k in keys]
+
+    def range(self, lo, hi):
+        """Genera en orden las claves en [lo, hi)."""
+        maxes, chunks = self.index
+        i = bisect_left(maxes, lo)
+        if i == len(maxes):
+            return
+        j = bisect_left(chunks[i], lo)
+        while i < len(chunks):
+            chunk = chunks[i]
+            while j < len(chunk):
+                if chunk[j] >= hi:
+                    return
+                yield chunk[j]
+                j += 1
+            i += 1
+            j = 0
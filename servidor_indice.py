@@ -0,0 +1,325 @@
+"""
+Servidor asyncio que expone una SkipList o un AVL por un socket local (Unix
+o TCP en loopback), para usar el índice como sidecar de otro proceso.
+
+Protocolo binario (little endian):
+- Petición: REQUEST (id u32, operación u8, n u32) seguida de n claves int64.
+- Respuesta: RESPONSE (id u32, estado u8, n u32) seguida de:
+    insert          -> nada (n = claves insertadas)
+    search, search_many, delete -> n bytes 0/1
+    range(lo, hi)   -> n claves int64 en [lo, hi)
+    stats           -> n contadores int64 (ver STATS_FIELDS)
+    error           -> n bytes de mensaje UTF-8
+
+Agrupación de peticiones: cada conexión lee todo lo que llegó (un cliente
+puede enviar muchas peticiones sin esperar respuesta) y deja las peticiones
+completas en una cola común. Una sola tarea las ejecuta por lotes, en orden
+de llegada; las búsquedas consecutivas del lote, de cualquier conexión, se
+fusionan en una sola llamada a search_many. Todo corre en el hilo del event
+loop, así que la estructura no necesita locks.
+
+Uso:
+    python servidor_indice.py --structure skiplist --unix /tmp/indice.sock --preload 100000
+    python servidor_indice.py --structure avl --port 7070
+
+carga_servidor.py es el generador de carga que mide throughput y latencias.
+"""
+
+import argparse
+import asyncio
+import os
+import struct
+from array import array
+
+from avl_core import AVLTree
+from lista_bloques import BlockedSortedList
+from skiplist_core import SkipList
+
+REQUEST = struct.Struct("<IBI")   # id, operación, n claves
+RESPONSE = struct.Struct("<IBI")  # id, estado, n
+
+OP_INSERT = 1
+OP_SEARCH = 2
+OP_SEARCH_MANY = 3
+OP_RANGE = 4
+OP_DELETE = 5
+OP_STATS = 6
+OPERATION_NAMES = {OP_INSERT: "insert", OP_SEARCH: "search", OP_SEARCH_MANY: "search_many",
+                   OP_RANGE: "range", OP_DELETE: "delete", OP_STATS: "stats"}
+READ_OPS = (OP_SEARCH, OP_SEARCH_MANY)
+
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+MAX_KEYS = 1 << 20  # claves por petición; más que esto se considera un cliente roto
+STATS_FIELDS = ("requests", "batches", "search_calls", "keys_searched")
+
+STRUCTURES = {
+    "skiplist": SkipList,
+    "avl": AVLTree,
+    "blocked-list": BlockedSortedList,
+}
+
+
+def build_structure(name, preload=0):
+    """Crea la estructura y, si preload > 0, la carga con 1..preload en O(N)."""
+    if name not in STRUCTURES:
+        raise ValueError(f"estructura desconocida: {name!r}")
+    if preload:
+        return STRUCTURES[name].from_sorted(range(1, preload + 1))
+    return STRUCTURES[name]()
+
+
+class IndexServer:
+    def __init__(self, structure):
+        self.structure = structure
+        self.pending = []          # (writer, id, operación, claves) en orden de llegada
+        self.wakeup = asyncio.Event()
+        self.stats = dict.fromkeys(STATS_FIELDS, 0)
+        self._batcher = None
+
+    async def start_unix(self, path):
+        if os.path.exists(path):
+            os.remove(path)
+        self._batcher = asyncio.create_task(self._run_batches())
+        return await asyncio.start_unix_server(self._handle, path=path)
+
+    async def start_tcp(self, host="127.0.0.1", port=7070):
+        self._batcher = asyncio.create_task(self._run_batches())
+        return await asyncio.start_server(self._handle, host, port)
+
+    async def _handle(self, reader, writer):
+        buffer = bytearray()
+        try:
+            while True:
+                data = await reader.read(1 << 16)
+                if not data:
+                    break
+                buffer += data
+                offset = 0
+                # todas las peticiones completas que llegaron juntas (pipelining)
+                while len(buffer) - offset >= REQUEST.size:
+                    req_id, op, count = REQUEST.unpack_from(buffer, offset)
+                    if count > MAX_KEYS:
+                        raise ValueError(f"petición con {count:,} claves (máximo {MAX_KEYS:,})")
+                    start = offset + REQUEST.size
+                    end = start + 8 * count
+                    if len(buffer) < end:
+                        break
+                    self.pending.append((writer, req_id, op, array('q', buffer[start:end])))
+                    offset = end
+                del buffer[:offset]
+                self.wakeup.set()
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _run_batches(self):
+        while True:
+            await self.wakeup.wait()
+            self.wakeup.clear()
+            # dejar que las demás conexiones con datos listos se sumen al lote
+            await asyncio.sleep(0)
+            batch, self.pending = self.pending, []
+            if not batch:
+                continue
+            self.stats["batches"] += 1
+            self.stats["requests"] += len(batch)
+            for writer in self._execute(batch):
+                if not writer.is_closing():
+                    try:
+                        await writer.drain()
+                    except ConnectionError:
+                        pass
+
+    def _execute(self, batch):
+        """Ejecuta el lote en orden y devuelve los writers que recibieron respuestas."""
+        touched = set()
+        i = 0
+        while i < len(batch):
+            if batch[i][2] in READ_OPS:
+                # búsquedas consecutivas: una sola llamada a search_many
+                j = i
+                keys = []
+                while j < len(batch) and batch[j][2] in READ_OPS:
+                    keys.extend(batch[j][3])
+                    j += 1
+                try:
+                    found = self._search_many(keys)
+                except Exception as e:
+                    # sin resultados: todas las peticiones del tramo reciben el error
+                    message = str(e).encode()
+                    for writer, req_id, _, _ in batch[i:j]:
+                        self._reply(writer, req_id, STATUS_ERROR, len(message), message)
+                        touched.add(writer)
+                    i = j
+                    continue
+                pos = 0
+                for writer, req_id, _, req_keys in batch[i:j]:
+                    part = found[pos:pos + len(req_keys)]
+                    pos += len(req_keys)
+                    self._reply(writer, req_id, STATUS_OK, len(part), bytes(part))
+                    touched.add(writer)
+                i = j
+                continue
+
+            writer, req_id, op, keys = batch[i]
+            try:
+                count, payload = self._apply(op, keys)
+                self._reply(writer, req_id, STATUS_OK, count, payload)
+            except Exception as e:
+                # un error de la estructura no debe tumbar la tarea de lotes
+                message = str(e).encode()
+                self._reply(writer, req_id, STATUS_ERROR, len(message), message)
+            touched.add(writer)
+            i += 1
+        return touched
+
+    def _search_many(self, keys):
+        self.stats["search_calls"] += 1
+        self.stats["keys_searched"] += len(keys)
+        search_many = getattr(self.structure, "search_many", None)
+        if search_many is not None:
+            return search_many(keys)
+        return [self.structure.search(k) for k in keys]
+
+    def _apply(self, op, keys):
+        """Ejecuta una operación que no es búsqueda; devuelve (n, payload)."""
+        structure = self.structure
+        if op == OP_INSERT:
+            for key in keys:
+                structure.insert(key)
+            return len(keys), b""
+        if op == OP_DELETE:
+            found = bytes(bool(structure.delete(key)) for key in keys)
+            return len(found), found
+        if op == OP_RANGE:
+            if len(keys) != 2:
+                raise ValueError("range necesita exactamente dos claves: lo y hi")
+            result = array('q', structure.range(keys[0], keys[1]))
+            return len(result), result.tobytes()
+        if op == OP_STATS:
+            values = array('q', (self.stats[f] for f in STATS_FIELDS))
+            return len(values), values.tobytes()
+        raise ValueError(f"operación desconocida: {op}")
+
+    def _reply(self, writer, req_id, status, count, payload):
+        if not writer.is_closing():
+            writer.write(RESPONSE.pack(req_id, status, count) + payload)
+
+
+class ServerError(Exception):
+    """Error devuelto por el servidor (estado STATUS_ERROR)."""
+
+
+class IndexClient:
+    """
+    Cliente asyncio con pipelining: cada llamada envía su petición sin esperar
+    a las anteriores y una tarea lectora empareja las respuestas por id.
+    """
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.next_id = 0
+        self.waiting = {}   # id -> (operación, future)
+        self._reader_task = asyncio.create_task(self._read_responses())
+
+    @classmethod
+    async def connect(cls, path=None, host="127.0.0.1", port=7070):
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def _request(self, op, keys=()):
+        if self._reader_task.done():
+            # nadie resolvería el future: la tarea lectora ya terminó
+            raise ConnectionError("conexión cerrada")
+        req_id = self.next_id
+        self.next_id = (self.next_id + 1) & 0xFFFFFFFF
+        future = asyncio.get_running_loop().create_future()
+        self.waiting[req_id] = (op, future)
+        self.writer.write(REQUEST.pack(req_id, op, len(keys)) + array('q', keys).tobytes())
+        await self.writer.drain()
+        return await future
+
+    async def _read_responses(self):
+        try:
+            while True:
+                header = await self.reader.readexactly(RESPONSE.size)
+                req_id, status, count = RESPONSE.unpack(header)
+                op, future = self.waiting.pop(req_id)
+                if status != STATUS_OK:
+                    message = await self.reader.readexactly(count)
+                    future.set_exception(ServerError(message.decode()))
+                elif op in (OP_RANGE, OP_STATS):
+                    future.set_result(array('q', await self.reader.readexactly(8 * count)).tolist())
+                elif op == OP_INSERT:
+                    future.set_result(count)
+                else:
+                    future.set_result([b != 0 for b in await self.reader.readexactly(count)])
+        except (asyncio.IncompleteReadError, ConnectionError) as e:
+            for _, future in self.waiting.values():
+                if not future.done():
+                    future.set_exception(ConnectionError(f"conexión cerrada: {e}"))
+            self.waiting.clear()
+
+    async def insert(self, *keys):
+        return await self._request(OP_INSERT, keys)
+
+    async def search(self, key):
+        return (await self._request(OP_SEARCH, (key,)))[0]
+
+    async def search_many(self, keys):
+        return await self._request(OP_SEARCH_MANY, list(keys))
+
+    async def delete(self, key):
+        return (await self._request(OP_DELETE, (key,)))[0]
+
+    async def range(self, lo, hi):
+        return await self._request(OP_RANGE, (lo, hi))
+
+    async def stats(self):
+        return dict(zip(STATS_FIELDS, await self._request(OP_STATS)))
+
+    async def close(self):
+        self.writer.close()
+        await self._reader_task
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+async def serve(structure="skiplist", path=None, host="127.0.0.1", port=7070, preload=0):
+    server = IndexServer(build_structure(structure, preload))
+    if path is not None:
+        listener = await server.start_unix(path)
+        where = path
+    else:
+        listener = await server.start_tcp(host, port)
+        where = f"{host}:{port}"
+    print(f"Sirviendo {structure} ({preload:,} claves precargadas) en {where}", flush=True)
+    async with listener:
+        await listener.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Servidor del índice por socket local.")
+    parser.add_argument("--structure", choices=tuple(STRUCTURES), default="skiplist")
+    parser.add_argument("--unix", help="ruta del socket Unix (si no se da, TCP en loopback)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7070)
+    parser.add_argument("--preload", type=int, default=0, help="cargar las claves 1..N al arrancar")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.structure, args.unix, args.host, args.port, args.preload))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -2,69 +2,17 @@
 Benchmark realista de SkipList (1 millón de inserciones).
 - Pide al usuario el número a buscar (entero).
 - Mide tiempo de inserción total y tiempo de búsqueda con alta resolución.
-- Implementación probabilística estándar de Skip List.
+- Implementación probabilística estándar de Skip List (skiplist_core.py).
+- Reporta también el tiempo de carga masiva (SkipList.from_sorted).
 """
 
-import random
 import time
 
-class Node:
-    def __init__(self, value, level):
-        self.value = value
-        self.forward = [None] * (level + 1)
+from skiplist_core import SkipList
 
-class SkipList:
-    def __init__(self, max_level=20, p=0.5):
-        """
-        max_level: altura máxima permitida (recomendado ~ log2(N))
-        p: probabilidad para random_level (0.5 es estándar)
-        """
-        self.max_level = max_level
-        self.p = p
-        self.header = Node(-1, max_level)
-        self.level = 0
 
-    def random_level(self):
-        lvl = 0
-        while random.random() < self.p and lvl < self.max_level:
-            lvl += 1
-        return lvl
-
-    def insert(self, value):
-        update = [None] * (self.max_level + 1)
-        current = self.header
-
-        # buscar posición (predecesores) desde el nivel actual máximo
-        for i in range(self.level, -1, -1):
-            while current.forward[i] and current.forward[i].value < value:
-                current = current.forward[i]
-            update[i] = current
-
-        # nivel aleatorio para el nuevo nodo
-        new_level = self.random_level()
-
-        if new_level > self.level:
-            for i in range(self.level + 1, new_level + 1):
-                update[i] = self.header
-            self.level = new_level
-
-        new_node = Node(value, new_level)
-        for i in range(new_level + 1):
-            new_node.forward[i] = update[i].forward[i]
-            update[i].forward[i] = new_node
-
-    def search(self, value) -> bool:
-        current = self.header
-        for i in range(self.level, -1, -1):
-            while current.forward[i] and current.forward[i].value < value:
-                current = current.forward[i]
-        current = current.forward[0]
-        return (current is not None and current.value == value)
-
-
-def benchmark_insert_and_search():
-    N = 1_000_000
-    print("\n=== BENCHMARK SKIP LIST (1,000,000 inserciones) ===")
+def benchmark_insert_and_search(bulk=True, N=1_000_000, interactive=True):
+    print(f"\n=== BENCHMARK SKIP LIST ({N:,} inserciones) ===")
     print("Construyendo skip list y realizando inserciones. Esto puede tardar algunos segundos...")
 
     sl = SkipList(max_level=20, p=0.5)
@@ -78,8 +26,17 @@ def benchmark_insert_and_search():
     insert_time = t1 - t0
     print(f"Tiempo total de inserción de {N:,} elementos: {insert_time:.4f} s")
 
+    if bulk:
+        # Carga masiva desde la secuencia ya ordenada, una sola pasada
+        t0 = time.perf_counter()
+        SkipList.from_sorted(range(1, N + 1), max_level=20, p=0.5)
+        t1 = time.perf_counter()
+        bulk_time = t1 - t0
+        print(f"Tiempo de carga masiva (from_sorted) de {N:,} elementos: {bulk_time:.4f} s "
+              f"({insert_time / bulk_time:.1f}x más rápido)")
+
     # Pedir al usuario el valor a buscar
-    while True:
+    while interactive:
         s = input(f"\nIntroduce el entero a buscar (1..{N}) o 'exit' para terminar: ").strip()
         if s.lower() in ("exit", "quit"):
             print("Saliendo del benchmark.")
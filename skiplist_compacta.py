@@ -0,0 +1,153 @@
+"""
+Skip List compacta (structure-of-arrays) con identificadores enteros de nodo.
+
+- keys[id]    : clave del nodo id (array('q'), enteros de 64 bits)
+- offsets[id] : posición en links donde empiezan los punteros del nodo id
+- links[...]  : punteros forward de todos los nodos, uno tras otro
+                (nivel i del nodo id -> links[offsets[id] + i]); NIL = -1
+- El nodo 0 es la cabecera y reserva max_level + 1 punteros.
+- Los buffers se preasignan y crecen geométricamente (x2).
+
+Misma API que skiplist_core.SkipList: insert(key) y search(key) -> bool.
+Ejecutar este archivo compara bytes/clave y ops/s contra SkipList.
+"""
+
+import random
+import time
+import tracemalloc
+from array import array
+
+from skiplist_core import SkipList, level_sampler
+
+NIL = -1
+
+
+class CompactSkipList:
+    def __init__(self, max_level=20, p=0.5, capacity=1024):
+        self.max_level = max_level
+        self.p = p
+        self.level = 0
+
+        capacity = max(capacity, 1)
+        self.keys = array('q', bytes(8 * capacity))
+        self.offsets = array('q', bytes(8 * capacity))
+        self.links = array('q', [NIL]) * (max_level + 1)
+        self.links.frombytes(bytes(8 * capacity))
+
+        # nodo 0 = cabecera
+        self.keys[0] = -1
+        self.offsets[0] = 0
+        self.size = 1                          # nodos usados (incluye cabecera)
+        self.links_used = max_level + 1        # punteros usados en links
+        self.level_shift, self.level_bits = level_sampler(p, max_level)
+
+    def __len__(self):
+        return self.size - 1
+
+    # mismo sorteo que SkipList: una palabra aleatoria con p = 1/2 o 1/4
+    random_level = SkipList.random_level
+
+    def _grow(self, extra_links):
+        # crecimiento geométrico de los buffers de nodos y de punteros
+        if self.size == len(self.keys):
+            n = len(self.keys)
+            self.keys.frombytes(bytes(8 * n))
+            self.offsets.frombytes(bytes(8 * n))
+        while self.links_used + extra_links > len(self.links):
+            self.links.frombytes(bytes(8 * len(self.links)))
+
+    def insert(self, key):
+        keys = self.keys
+        offsets = self.offsets
+        links = self.links
+        update = [0] * (self.max_level + 1)
+        current = 0
+
+        # buscar predecesores desde el nivel actual máximo
+        for i in range(self.level, -1, -1):
+            nxt = links[offsets[current] + i]
+            while nxt != NIL and keys[nxt] < key:
+                current = nxt
+                nxt = links[offsets[current] + i]
+            update[i] = current
+
+        new_level = self.random_level()
+        if new_level > self.level:
+            # update[i] ya vale 0 (cabecera) para los niveles nuevos
+            self.level = new_level
+
+        if self.size == len(keys) or self.links_used + new_level + 1 > len(links):
+            self._grow(new_level + 1)
+            keys = self.keys
+            links = self.links
+            offsets = self.offsets
+
+        node = self.size
+        base = self.links_used
+        keys[node] = key
+        offsets[node] = base
+        self.size += 1
+        self.links_used += new_level + 1
+
+        for i in range(new_level + 1):
+            pos = offsets[update[i]] + i
+            links[base + i] = links[pos]
+            links[pos] = node
+
+    def search(self, key) -> bool:
+        keys = self.keys
+        offsets = self.offsets
+        links = self.links
+        current = 0
+        for i in range(self.level, -1, -1):
+            nxt = links[offsets[current] + i]
+            while nxt != NIL and keys[nxt] < key:
+                current = nxt
+                nxt = links[offsets[current] + i]
+        nxt = links[offsets[current]]
+        return nxt != NIL and keys[nxt] == key
+
+
+def _measure_bytes(factory, N):
+    """Bytes retenidos por la estructura tras insertar 1..N (tracemalloc)."""
+    tracemalloc.start()
+    structure = factory()
+    for i in range(1, N + 1):
+        structure.insert(i)
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del structure
+    return used
+
+
+def benchmark_compacta(N=200_000, Q=100_000):
+    print(f"\n=== BENCHMARK SKIP LIST COMPACTA vs SKIP LIST ({N:,} claves) ===")
+    queries = [random.randint(1, N) for _ in range(Q)]
+
+    results = []
+    for name, factory in (("SkipList", SkipList), ("CompactSkipList", CompactSkipList)):
+        # tiempos sin tracemalloc activo (su coste distorsiona las inserciones)
+        structure = factory()
+        t0 = time.perf_counter()
+        for i in range(1, N + 1):
+            structure.insert(i)
+        t1 = time.perf_counter()
+        insert_time = t1 - t0
+
+        t0 = time.perf_counter()
+        for q in queries:
+            structure.search(q)
+        t1 = time.perf_counter()
+        search_time = t1 - t0
+        del structure
+
+        used = _measure_bytes(factory, N)
+        results.append((name, used / N, N / insert_time, Q / search_time))
+
+    print(f"{'Estructura':<16} {'bytes/clave':>12} {'insert ops/s':>14} {'search ops/s':>14}")
+    for name, bpk, ins, sea in results:
+        print(f"{name:<16} {bpk:>12.1f} {ins:>14,.0f} {sea:>14,.0f}")
+
+
+if __name__ == "__main__":
+    benchmark_compacta()
@@ -0,0 +1,580 @@
+"""
+Núcleo Skip List compartido por los benchmarks.
+
+- Implementación probabilística estándar (p = 0.5, hasta 20 niveles).
+- random_level saca el nivel de una sola palabra aleatoria cuando p es 1/2
+  o 1/4: con k bits por nivel, el nivel es el número de ceros a la
+  izquierda de getrandbits(k * max_level) dividido por k.
+- SkipList.tuned(expected_size) elige p y max_level según el tamaño
+  esperado y sube max_level a medida que la lista crece (ver
+  benchmark_parametros.py).
+- from_sorted construye la estructura en una sola pasada lineal a partir
+  de claves ya ordenadas, sin búsquedas desde la cabecera.
+- search_many responde un lote de búsquedas en un único recorrido ordenado.
+- range(lo, hi) busca lo con el descenso habitual y luego avanza por
+  forward[0]; floor, ceiling y successor usan el mismo descenso.
+- save/load guardan y recargan una instantánea binaria (instantaneas.py).
+- delete(key) desenlaza una aparición de la clave en todos sus niveles.
+- IndexableSkipList guarda el ancho (width) de cada enlace por nivel y
+  responde rank, select y count_range en O(log n) esperado.
+- La clase de nodo es configurable (node_class); SlottedSkipList usa nodos
+  con __slots__ (ver benchmark_memoria.py).
+- cursor() devuelve un SkipListCursor (finger search): recuerda el camino de
+  predecesores de la última operación y la siguiente búsqueda o inserción
+  parte de ahí en O(log d), con d la distancia entre claves consecutivas.
+"""
+
+import math
+import random
+from random import getrandbits
+
+# Por debajo de este tamaño la lista entra en caché y p = 1/4 busca igual de
+# rápido que p = 1/2 con menos punteros; por encima p = 1/2 da menos saltos.
+SMALL_LIST = 4096
+MIN_LEVEL = 4
+
+# Bits por nivel para sacar el nivel de una sola palabra aleatoria. Con
+# p = 1/8 la palabra pasa de 60 bits y el bucle, que casi siempre termina en
+# la primera vuelta, resulta más rápido; esa p y las que no son potencia de
+# 1/2 usan un random() por nivel.
+WORD_LEVEL_SHIFTS = {0.5: 1, 0.25: 2}
+
+
+def level_sampler(p, max_level):
+    """(level_shift, level_bits) para random_level; (0, 0) indica el bucle."""
+    shift = WORD_LEVEL_SHIFTS.get(p, 0)
+    return shift, shift * max_level
+
+
+def level_for(n, p):
+    """Nivel máximo L(n) = log_{1/p} n de Pugh: con más niveles casi no habría nodos arriba."""
+    lvl = MIN_LEVEL
+    while (1 / p) ** lvl < n:
+        lvl += 1
+    return lvl
+
+
+def tuned_parameters(expected_size=None, prefer="speed"):
+    """
+    (p, max_level) para unas expected_size claves; prefer="memory" usa siempre
+    p = 1/4. Sin tamaño esperado se asume que la lista puede crecer: p = 1/2
+    y MIN_LEVEL niveles.
+    """
+    if prefer not in ("speed", "memory"):
+        raise ValueError(f"preferencia desconocida: {prefer!r}")
+    small = expected_size is not None and expected_size <= SMALL_LIST
+    p = 0.25 if prefer == "memory" or small else 0.5
+    return p, level_for(expected_size or 0, p)
+
+
+class Node:
+    def __init__(self, key, level):
+        self.key = key
+        self.forward = [None] * (level + 1)
+
+
+class SlottedNode:
+    """Mismo nodo sin __dict__ por instancia."""
+    __slots__ = ("key", "forward")
+
+    def __init__(self, key, level):
+        self.key = key
+        self.forward = [None] * (level + 1)
+
+
+class SkipList:
+    node_class = Node
+
+    def __init__(self, max_level=20, p=0.5, auto_grow=False):
+        """
+        max_level: altura máxima permitida (recomendado ~ log2(N))
+        p: probabilidad para random_level (0.5 es estándar)
+        auto_grow: subir max_level cuando el tamaño pasa de (1/p)^max_level
+        """
+        self.max_level = max_level
+        self.p = p
+        self.header = self.node_class(-1, max_level)
+        self.level = 0
+        self.size = 0
+        self.version = 0   # cambia con cada inserción; invalida los cursores
+        self.auto_grow = auto_grow
+        self._set_level_sampler()
+
+    @classmethod
+    def tuned(cls, expected_size=None, prefer="speed"):
+        """
+        Lista con p y max_level elegidos por tuned_parameters. Sin tamaño
+        esperado arranca con MIN_LEVEL niveles y crece con el tamaño observado.
+        """
+        p, max_level = tuned_parameters(expected_size, prefer)
+        return cls(max_level, p, auto_grow=True)
+
+    def __len__(self):
+        return self.size
+
+    def _set_level_sampler(self):
+        self.level_shift, self.level_bits = level_sampler(self.p, self.max_level)
+        self.grow_at = int((1 / self.p) ** self.max_level) if self.auto_grow else math.inf
+
+    def _grow(self):
+        """Agrega un nivel vacío a la cabecera (auto_grow)."""
+        self.max_level += 1
+        self.header.forward.append(None)
+        self._set_level_sampler()
+
+    @classmethod
+    def from_sorted(cls, iterable, max_level=20, p=0.5, deterministic=False):
+        """
+        Carga masiva O(N) desde claves en orden no decreciente.
+
+        Se mantiene el último nodo de cada nivel (tails) y cada clave nueva se
+        engancha al final. Con deterministic=True la altura del i-ésimo nodo es
+        el número de veces que i es divisible por round(1/p) (skip list perfecta);
+        si no, se usa random_level como en insert.
+        """
+        sl = cls(max_level, p)
+        sl._link_sorted(sl._sorted_levels(iterable, deterministic))
+        return sl
+
+    def _link_sorted(self, pairs):
+        """Enlaza al final de la lista vacía los pares (clave, nivel) ya ordenados."""
+        tails = [self.header] * (self.max_level + 1)
+        node_class = self.node_class
+        count = 0
+        for key, lvl in pairs:
+            node = node_class(key, lvl)
+            for i in range(lvl + 1):
+                tails[i].forward[i] = node
+                tails[i] = node
+            if lvl > self.level:
+                self.level = lvl
+            count += 1
+        self.size = count
+
+    def _sorted_levels(self, iterable, deterministic):
+        """Genera (clave, nivel) para from_sorted validando el orden."""
+        step = max(2, round(1 / self.p))
+        count = 0
+        prev = None
+
+        for key in iterable:
+            if count and key < prev:
+                raise ValueError("from_sorted requiere claves en orden no decreciente")
+            count += 1
+            prev = key
+
+            if deterministic:
+                lvl = 0
+                c = count
+                while c % step == 0 and lvl < self.max_level:
+                    c //= step
+                    lvl += 1
+            else:
+                lvl = self.random_level()
+            yield key, lvl
+
+    def save(self, path):
+        """Guarda una instantánea binaria (ver instantaneas.py)."""
+        from instantaneas import save_skiplist
+        save_skiplist(self, path)
+
+    @classmethod
+    def load(cls, path):
+        """Reconstruye en tiempo lineal desde una instantánea mapeada en memoria."""
+        from instantaneas import load_skiplist
+        return load_skiplist(path, cls)
+
+    def random_level(self):
+        bits = self.level_bits
+        if bits:
+            # P(al menos k * L ceros a la izquierda) = 2^(-k * L) = p^L, acotado por max_level
+            return (bits - getrandbits(bits).bit_length()) // self.level_shift
+        # otras p (1/8, 1/e, ...): un random() por nivel
+        lvl = 0
+        while random.random() < self.p and lvl < self.max_level:
+            lvl += 1
+        return lvl
+
+    def insert(self, key):
+        update = [None] * (self.max_level + 1)
+        current = self.header
+
+        # buscar posición (predecesores) desde el nivel actual máximo
+        for i in range(self.level, -1, -1):
+            while current.forward[i] and current.forward[i].key < key:
+                current = current.forward[i]
+            update[i] = current
+
+        self._link_new(update, key)
+
+    def _link_new(self, update, key):
+        """Crea un nodo con key detrás de los predecesores update[i] y lo devuelve."""
+        if self.size >= self.grow_at:
+            self._grow()
+            update.append(self.header)  # el nivel nuevo está vacío
+        # nivel aleatorio para el nuevo nodo
+        new_level = self.random_level()
+
+        if new_level > self.level:
+            for i in range(self.level + 1, new_level + 1):
+                update[i] = self.header
+            self.level = new_level
+
+        new_node = self.node_class(key, new_level)
+        for i in range(new_level + 1):
+            new_node.forward[i] = update[i].forward[i]
+            update[i].forward[i] = new_node
+        self.size += 1
+        self.version += 1
+        return new_node
+
+    def delete(self, key):
+        """Borra una aparición de key; devuelve True si estaba."""
+        update = [None] * (self.max_level + 1)
+        current = self.header
+        for i in range(self.level, -1, -1):
+            while current.forward[i] and current.forward[i].key < key:
+                current = current.forward[i]
+            update[i] = current
+
+        node = current.forward[0]
+        if node is None or node.key != key:
+            return False
+        for i in range(len(node.forward)):
+            update[i].forward[i] = node.forward[i]
+        # bajar el nivel si los niveles superiores quedaron vacíos
+        while self.level > 0 and self.header.forward[self.level] is None:
+            self.level -= 1
+        self.size -= 1
+        self.version += 1
+        return True
+
+    def cursor(self):
+        return SkipListCursor(self)
+
+    def search(self, key) -> bool:
+        current = self.header
+        for i in range(self.level, -1, -1):
+            while current.forward[i] and current.forward[i].key < key:
+                current = current.forward[i]
+        current = current.forward[0]
+        return (current is not None and current.key == key)
+
+    def _last_before(self, key, inclusive=False):
+        """Último nodo con clave < key (<= key si inclusive); la cabecera si no hay."""
+        current = self.header
+        for i in range(self.level, -1, -1):
+            nxt = current.forward[i]
+            while nxt and (nxt.key <= key if inclusive else nxt.key < key):
+                current = nxt
+                nxt = current.forward[i]
+        return current
+
+    def range(self, lo, hi):
+        """Genera en orden las claves en [lo, hi)."""
+        node = self._last_before(lo).forward[0]
+        while node is not None and node.key < hi:
+            yield node.key
+            node = node.forward[0]
+
+    def floor(self, key):
+        """Mayor clave <= key, o None."""
+        node = self._last_before(key, inclusive=True)
+        return None if node is self.header else node.key
+
+    def ceiling(self, key):
+        """Menor clave >= key, o None."""
+        node = self._last_before(key).forward[0]
+        return None if node is None else node.key
+
+    def successor(self, key):
+        """Menor clave estrictamente mayor que key, o None."""
+        node = self._last_before(key, inclusive=True).forward[0]
+        return None if node is None else node.key
+
+    def search_many(self, keys):
+        """
+        Busca un lote de claves y devuelve una lista de bool en el orden original.
+
+        Las consultas se recorren ordenadas; los predecesores por nivel de la
+        consulta anterior (update) sirven de punto de partida para la siguiente,
+        así que cada nivel avanza siempre hacia la derecha y nunca se reinicia
+        desde la cabecera.
+        """
+        keys = list(keys)
+        n = len(keys)
+        result = [False] * n
+        if n == 0:
+            return result
+
+        order = sorted(range(n), key=keys.__getitem__)
+        header = self.header
+        update = [header] * (self.level + 1)
+        last_key = None
+        last_found = False
+
+        for idx in order:
+            key = keys[idx]
+            if key == last_key:
+                result[idx] = last_found
+                continue
+
+            current = header
+            for i in range(self.level, -1, -1):
+                # el predecesor de la consulta anterior en este nivel puede estar más adelante
+                cand = update[i]
+                if cand is not header and (current is header or cand.key > current.key):
+                    current = cand
+                while current.forward[i] and current.forward[i].key < key:
+                    current = current.forward[i]
+                update[i] = current
+
+            nxt = current.forward[0]
+            last_key = key
+            last_found = nxt is not None and nxt.key == key
+            result[idx] = last_found
+
+        return result
+
+
+class SkipListCursor:
+    """
+    Búsqueda por dedo (finger search) sobre una SkipList.
+
+    fingers[i] es el último nodo del nivel i antes de la posición de la última
+    operación. Hacia adelante se sube desde el nivel 0 mientras el sucesor del
+    dedo del nivel superior siga siendo menor que la clave; hacia atrás, hasta
+    un dedo con clave menor (o la cabecera). Desde ahí se baja como en search.
+    Con claves a distancia d solo se suben O(log d) niveles.
+
+    Si la lista cambia por fuera del cursor (insert directo u otro cursor),
+    SkipList.version cambia y el cursor vuelve a empezar desde la cabecera.
+    """
+
+    def __init__(self, sl):
+        self.sl = sl
+        self.reset()
+
+    def reset(self):
+        self.fingers = [self.sl.header] * (self.sl.max_level + 1)
+        self.version = self.sl.version
+
+    def _seek(self, key):
+        """Deja en fingers los predecesores de key y devuelve el del nivel 0."""
+        sl = self.sl
+        if self.version != sl.version:
+            self.reset()
+        header = sl.header
+        top = sl.level
+        fingers = self.fingers
+
+        lvl = 0
+        first = fingers[0]
+        if first is not header and first.key >= key:
+            # hacia atrás: subir hasta un dedo con clave menor (los de arriba están más a la izquierda)
+            while lvl < top and fingers[lvl] is not header and fingers[lvl].key >= key:
+                lvl += 1
+        else:
+            # hacia adelante: subir mientras el sucesor del dedo superior siga siendo menor
+            while lvl < top:
+                nxt = fingers[lvl + 1].forward[lvl + 1]
+                if nxt is None or nxt.key >= key:
+                    break
+                lvl += 1
+
+        current = fingers[lvl]
+        if current is not header and current.key >= key:
+            current = header
+        for i in range(lvl, -1, -1):
+            while current.forward[i] and current.forward[i].key < key:
+                current = current.forward[i]
+            fingers[i] = current
+        return current
+
+    def search(self, key) -> bool:
+        current = self._seek(key).forward[0]
+        return current is not None and current.key == key
+
+    def insert(self, key):
+        self._seek(key)
+        new_node = self.sl._link_new(self.fingers, key)
+        self.version = self.sl.version
+        # el nuevo nodo queda como último nodo antes de la posición en sus niveles
+        for i in range(len(new_node.forward)):
+            self.fingers[i] = new_node
+
+
+class SlottedSkipList(SkipList):
+    node_class = SlottedNode
+
+
+class IndexedNode:
+    def __init__(self, key, level):
+        self.key = key
+        self.forward = [None] * (level + 1)
+        # width[i]: pasos en el nivel 0 que salta forward[i] (hasta el final si es None)
+        self.width = [1] * (level + 1)
+
+
+class IndexableSkipList(SkipList):
+    """
+    Skip list indexable: la posición de un nodo es la suma de los anchos de
+    los enlaces recorridos desde la cabecera (posición -1). Un enlace a None
+    mide la distancia hasta el final de la lista.
+    """
+
+    node_class = IndexedNode
+
+    def _grow(self):
+        super()._grow()
+        self.header.width.append(self.size + 1)  # enlace a None: hasta el final
+
+    def _link_new(self, update, key):
+        """
+        Como SkipList._link_new, manteniendo los anchos. update no trae
+        posiciones (los dedos del cursor no las guardan): la distancia de
+        update[i] al nodo nuevo es la de update[i-1] más lo que se avanza en
+        el nivel i-1 desde update[i] hasta update[i-1].
+        """
+        if self.size >= self.grow_at:
+            self._grow()
+            update.append(self.header)
+        header = self.header
+        # por encima del nivel actual el único predecesor es la cabecera
+        for i in range(self.level + 1, self.max_level + 1):
+            update[i] = header
+
+        dist = [1] * (self.max_level + 1)  # pasos en el nivel 0 de update[i] al nodo nuevo
+        for i in range(1, self.max_level + 1):
+            node = update[i]
+            d = dist[i - 1]
+            while node is not update[i - 1]:
+                d += node.width[i - 1]
+                node = node.forward[i - 1]
+            dist[i] = d
+
+        new_level = self.random_level()
+        if new_level > self.level:
+            self.level = new_level
+
+        new_node = self.node_class(key, new_level)
+        for i in range(new_level + 1):
+            prev = update[i]
+            new_node.forward[i] = prev.forward[i]
+            prev.forward[i] = new_node
+            new_node.width[i] = prev.width[i] - dist[i] + 1
+            prev.width[i] = dist[i]
+
+        # los enlaces que pasan por encima del nuevo nodo crecen en uno
+        for i in range(new_level + 1, self.max_level + 1):
+            update[i].width[i] += 1
+        self.size += 1
+        self.version += 1
+        return new_node
+
+    def _link_sorted(self, pairs):
+        # como en SkipList._link_sorted, guardando además la posición de cada cola
+        tails = [self.header] * (self.max_level + 1)
+        tail_pos = [-1] * (self.max_level + 1)
+        pos = 0
+        for key, lvl in pairs:
+            node = self.node_class(key, lvl)
+            for i in range(lvl + 1):
+                tails[i].forward[i] = node
+                tails[i].width[i] = pos - tail_pos[i]
+                tails[i] = node
+                tail_pos[i] = pos
+            if lvl > self.level:
+                self.level = lvl
+            pos += 1
+
+        for i in range(self.max_level + 1):
+            tails[i].width[i] = pos - tail_pos[i]
+        self.size = pos
+
+    def insert(self, key):
+        if self.size >= self.grow_at:
+            self._grow()
+        update = [self.header] * (self.max_level + 1)
+        steps = [0] * (self.max_level + 1)  # posición + 1 de update[i]
+        current = self.header
+        pos = 0
+
+        for i in range(self.level, -1, -1):
+            while current.forward[i] and current.forward[i].key < key:
+                pos += current.width[i]
+                current = current.forward[i]
+            update[i] = current
+            steps[i] = pos
+
+        new_level = self.random_level()
+        if new_level > self.level:
+            self.level = new_level
+
+        # pos = índice que ocupará el nuevo nodo
+        new_node = self.node_class(key, new_level)
+        for i in range(new_level + 1):
+            prev = update[i]
+            new_node.forward[i] = prev.forward[i]
+            prev.forward[i] = new_node
+            new_node.width[i] = prev.width[i] - (pos - steps[i])
+            prev.width[i] = pos - steps[i] + 1
+
+        # los enlaces que pasan por encima del nuevo nodo crecen en uno
+        for i in range(new_level + 1, self.max_level + 1):
+            update[i].width[i] += 1
+        self.size += 1
+        self.version += 1
+
+    def delete(self, key):
+        update = [self.header] * (self.max_level + 1)
+        current = self.header
+        for i in range(self.level, -1, -1):
+            while current.forward[i] and current.forward[i].key < key:
+                current = current.forward[i]
+            update[i] = current
+
+        node = current.forward[0]
+        if node is None or node.key != key:
+            return False
+        node_level = len(node.forward) - 1
+        for i in range(node_level + 1):
+            prev = update[i]
+            prev.forward[i] = node.forward[i]
+            prev.width[i] += node.width[i] - 1
+        # los enlaces que pasaban por encima del nodo se acortan en uno
+        for i in range(node_level + 1, self.max_level + 1):
+            update[i].width[i] -= 1
+        while self.level > 0 and self.header.forward[self.level] is None:
+            self.level -= 1
+        self.size -= 1
+        self.version += 1
+        return True
+
+    def rank(self, key):
+        """Cantidad de claves estrictamente menores que key."""
+        current = self.header
+        pos = 0
+        for i in range(self.level, -1, -1):
+            while current.forward[i] and current.forward[i].key < key:
+                pos += current.width[i]
+                current = current.forward[i]
+        return pos
+
+    def select(self, k):
+        """k-ésima clave más pequeña (k empieza en 0)."""
+        if not 0 <= k < self.size:
+            raise IndexError("select fuera de rango")
+        remaining = k + 1
+        current = self.header
+        for i in range(self.level, -1, -1):
+            while current.forward[i] and current.width[i] <= remaining:
+                remaining -= current.width[i]
+                current = current.forward[i]
+        return current.key
+
+    def count_range(self, lo, hi):
+        """Cantidad de claves en [lo, hi)."""
+        if hi <= lo:
+            return 0
+        return self.rank(hi) - self.rank(lo)